@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Measure the process-level font cache on documents that share their fonts.
+
+Usage:
+    python benchmark_font_cache.py [--documents 50] [--pages 1]
+
+Writes ``--documents`` invoice-like PDFs to a temporary directory, all set
+in the same four embedded TrueType fonts (reportlab's Vera family) with the
+full Latin-1 repertoire, as one producer would write them. Each document's
+text is extracted with ``TextExtractor`` in one process, first with the
+cache disabled, then enabled. Prints seconds per document and the cache's
+statistics, and checks that the texts are the same.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_extractor import font_cache
+from pdf_extractor.text_extractor import TextExtractor
+
+FONTS = ("Vera", "VeraBd", "VeraIt", "VeraBI")
+
+
+def write_invoice(path, number, pages):
+    """Write an invoice whose lines cycle through the Vera fonts."""
+    import reportlab
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+
+    font_dir = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+    for font in FONTS:
+        pdfmetrics.registerFont(TTFont(font, os.path.join(font_dir, f"{font}.ttf")))
+    repertoire = "".join(map(chr, range(32, 127))) + "".join(map(chr, range(160, 256)))
+
+    pdf = canvas.Canvas(str(path))
+    for page in range(pages):
+        y = 780
+        for font in FONTS:
+            pdf.setFont(font, 8)
+            for start in range(0, len(repertoire), 64):
+                pdf.drawString(40, y, repertoire[start:start + 64])
+                y -= 12
+        pdf.setFont("Vera", 10)
+        pdf.drawString(40, 80, f"Invoice {number} page {page + 1}: total {number * 7.5:.2f}")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def run(pdf_paths):
+    """Extract every document's text and return (seconds per document, texts)."""
+    start = time.perf_counter()
+    texts = [TextExtractor(method="pdfplumber").extract(path) for path in pdf_paths]
+    return (time.perf_counter() - start) / len(pdf_paths), texts
+
+
+def benchmark(documents, pages):
+    """Print seconds per document without and with the font cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_paths = [
+            write_invoice(Path(tmp) / f"invoice_{i}.pdf", i, pages) for i in range(documents)
+        ]
+
+        font_cache.disable()
+        uncached, expected = run(pdf_paths)
+        cache = font_cache.enable()
+        cached, texts = run(pdf_paths)
+        font_cache.disable()
+
+    print(f"{'documents':>10} {'uncached':>9} {'cached':>9} {'speedup':>8} {'same':>5}")
+    print(
+        f"{documents:>10} {uncached:>9.4f} {cached:>9.4f} {uncached / cached:>7.2f}x "
+        f"{'yes' if texts == expected else 'no':>5}"
+    )
+    stats = cache.stats()
+    print(
+        f"Font cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+        f"{stats['entries']} font(s), ~{stats['bytes'] / 1024:.0f} KB"
+    )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--documents", type=int, default=50, help="Documents to extract")
+    parser.add_argument("--pages", type=int, default=1, help="Pages per document")
+    args = parser.parse_args()
+    benchmark(args.documents, args.pages)
+
+
+if __name__ == "__main__":
+    main()
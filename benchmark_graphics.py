@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Measure how much skipping images and vector graphics speeds up extraction.
+
+Usage:
+    python benchmark_graphics.py [PDF ...] [--drawing drawing.pdf] [--repeat 3]
+
+Text runs through ``TextExtractor(method="pdfplumber")`` without filtering
+and with ``skip_objects=TEXT_ONLY``. Tables run through
+``TableExtractor(method="pdfplumber")`` without filtering and with
+``RULINGS_ONLY``. The best of ``--repeat`` runs is reported as seconds per
+page, with a check that the filtered output matches. ``--drawing`` first
+writes a synthetic graphics-heavy PDF (3 pages with 4,000 Bezier curves, 30
+images and 60 lines of text each) and adds it to the benchmark.
+"""
+
+import argparse
+import io
+import random
+import time
+from pathlib import Path
+
+import pdfplumber
+
+from pdf_extractor.object_filter import RULINGS_ONLY, TEXT_ONLY
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+
+
+def write_drawing(path, pages=3, curves=4000, images=30, lines=60):
+    """Write a drawing-like PDF: many curves and images around a little text."""
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    rng = random.Random(1)
+    pdf = canvas.Canvas(str(path), pagesize=(1684, 1191))
+    for page in range(pages):
+        for _ in range(curves):
+            x, y = rng.uniform(0, 1600), rng.uniform(0, 1100)
+            pdf.bezier(x, y, x + 20, y + 30, x + 40, y - 10, x + 60, y + 5)
+        for _ in range(images):
+            image = io.BytesIO()
+            Image.new("RGB", (64, 64), (200, 100, 50)).save(image, "PNG")
+            image.seek(0)
+            x, y = rng.uniform(0, 1600), rng.uniform(0, 1100)
+            pdf.drawImage(ImageReader(image), x, y, 40, 40)
+        for i in range(lines):
+            pdf.drawString(50, 1150 - i * 18, f"Note {i}: beam B-{page}{i} at grid {i % 12}")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def best_of(repeat, func):
+    """Return the best time over ``repeat`` runs and the last result."""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def benchmark(pdf_paths, repeat):
+    """Time filtered and unfiltered extraction and print one line per (PDF, task)."""
+    print(
+        f"{'document':<32} {'task':<7} {'pages':>5} "
+        f"{'all s/page':>11} {'skip s/page':>12} {'same':>5}"
+    )
+
+    for pdf_path in pdf_paths:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        runs = (
+            ("text", TextExtractor, "pdfplumber", TEXT_ONLY),
+            ("tables", TableExtractor, "pdfplumber", RULINGS_ONLY),
+        )
+        for task, extractor_class, method, skip in runs:
+            plain, expected = best_of(
+                repeat, lambda: extractor_class(method=method).extract(pdf_path)
+            )
+            skipped, result = best_of(
+                repeat, lambda: extractor_class(method=method, skip_objects=skip).extract(pdf_path)
+            )
+            same = result == expected if task == "text" else [t.rows() for t in result] == [
+                t.rows() for t in expected
+            ]
+            print(
+                f"{pdf_path.name:<32} {task:<7} {page_count:>5} {plain / page_count:>11.4f} "
+                f"{skipped / page_count:>12.4f} {'yes' if same else 'no':>5}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        default=["examples/legal_document_sample.pdf"],
+        help="PDF files to benchmark",
+    )
+    parser.add_argument("--drawing", help="Write a synthetic drawing PDF here and include it")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    pdf_paths = [Path(pdf) for pdf in args.pdfs]
+    if args.drawing:
+        pdf_paths.append(write_drawing(Path(args.drawing)))
+    benchmark(pdf_paths, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
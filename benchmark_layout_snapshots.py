@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure table and text reruns that read layout snapshots.
+
+Usage:
+    python benchmark_layout_snapshots.py [PDF ...] [--drawing drawing.pdf] [--repeat 3]
+
+Each table backend and pdfplumber text extraction runs on every PDF three
+ways: laying pages out from the PDF, recording a snapshot while doing so
+(the first run), and restoring pages from that snapshot (every later run).
+The best of ``--repeat`` runs is reported in seconds per page, with a check
+that the snapshot gives the same result as the PDF. ``--drawing`` first
+writes the synthetic drawing of ``benchmark_graphics.py`` and adds it.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import pdfplumber
+
+from benchmark_graphics import best_of, write_drawing
+from pdf_extractor.layout_snapshot import LayoutSnapshots
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+
+
+def result_key(task, result):
+    """Comparable form of an extraction result."""
+    return result if task == "text" else [table.rows() for table in result]
+
+
+def benchmark(pdf_paths, repeat):
+    """Print one line per (PDF, task) with plain, recording and restoring times."""
+    print(
+        f"{'document':<32} {'task':<10} {'pages':>5} {'plain s/page':>13} "
+        f"{'record s/page':>14} {'read s/page':>12} {'same':>5}"
+    )
+
+    runs = (
+        ("pdfplumber", TableExtractor, "pdfplumber"),
+        ("lattice", TableExtractor, "lattice"),
+        ("stream", TableExtractor, "stream"),
+        ("text", TextExtractor, "pdfplumber"),
+    )
+    for pdf_path in pdf_paths:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        for task, extractor_class, method in runs:
+            with tempfile.TemporaryDirectory() as tmp:
+                snapshots = LayoutSnapshots(tmp)
+                plain, expected = best_of(
+                    repeat, lambda: extractor_class(method=method).extract(pdf_path)
+                )
+
+                def record():
+                    snapshots.path(pdf_path).unlink(missing_ok=True)
+                    extractor = extractor_class(method=method, layout_snapshots=snapshots)
+                    return extractor.extract(pdf_path)
+
+                recording, _ = best_of(repeat, record)
+                reading, result = best_of(
+                    repeat,
+                    lambda: extractor_class(method=method, layout_snapshots=snapshots).extract(
+                        pdf_path
+                    ),
+                )
+                same = result_key(task, result) == result_key(task, expected)
+                size = snapshots.path(pdf_path).stat().st_size
+            print(
+                f"{pdf_path.name:<32} {task:<10} {page_count:>5} {plain / page_count:>13.4f} "
+                f"{recording / page_count:>14.4f} {reading / page_count:>12.4f} "
+                f"{'yes' if same else 'no':>5}  ({size / 1024:.0f} KB snapshot)"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        default=["examples/legal_document_sample.pdf"],
+        help="PDF files to benchmark",
+    )
+    parser.add_argument("--drawing", help="Write a synthetic drawing PDF here and include it")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    pdf_paths = [Path(pdf) for pdf in args.pdfs]
+    if args.drawing:
+        pdf_paths.append(write_drawing(Path(args.drawing)))
+    benchmark(pdf_paths, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
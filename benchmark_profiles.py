@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure the throughput of the fast, balanced and accurate profiles.
+
+Usage:
+    python benchmark_profiles.py [PDF ...] [--drawing drawing.pdf] [--repeat 3]
+
+Each profile runs ``PDFExtractor(profile=...).extract_text`` and
+``extract_tables`` on every PDF. The best of ``--repeat`` runs is reported
+as pages per second, with the characters of text and the number of tables
+found as a rough check of what each profile gives up. ``--drawing`` first
+writes the synthetic drawing of ``benchmark_graphics.py`` and adds it.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pdfplumber
+
+from benchmark_graphics import write_drawing
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.profiles import PROFILE_NAMES
+
+
+def best_of(repeat, func):
+    """Return the best time over ``repeat`` runs and the last result."""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def benchmark(pdf_paths, profiles, repeat):
+    """Time each profile on each PDF and print one line per (PDF, profile)."""
+    print(
+        f"{'document':<32} {'profile':<9} {'pages':>5} "
+        f"{'text p/s':>9} {'chars':>7} {'tables p/s':>11} {'tables':>6}"
+    )
+
+    for pdf_path in pdf_paths:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        for profile in profiles:
+            extractor = PDFExtractor(profile=profile)
+            text_time, text = best_of(repeat, lambda: extractor.extract_text(pdf_path))
+            table_time, tables = best_of(repeat, lambda: extractor.extract_tables(pdf_path))
+            print(
+                f"{pdf_path.name:<32} {profile:<9} {page_count:>5} "
+                f"{page_count / text_time:>9.1f} {len(text):>7} "
+                f"{page_count / table_time:>11.1f} {len(tables):>6}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        default=["examples/legal_document_sample.pdf"],
+        help="PDF files to benchmark",
+    )
+    parser.add_argument(
+        "--profiles", nargs="+", default=list(PROFILE_NAMES), help="Profiles to compare"
+    )
+    parser.add_argument("--drawing", help="Write a synthetic drawing PDF here and include it")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    pdf_paths = [Path(pdf) for pdf in args.pdfs]
+    if args.drawing:
+        pdf_paths.append(write_drawing(Path(args.drawing)))
+    benchmark(pdf_paths, args.profiles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
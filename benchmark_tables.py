@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Compare the speed of the table extraction backends.
+
+Usage:
+    python benchmark_tables.py [PDF ...] [--methods tabula pdfplumber lattice] [--repeat 3]
+
+Each method runs through ``TableExtractor.extract`` on every PDF; the best of
+``--repeat`` runs is reported as seconds per page together with the number
+of tables found. Methods that cannot run here (tabula without a JVM) are
+reported as unavailable.
+"""
+
+import argparse
+import shutil
+import time
+from pathlib import Path
+
+import pdfplumber
+
+from pdf_extractor.table_extractor import TABLE_METHODS, TableExtractor
+
+
+def benchmark(pdf_paths, methods, repeat):
+    """Time each method on each PDF and print one line per (PDF, method)."""
+    print(f"{'document':<32} {'method':<12} {'pages':>5} {'tables':>6} {'s/page':>9}")
+
+    for pdf_path in pdf_paths:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+
+        for method in methods:
+            if method == "tabula" and shutil.which("java") is None:
+                print(f"{pdf_path.name:<32} {method:<12} unavailable (no java on PATH)")
+                continue
+            try:
+                extractor = TableExtractor(method=method)
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    tables = extractor.extract(pdf_path)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            except Exception as e:
+                print(f"{pdf_path.name:<32} {method:<12} unavailable ({e})")
+                continue
+
+            print(
+                f"{pdf_path.name:<32} {method:<12} {page_count:>5} {len(tables):>6} "
+                f"{best / page_count:>9.4f}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        default=["examples/legal_document_sample.pdf"],
+        help="PDF files to benchmark",
+    )
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        choices=[method for method in TABLE_METHODS if method != "auto"],
+        default=[method for method in TABLE_METHODS if method != "auto"],
+        help="Backends to compare",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    benchmark([Path(pdf) for pdf in args.pdfs], args.methods, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Measure how tiled text extraction scales with the glyph count of a page.
+
+Usage:
+    python benchmark_tiles.py [--lines 250 500 1000 2000] [--workers 1 4] [--whole]
+
+For each line count a synthetic page is written to a temporary directory:
+four columns of ten-word lines, about 300 glyphs per line. Its text is
+extracted with ``tiles.tiled_text`` for each ``--workers`` value, and with
+``--whole`` also with ``page.extract_text()`` for comparison. Seconds are
+printed with a check that every output is the same.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pdfplumber
+
+from pdf_extractor.tiles import estimate_glyphs, tiled_text
+
+
+def write_dense_page(path, lines, columns=4, words=10):
+    """Write one page of ``columns`` text columns with ``lines`` lines each."""
+    from reportlab.pdfgen import canvas
+
+    height = 40 + lines * 6
+    pdf = canvas.Canvas(str(path), pagesize=(2400, height))
+    pdf.setFont("Helvetica", 5)
+    for column in range(columns):
+        for i in range(lines):
+            text = " ".join(f"w{column}{i}x{j}" for j in range(words))
+            pdf.drawString(20 + column * 600, height - 20 - i * 6, text)
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+def timed(pdf_path, func):
+    """Open the PDF, run ``func`` on its first page and return (seconds, result)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        start = time.perf_counter()
+        result = func(pdf.pages[0])
+        return time.perf_counter() - start, result
+
+
+def benchmark(line_counts, workers, whole):
+    """Print one line per page size with the time of each extraction."""
+    header = f"{'lines':>6} {'glyphs':>8}" + "".join(f" {f'tiled/{n}':>9}" for n in workers)
+    print(header + (f" {'whole':>9}" if whole else "") + f" {'same':>5}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for lines in line_counts:
+            pdf_path = write_dense_page(Path(tmp) / f"dense_{lines}.pdf", lines)
+            with pdfplumber.open(pdf_path) as pdf:
+                glyphs = estimate_glyphs(pdf.pages[0])
+
+            times, texts = [], []
+            for count in workers:
+                seconds, text = timed(pdf_path, lambda page: tiled_text(page, workers=count))
+                times.append(seconds)
+                texts.append(text)
+            if whole:
+                seconds, text = timed(pdf_path, lambda page: page.extract_text())
+                times.append(seconds)
+                texts.append(text)
+
+            same = all(text == texts[0] for text in texts)
+            print(
+                f"{lines:>6} {glyphs:>8}" + "".join(f" {t:>9.2f}" for t in times)
+                + f" {'yes' if same else 'no':>5}"
+            )
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--lines", type=int, nargs="+", default=[250, 500, 1000, 2000], help="Page sizes"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1], help="Tile worker counts to time"
+    )
+    parser.add_argument(
+        "--whole", action="store_true", help="Also time pdfplumber on the whole page"
+    )
+    args = parser.parse_args()
+    benchmark(args.lines, args.workers, args.whole)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Learned table layouts for pages that share a layout signature.
+
+Table detection with pdfplumber's default "lines" strategy and with the
+lattice backend depends only on a page's ruling lines, so two pages with the
+same rulings have the same table cells. ``TableAreaCache`` remembers the cell
+layout found on one page under the page's layout signature (page size, font
+set and ruling geometry). Later pages with that signature skip detection:
+their words are assigned straight to the remembered cells.
+
+The cache is an in-memory LRU owned by one process. It pays off wherever
+one extractor handles many documents, e.g. a job-queue worker or server
+worker going through one vendor's invoices.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+
+try:
+    from pdfplumber.table import Table
+except ImportError:
+    Table = None
+
+from . import lattice
+
+# Backends whose table cells are a function of the page's rulings
+CACHEABLE_BACKENDS = ("pdfplumber", "lattice")
+
+Bbox = Tuple[float, float, float, float]
+CellLayout = List[List[List[Optional[Bbox]]]]
+
+
+def layout_signature(page: Any) -> str:
+    """
+    Hash the layout of a pdfplumber page.
+
+    The signature covers the page size, the set of fonts used, and the
+    geometry of every line, rect and curve rounded to 0.1pt. Text content
+    is not part of it.
+    """
+    digest = hashlib.sha1()
+    digest.update(f"{page.width:.1f}x{page.height:.1f}".encode())
+    fonts = sorted({char["fontname"] for char in page.chars})
+    digest.update("\x1f".join(fonts).encode("utf-8", "replace"))
+
+    for kind in ("line", "rect", "curve"):
+        boxes = sorted(
+            tuple(round(obj[key], 1) for key in ("x0", "top", "x1", "bottom"))
+            for obj in page.objects.get(kind, [])
+        )
+        digest.update(f"\x1e{kind}:{boxes!r}".encode())
+    return digest.hexdigest()
+
+
+class TableAreaCache:
+    """LRU cache of table cell layouts keyed by backend and layout signature."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Layouts kept before the least recently used is evicted
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CellLayout]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Number of cached layouts."""
+        return len(self._entries)
+
+    def get(self, backend: str, signature: str) -> Optional[CellLayout]:
+        """Return the cached cell layout for a page signature, counting the hit or miss."""
+        layout = self._entries.get((backend, signature))
+        if layout is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((backend, signature))
+        self.hits += 1
+        return layout
+
+    def put(self, backend: str, signature: str, layout: CellLayout) -> None:
+        """Cache the cell layout detected on a page, evicting the oldest entry if full."""
+        self._entries[(backend, signature)] = layout
+        self._entries.move_to_end((backend, signature))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hits, misses, hit rate, evictions and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+
+def page_tables(
+    page: Any, backend: str, cache: TableAreaCache
+) -> List[Tuple[Bbox, List[List[Optional[str]]]]]:
+    """
+    Extract a page's tables, reusing a cached cell layout when one matches.
+
+    Args:
+        page: pdfplumber page
+        backend: "pdfplumber" or "lattice"
+        cache: Cache to read and fill
+
+    Returns:
+        List of (bbox as (x0, top, x1, bottom), raw rows) per table, the rows
+        as the backend itself would return them
+    """
+    signature = layout_signature(page)
+    layout = cache.get(backend, signature)
+
+    if backend == "pdfplumber":
+        if layout is None:
+            tables = page.find_tables()
+            layout = [[list(row.cells) for row in table.rows] for table in tables]
+            cache.put(backend, signature, layout)
+        else:
+            # Table rebuilds its rows from the cells, exactly as find_tables does
+            tables = [
+                Table(page, [cell for row in cells for cell in row if cell is not None])
+                for cells in layout
+            ]
+        return [(table.bbox, table.extract()) for table in tables]
+
+    if layout is None:
+        layout = [cells for _, cells in lattice.find_table_cells(page)]
+        cache.put(backend, signature, layout)
+    if not layout:
+        return []
+    return list(zip(map(_cells_bbox, layout), lattice.fill_cells(page.extract_words(), layout)))
+
+
+def _cells_bbox(cells: List[List[Optional[Bbox]]]) -> Bbox:
+    """Bounding box of a table's cells."""
+    boxes = [cell for row in cells for cell in row if cell is not None]
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
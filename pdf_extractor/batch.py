@@ -0,0 +1,499 @@
+"""Size-aware batch extraction over a pool of worker processes."""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import logging
+import multiprocessing
+
+import polars as pl
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+from . import font_cache
+from .ipc import export_result, import_result
+from .area_cache import TableAreaCache
+from .layout_snapshot import LayoutSnapshots
+from .object_filter import RULINGS_ONLY, TEXT_ONLY
+from .page_cache import PageCache
+from .page_store import (
+    PAGE_TABLE_SUFFIX,
+    TEXT_FORMATS,
+    PageCollector,
+    offsets_path,
+    page_offsets,
+    write_page_table,
+)
+from .preflight import DocumentProfile, inspect_document
+from .profiles import get_profile
+from .search import SearchIndex
+from .table_index import write_table_index
+from .text_extractor import TextExtractor
+from .table_extractor import TableExtractor
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_POLICIES = ("longest-first", "shortest-first", "fifo")
+
+# One page of work is the unit of cost; every BYTES_PER_PAGE_EQUIVALENT bytes
+# of file size counts as one more page (image-heavy or font-heavy files).
+BYTES_PER_PAGE_EQUIVALENT = 256 * 1024
+
+
+@dataclass
+class DocumentCost:
+    """Up-front cost estimate for one PDF."""
+
+    pdf_path: Path
+    page_count: int
+    file_size: int
+
+    @property
+    def cost(self) -> float:
+        """Estimated cost in page-equivalents."""
+        return self.page_count + self.file_size / BYTES_PER_PAGE_EQUIVALENT
+
+
+@dataclass
+class BatchTask:
+    """A unit of scheduled work: a whole document or a page range of one."""
+
+    pdf_path: Path
+    pages: Optional[List[int]]
+    cost: float
+    part: int = 0
+    parts: int = 1
+    table_method: str = "auto"
+
+
+@dataclass
+class BatchResult:
+    """Outcome of extracting one document in a batch."""
+
+    pdf_path: Path
+    text_path: Optional[Path] = None
+    table_paths: List[Path] = field(default_factory=list)
+    table_index_path: Optional[Path] = None
+    characters: int = 0
+    timed_out_pages: List[int] = field(default_factory=list)
+    duplicate_pages: List[int] = field(default_factory=list)
+    skipped_pages: List[int] = field(default_factory=list)
+    low_quality_pages: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def count_pages(pdf_path: Union[str, Path]) -> int:
+    """
+    Read the page count from the document's page tree without parsing content.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Number of pages, or 0 if the page tree cannot be read
+    """
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is required to estimate page counts")
+
+    try:
+        with open(pdf_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            try:
+                root: Any = reader.trailer["/Root"]
+                return int(root["/Pages"]["/Count"])
+            except (KeyError, TypeError, ValueError):
+                return len(reader.pages)
+    except Exception as e:
+        logger.warning(f"Could not read page count of {pdf_path}: {e}")
+        return 0
+
+
+def estimate_cost(pdf_path: Union[str, Path]) -> DocumentCost:
+    """
+    Estimate the extraction cost of a PDF from its page count and file size.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        DocumentCost for the file
+    """
+    pdf_path = Path(pdf_path)
+    return DocumentCost(pdf_path, count_pages(pdf_path), pdf_path.stat().st_size)
+
+
+def plan_tasks(
+    pdf_paths: Sequence[Union[str, Path]],
+    policy: str = "longest-first",
+    split_pages: Optional[int] = 500,
+    profiles: Optional[Dict[Path, DocumentProfile]] = None,
+) -> List[BatchTask]:
+    """
+    Turn a list of PDFs into an ordered list of tasks.
+
+    Documents with more than ``split_pages`` pages are split into page-range
+    tasks so that they interleave with small whole documents in the pool.
+
+    With pre-flight profiles, a document's tasks cover only its text pages,
+    cost what the profile estimates and use the profile's table backend;
+    documents without text pages get no task at all.
+
+    Args:
+        pdf_paths: PDF files to process
+        policy: "longest-first" (minimise makespan), "shortest-first"
+            (minimise latency) or "fifo" (input order)
+        split_pages: Maximum pages per task (optional, None disables splitting)
+        profiles: Pre-flight profiles by PDF path, see ``preflight`` (optional)
+
+    Returns:
+        Tasks in the order they should be submitted
+    """
+    if policy not in SCHEDULE_POLICIES:
+        raise ValueError(f"Unknown schedule policy: {policy}")
+
+    tasks: List[BatchTask] = []
+    for pdf_path in pdf_paths:
+        profile = (profiles or {}).get(Path(pdf_path))
+        if profile is not None and profile.readable:
+            selected = profile.text_pages
+            if not selected:
+                continue
+            page_numbers = None if len(selected) == profile.page_count else selected
+            cost, table_method = profile.estimated_cost, profile.table_method
+        else:
+            estimate = estimate_cost(pdf_path)
+            selected = list(range(1, estimate.page_count + 1))
+            page_numbers, cost, table_method = None, estimate.cost, "auto"
+
+        if split_pages is None or len(selected) <= split_pages:
+            tasks.append(
+                BatchTask(Path(pdf_path), page_numbers, cost, table_method=table_method)
+            )
+            continue
+
+        starts = range(0, len(selected), split_pages)
+        cost_per_page = cost / len(selected)
+        for part, start in enumerate(starts):
+            pages = selected[start:start + split_pages]
+            tasks.append(
+                BatchTask(
+                    Path(pdf_path),
+                    pages,
+                    cost_per_page * len(pages),
+                    part=part,
+                    parts=len(starts),
+                    table_method=table_method,
+                )
+            )
+
+    if policy == "longest-first":
+        tasks.sort(key=lambda task: task.cost, reverse=True)
+    elif policy == "shortest-first":
+        tasks.sort(key=lambda task: task.cost)
+
+    return tasks
+
+
+# Table layouts learned by this worker process, kept across its tasks
+_area_cache: Optional[TableAreaCache] = None
+
+
+def _process_area_cache(size: Optional[int]) -> Optional[TableAreaCache]:
+    """Return this process's table area cache, creating it on first use."""
+    global _area_cache
+    if size and _area_cache is None:
+        _area_cache = TableAreaCache(size)
+    return _area_cache
+
+
+def _run_task(task: BatchTask, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker process entry point: extract one task.
+
+    Text and tables are handed back through a memory-mapped Arrow spool file
+    rather than pickled; see ``ipc.export_result``.
+    """
+    result: Dict[str, Any] = {
+        "text": None,
+        "tables": [],
+        "table_locations": [],
+        "timed_out_pages": [],
+        "duplicate_pages": [],
+        "low_quality_pages": [],
+        "page_offsets": None,
+    }
+    page_cache = PageCache(options["page_cache"]) if options["page_cache"] else None
+    snapshots = options["layout_snapshots"]
+    snapshots = LayoutSnapshots(snapshots) if snapshots is not None else None
+    if options["font_cache_mb"]:
+        font_cache.enable(options["font_cache_mb"] * 1024 * 1024)
+    settings = get_profile(options["profile"]) if options["profile"] else None
+    skip_graphics = options["skip_graphics"] or (settings is not None and settings.skip_graphics)
+
+    if options["text"]:
+        search_index = options["search_index"]
+        collector = PageCollector()
+        page_sinks: List[Any] = [collector]
+        if search_index is not None:
+            page_sinks.append(SearchIndex(search_index))
+        extractor = TextExtractor(
+            method=settings.text_methods if settings else "auto",
+            page_timeout=options["page_timeout"],
+            doc_timeout=options["doc_timeout"],
+            page_sinks=page_sinks,
+            page_cache=page_cache,
+            dedupe_pages=options["dedupe_pages"],
+            skip_objects=TEXT_ONLY if skip_graphics else None,
+            fallback=settings.text_fallback if settings else "error",
+            layout_snapshots=snapshots,
+        )
+        result["text"] = extractor.extract(task.pdf_path, task.pages)
+        result["timed_out_pages"].extend(extractor.timed_out_pages)
+        result["duplicate_pages"].extend(extractor.duplicate_pages)
+        result["low_quality_pages"] = extractor.low_quality_pages
+        # Offsets within this part; the parent shifts them into the merged text
+        result["page_offsets"] = page_offsets(collector.to_frame(), result["text"])
+
+    if options["tables"]:
+        table_extractor = TableExtractor(
+            method=(
+                settings.table_methods
+                if settings and task.table_method == "auto"
+                else task.table_method
+            ),
+            page_timeout=options["page_timeout"],
+            doc_timeout=options["doc_timeout"],
+            page_cache=page_cache,
+            dedupe_pages=options["dedupe_pages"],
+            area_cache=_process_area_cache(options["area_cache_size"]),
+            skip_objects=RULINGS_ONLY if skip_graphics else None,
+            layout_snapshots=snapshots,
+        )
+        result["tables"] = table_extractor.extract(task.pdf_path, task.pages)
+        result["table_locations"] = table_extractor.table_locations
+        result["timed_out_pages"].extend(table_extractor.timed_out_pages)
+        result["duplicate_pages"].extend(table_extractor.duplicate_pages)
+
+    result["shared"] = export_result(result.pop("text"), result.pop("tables"))
+    return result
+
+
+class BatchExtractor:
+    """Extract text and tables from many PDFs with size-aware scheduling."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        policy: str = "longest-first",
+        split_pages: Optional[int] = 500,
+        extract_text: bool = True,
+        extract_tables: bool = True,
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        search_index: Optional[Union[str, Path]] = None,
+        page_cache: Optional[Union[str, Path]] = None,
+        dedupe_pages: bool = False,
+        area_cache_size: Optional[int] = None,
+        route: bool = False,
+        skip_graphics: bool = False,
+        profile: Optional[str] = None,
+        font_cache_mb: Optional[int] = None,
+        layout_snapshots: Optional[Union[str, Path]] = None,
+        text_format: str = "txt",
+    ) -> None:
+        """
+        Initialize the batch extractor.
+
+        Args:
+            workers: Number of worker processes (optional, defaults to CPU count)
+            policy: Scheduling policy, see ``plan_tasks``
+            split_pages: Maximum pages per task (optional, None disables splitting)
+            extract_text: Whether to write a .txt file per document
+            extract_tables: Whether to write Parquet tables per document
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per task before extraction stops (optional)
+            search_index: SQLite full-text index to write extracted pages to (optional)
+            page_cache: SQLite cache of per-page results shared by the workers (optional)
+            dedupe_pages: Extract identical pages within a document only once
+            area_cache_size: Table layouts each worker process remembers
+                across its tasks, see ``PDFExtractor`` (optional)
+            route: Inspect each document first (``preflight.inspect_document``),
+                skip its pages without text and use the cheapest suitable
+                table backend
+            skip_graphics: Leave images and vector graphics out of page
+                layout, see ``PDFExtractor``
+            profile: Speed/accuracy profile, see ``PDFExtractor``; routed
+                documents keep the table backend chosen for them (optional)
+            font_cache_mb: Memory cap of the parsed-font cache each worker
+                process keeps across its tasks, see ``PDFExtractor`` (optional)
+            layout_snapshots: Directory of per-document layout snapshots,
+                see ``PDFExtractor`` (optional)
+            text_format: "txt" for ``{name}.txt`` with an offset sidecar, or
+                "parquet" for a ``{name}.pages.parquet`` page table
+        """
+        if policy not in SCHEDULE_POLICIES:
+            raise ValueError(f"Unknown schedule policy: {policy}")
+        if text_format not in TEXT_FORMATS:
+            raise ValueError(f"Unknown text format: {text_format}")
+        if profile is not None:
+            get_profile(profile)
+
+        self.workers = workers
+        self.policy = policy
+        self.split_pages = split_pages
+        self.route = route
+        self.text_format = text_format
+        self.options: Dict[str, Any] = {
+            "text": extract_text,
+            "tables": extract_tables,
+            "page_timeout": page_timeout,
+            "doc_timeout": doc_timeout,
+            "search_index": search_index,
+            "page_cache": page_cache,
+            "dedupe_pages": dedupe_pages,
+            "area_cache_size": area_cache_size,
+            "skip_graphics": skip_graphics,
+            "profile": profile,
+            "font_cache_mb": font_cache_mb,
+            "layout_snapshots": layout_snapshots,
+        }
+
+    def run(
+        self, pdf_paths: Sequence[Union[str, Path]], output_dir: Union[str, Path]
+    ) -> List[BatchResult]:
+        """
+        Extract every PDF and write outputs to ``output_dir``.
+
+        Outputs use the same names as ``PDFExtractor``: ``{name}.txt`` with
+        its ``{name}.txt.offsets.parquet`` sidecar (``{name}.pages.parquet``
+        with ``text_format="parquet"``) and ``{name}_table_{i}.parquet``,
+        with the tables' location index in ``{name}_tables.index.parquet``.
+        Page-range parts of a split document are merged in page order once
+        all of them have finished. When routing, documents without any text
+        pages are listed in ``skipped_pages`` and get no outputs.
+
+        Args:
+            pdf_paths: PDF files to process
+            output_dir: Directory for extracted outputs
+
+        Returns:
+            One BatchResult per input document, in input order
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        results: Dict[Path, BatchResult] = {
+            Path(pdf_path): BatchResult(Path(pdf_path)) for pdf_path in pdf_paths
+        }
+        profiles: Optional[Dict[Path, DocumentProfile]] = None
+        if self.route:
+            profiles = {}
+            for path, result in results.items():
+                try:
+                    profile = profiles[path] = inspect_document(path)
+                except Exception as e:
+                    logger.warning(f"Could not inspect {path}, extracting it in full: {e}")
+                    continue
+                if profile.readable:
+                    text_pages = set(profile.text_pages)
+                    result.skipped_pages = [
+                        page for page in range(1, profile.page_count + 1)
+                        if page not in text_pages
+                    ]
+
+        tasks = plan_tasks(pdf_paths, self.policy, self.split_pages, profiles)
+        parts: Dict[Path, Dict[int, Dict[str, Any]]] = {}
+
+        # Workers use Polars, which is not fork-safe once the parent has used it
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+            # The executor hands out work in submission order, so submitting
+            # in plan order is what applies the scheduling policy.
+            futures = {
+                executor.submit(_run_task, task, self.options): task for task in tasks
+            }
+
+            for future in as_completed(futures):
+                task = futures[future]
+                result = results[task.pdf_path]
+
+                try:
+                    part = future.result()
+                    part["text"], part["tables"] = import_result(part.pop("shared"))
+                    parts.setdefault(task.pdf_path, {})[task.part] = part
+                except Exception as e:
+                    logger.error(f"Error extracting {task.pdf_path}: {e}")
+                    result.error = str(e)
+                    continue
+
+                if len(parts[task.pdf_path]) == task.parts and result.error is None:
+                    document_parts = parts.pop(task.pdf_path)
+                    self._write_document(
+                        result, [document_parts[i] for i in range(task.parts)], output_dir
+                    )
+                    if task.pages is not None and self.options["search_index"] is not None:
+                        SearchIndex(self.options["search_index"]).finish_document(
+                            task.pdf_path, count_pages(task.pdf_path)
+                        )
+
+        return list(results.values())
+
+    def _write_document(
+        self, result: BatchResult, parts: List[Dict[str, Any]], output_dir: Path
+    ) -> None:
+        """Merge the parts of one document in page order and save them."""
+        pdf_name = result.pdf_path.stem
+
+        for part in parts:
+            result.timed_out_pages.extend(part["timed_out_pages"])
+            result.duplicate_pages.extend(part["duplicate_pages"])
+            result.low_quality_pages.extend(part["low_quality_pages"])
+        result.timed_out_pages = sorted(set(result.timed_out_pages))
+        result.duplicate_pages = sorted(set(result.duplicate_pages))
+        result.low_quality_pages = sorted(result.low_quality_pages)
+
+        if self.options["text"]:
+            text = "".join(part["text"] for part in parts)
+            result.characters = len(text)
+
+            offsets = []
+            start = 0
+            for part in parts:
+                offsets.append(
+                    part["page_offsets"].with_columns(pl.col("offset") + start)
+                )
+                start += len(part["text"].encode("utf-8"))
+            offsets_frame = pl.concat(offsets)
+
+            if self.text_format == "parquet":
+                # Page texts are cut out of the merged text rather than sent back twice
+                data = text.encode("utf-8")
+                page_texts = [
+                    data[offset:offset + length].decode("utf-8")
+                    for offset, length in offsets_frame.select("offset", "length").iter_rows()
+                ]
+                pages = offsets_frame.with_columns(
+                    pl.Series("text", page_texts, dtype=pl.Utf8)
+                ).select("page", "text", "char_count", "backend", "quality")
+                result.text_path = output_dir / f"{pdf_name}{PAGE_TABLE_SUFFIX}"
+                write_page_table(pages, result.text_path)
+            else:
+                result.text_path = output_dir / f"{pdf_name}.txt"
+                result.text_path.write_text(text, encoding='utf-8')
+                offsets_frame.write_parquet(offsets_path(result.text_path))
+
+        if self.options["tables"]:
+            tables: List[pl.DataFrame] = [t for part in parts for t in part["tables"]]
+            for i, table in enumerate(tables):
+                table_path = output_dir / f"{pdf_name}_table_{i}.parquet"
+                table.write_parquet(table_path)
+                result.table_paths.append(table_path)
+            result.table_index_path = write_table_index(
+                [location for part in parts for location in part["table_locations"]],
+                output_dir,
+                pdf_name,
+            )
@@ -0,0 +1,320 @@
+"""Lazy query layer over a directory of extracted outputs.
+
+``open(output_dir)`` returns a ``Catalog`` that exposes every extracted table
+and every Parquet page table in the directory as Polars ``LazyFrame``s built
+on ``scan_parquet``. Nothing is read until the query is collected, and
+filters on document, schema, page and column names decide which files (and
+which row groups and columns within them) are read at all.
+
+Tables are grouped by schema: the hash of their ordered column names and
+types. The per-file index (document, table number, schema, columns, rows) is
+built from Parquet footers only and cached in ``.catalog.parquet`` inside the
+output directory, so reopening a large directory only reads the footers of
+files that were added or changed since. The page and bbox of each table are
+joined in from the ``{name}_tables.index.parquet`` location indexes written
+next to the tables, so ``tables(page=...)`` also picks files before scanning.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import hashlib
+import logging
+import re
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from .page_store import PAGE_TABLE_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ".catalog.parquet"
+
+# Matches both "{document}_table_{i}.parquet" and the bare "table_{i}.parquet"
+# written by the examples.
+_TABLE_NAME = re.compile(r"^(?:(?P<document>.+)_)?table_(?P<table>\d+)\.parquet$")
+
+_INDEX_SCHEMA: Dict[Any, Any] = {
+    "path": pl.Utf8,
+    "size": pl.Int64,
+    "mtime_ns": pl.Int64,
+    "document": pl.Utf8,
+    "table": pl.Int64,
+    "schema": pl.Utf8,
+    "columns": pl.List(pl.Utf8),
+    "rows": pl.Int64,
+}
+
+# table_index.TABLE_INDEX_SUFFIX; table_index imports this module for schema_hash.
+_LOCATION_INDEX_SUFFIX = "_tables.index.parquet"
+
+_LOCATION_SCHEMA: Dict[Any, Any] = {
+    "path": pl.Utf8,
+    "page": pl.Int32,
+    "x0": pl.Float64,
+    "top": pl.Float64,
+    "x1": pl.Float64,
+    "bottom": pl.Float64,
+}
+
+_PAGE_SCHEMA: Dict[Any, Any] = {
+    "document": pl.Utf8,
+    "page": pl.Int32,
+    "text": pl.Utf8,
+    "char_count": pl.Int64,
+    "backend": pl.Utf8,
+    "quality": pl.Float64,
+}
+
+
+def open(output_dir: Union[str, Path], refresh: bool = True) -> "Catalog":
+    """
+    Open the catalog of an output directory.
+
+    Args:
+        output_dir: Directory written by ``extract-all``, ``batch`` or ``worker``
+        refresh: Bring the cached table index up to date with the directory
+
+    Returns:
+        Catalog over the directory
+    """
+    return Catalog(output_dir, refresh=refresh)
+
+
+def schema_hash(names: Sequence[str], types: Sequence[str]) -> str:
+    """Return a short stable hash of an ordered list of column names and types."""
+    digest = hashlib.sha1()
+    for name, dtype in zip(names, types):
+        digest.update(f"{name}\x1f{dtype}\x1e".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _as_list(value: Union[Any, Iterable[Any], None]) -> Optional[List[Any]]:
+    """Normalize a single filter value or an iterable of them to a list."""
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return [value]
+    return list(value)
+
+
+class Catalog:
+    """Tables and page texts of one output directory as lazy frames."""
+
+    def __init__(self, output_dir: Union[str, Path], refresh: bool = True) -> None:
+        """
+        Initialize the catalog.
+
+        Args:
+            output_dir: Directory holding extracted outputs
+            refresh: Bring the cached table index up to date with the directory
+        """
+        self.output_dir = Path(output_dir)
+        if not self.output_dir.is_dir():
+            raise FileNotFoundError(f"Output directory not found: {self.output_dir}")
+
+        self._index = self._load_index()
+        if refresh:
+            self.refresh()
+
+    def _load_index(self) -> pl.DataFrame:
+        """Read the cached index, or start an empty one."""
+        index_path = self.output_dir / INDEX_FILE
+        if index_path.exists():
+            try:
+                return pl.read_parquet(index_path).cast(_INDEX_SCHEMA)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable catalog index {index_path}: {e}")
+        return pl.DataFrame(schema=_INDEX_SCHEMA)
+
+    def refresh(self) -> None:
+        """Re-read the footers of new or changed table files and drop deleted ones."""
+        cached = {row["path"]: row for row in self._index.iter_rows(named=True)}
+        rows: List[Dict[str, Any]] = []
+        changed = False
+
+        for table_path in sorted(self.output_dir.glob("*table_*.parquet")):
+            match = _TABLE_NAME.match(table_path.name)
+            if match is None:
+                continue
+
+            stat = table_path.stat()
+            row = cached.pop(table_path.name, None)
+            if row is None or (row["size"], row["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                try:
+                    metadata = pq.read_metadata(table_path)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable table {table_path}: {e}")
+                    continue
+
+                schema = metadata.schema.to_arrow_schema()
+                row = {
+                    "path": table_path.name,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "document": match.group("document"),
+                    "table": int(match.group("table")),
+                    "schema": schema_hash(schema.names, [str(t) for t in schema.types]),
+                    "columns": schema.names,
+                    "rows": metadata.num_rows,
+                }
+                changed = True
+            rows.append(row)
+
+        if cached:
+            changed = True
+
+        if changed:
+            self._index = pl.DataFrame(rows, schema=_INDEX_SCHEMA)
+            try:
+                self._index.write_parquet(self.output_dir / INDEX_FILE)
+            except OSError as e:
+                logger.warning(f"Could not save catalog index: {e}")
+
+    def _locations(self) -> pl.DataFrame:
+        """Page and bbox of each table file, read from the location indexes."""
+        frames = []
+        for index_path in sorted(self.output_dir.glob(f"*{_LOCATION_INDEX_SUFFIX}")):
+            try:
+                frame = pl.read_parquet(index_path, columns=["file", *list(_LOCATION_SCHEMA)[1:]])
+            except Exception as e:
+                logger.warning(f"Skipping unreadable table index {index_path}: {e}")
+                continue
+            frames.append(frame.rename({"file": "path"}).cast(_LOCATION_SCHEMA))
+
+        if not frames:
+            return pl.DataFrame(schema=_LOCATION_SCHEMA)
+        return pl.concat(frames).unique("path", keep="first", maintain_order=True)
+
+    def table_index(self) -> pl.LazyFrame:
+        """
+        One row per table file: path, document, table, schema, columns and rows,
+        plus the page and bbox (x0, top, x1, bottom) from the location index.
+
+        Tables without a location index row have null page and bbox.
+        """
+        return (
+            self._index.lazy()
+            .drop("size", "mtime_ns")
+            .join(self._locations().lazy(), on="path", how="left")
+        )
+
+    def schemas(self) -> pl.DataFrame:
+        """Distinct table schemas with their columns and number of tables."""
+        return (
+            self._index.group_by("schema", maintain_order=True)
+            .agg(pl.col("columns").first(), pl.len().alias("tables"), pl.col("rows").sum())
+        )
+
+    def documents(self) -> List[str]:
+        """Documents that have at least one table or page table."""
+        documents = set(self._index["document"].drop_nulls().to_list())
+        documents.update(document for document, _ in self._page_tables())
+        return sorted(documents)
+
+    def tables(
+        self,
+        document: Union[str, Iterable[str], None] = None,
+        schema: Union[str, Iterable[str], None] = None,
+        columns: Optional[Sequence[str]] = None,
+        page: Union[int, Iterable[int], None] = None,
+    ) -> pl.LazyFrame:
+        """
+        Scan the selected tables as one lazy frame.
+
+        Files are chosen from the index before anything is scanned, so only
+        tables that match ``document``, ``schema`` and ``page`` and contain
+        every name in ``columns`` are ever opened. Tables with different schemas are
+        stacked diagonally; columns a table lacks are null.
+
+        Args:
+            document: Document name(s) to include (optional)
+            schema: Schema hash(es) to include, see ``schemas`` (optional)
+            columns: Table columns to read; tables without all of them are
+                skipped (optional, defaults to every column)
+            page: One-based page number(s) the tables were found on, from the
+                location index; tables without a recorded page are skipped
+                (optional)
+
+        Returns:
+            LazyFrame with ``document`` and ``table`` columns followed by the
+            table columns
+        """
+        selected = self._index
+        documents = _as_list(document)
+        if documents is not None:
+            selected = selected.filter(pl.col("document").is_in(documents))
+        schemas = _as_list(schema)
+        if schemas is not None:
+            selected = selected.filter(pl.col("schema").is_in(schemas))
+        if columns is not None:
+            selected = selected.filter(
+                pl.all_horizontal(pl.col("columns").list.contains(name) for name in columns)
+            )
+        pages = _as_list(page)
+        if pages is not None:
+            located = self._locations().filter(pl.col("page").is_in(pages))
+            selected = selected.filter(pl.col("path").is_in(located["path"].to_list()))
+
+        frames = []
+        for (_,), group in selected.group_by(["schema"], maintain_order=True):
+            paths = [str(self.output_dir / name) for name in group["path"]]
+            keys = group.select(pl.Series("_path", paths), "document", "table")
+            frame = pl.scan_parquet(paths, include_file_paths="_path")
+            if columns is not None:
+                frame = frame.select(*columns, "_path")
+            frames.append(
+                frame.join(keys.lazy(), on="_path", how="left")
+                .select("document", "table", pl.exclude("document", "table", "_path"))
+            )
+
+        if not frames:
+            return pl.LazyFrame(schema={"document": pl.Utf8, "table": pl.Int64})
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def _page_tables(self) -> List[Tuple[str, Path]]:
+        """Return (document, path) for every Parquet page table in the directory."""
+        return [
+            (path.name[: -len(PAGE_TABLE_SUFFIX)], path)
+            for path in sorted(self.output_dir.glob(f"*{PAGE_TABLE_SUFFIX}"))
+        ]
+
+    def pages(
+        self,
+        document: Union[str, Iterable[str], None] = None,
+        page: Union[int, Iterable[int], None] = None,
+    ) -> pl.LazyFrame:
+        """
+        Scan the Parquet page tables (``--text-format parquet``) as one lazy frame.
+
+        Page tables hold one page per row group, so a page filter - given
+        here or applied to the returned frame - only reads matching pages.
+
+        Args:
+            document: Document name(s) to include (optional)
+            page: One-based page number(s) to include (optional)
+
+        Returns:
+            LazyFrame with document, page, text, char_count, backend and quality
+            columns; quality is null for page tables written before it was scored
+        """
+        documents = _as_list(document)
+        sources = [
+            (name, path)
+            for name, path in self._page_tables()
+            if documents is None or name in documents
+        ]
+        if not sources:
+            return pl.LazyFrame(schema=_PAGE_SCHEMA)
+
+        frames = []
+        for name, path in sources:
+            frame = pl.scan_parquet(path).with_columns(pl.lit(name).alias("document"))
+            if "quality" not in pq.read_schema(path).names:
+                frame = frame.with_columns(pl.lit(None, dtype=pl.Float64).alias("quality"))
+            frames.append(frame.select(list(_PAGE_SCHEMA)).cast(_PAGE_SCHEMA))
+        frame = pl.concat(frames)
+        pages = _as_list(page)
+        if pages is not None:
+            frame = frame.filter(pl.col("page").is_in(pages))
+        return frame
@@ -1,11 +1,324 @@
 """Command-line interface for PDF extractor."""
 
 import argparse
+import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+from .area_cache import TableAreaCache
+from .batch import SCHEDULE_POLICIES, BatchExtractor
 from .extractor import PDFExtractor
+from .font_cache import process_cache
+from .ipc import write_ipc_stream
+from .page_store import TEXT_FORMATS, page_table_path
+from .profiles import PROFILE_NAMES
+from .jobqueue import JOURNAL_MODES, JobQueue, Worker
+from .search import SearchIndex
+from .server import MAX_BODY_MB, ExtractionServer
+from .table_extractor import TABLE_METHODS
+from .tiles import TILE_THRESHOLD
+
+
+def _report_timeouts(timed_out_pages: List[int]) -> None:
+    """Print the pages skipped because of --page-timeout/--doc-timeout."""
+    if timed_out_pages:
+        pages = ", ".join(str(page) for page in timed_out_pages)
+        print(f"Warning: timed out on page(s) {pages}")
+
+
+def _report_duplicates(duplicate_pages: List[int]) -> None:
+    """Print how many repeated pages reused an identical page's results."""
+    if duplicate_pages:
+        print(f"Reused results for {len(duplicate_pages)} duplicate page(s)")
+
+
+def _report_low_quality(low_quality_pages: List[int]) -> None:
+    """Print the pages whose text scored below the quality threshold."""
+    if low_quality_pages:
+        pages = ", ".join(str(page) for page in low_quality_pages)
+        print(f"Low-quality text on {len(low_quality_pages)} page(s): {pages}")
+
+
+def _report_area_cache(area_cache: Optional[TableAreaCache]) -> None:
+    """Print the table area cache's hit rate when --area-cache-size is set."""
+    if area_cache is not None:
+        stats = area_cache.stats()
+        print(
+            f"Table area cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+            f"({stats['hit_rate']:.0%}), {stats['evictions']} eviction(s)"
+        )
+
+
+def _report_font_cache() -> None:
+    """Print the font cache's hit rate when --font-cache-mb is set."""
+    font_cache = process_cache()
+    if font_cache is not None:
+        stats = font_cache.stats()
+        print(
+            f"Font cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+            f"({stats['hit_rate']:.0%}), {stats['evictions']} eviction(s), "
+            f"{stats['bytes'] / 2**20:.1f} MB"
+        )
+
+
+def _collect_pdfs(inputs: List[str]) -> List[Path]:
+    """Expand input files and directories into a list of PDF paths."""
+    pdf_paths: List[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            pdf_paths.extend(sorted(path.rglob("*.pdf")))
+        elif path.exists():
+            pdf_paths.append(path)
+        else:
+            print(f"Warning: Input '{path}' not found, skipping")
+    return pdf_paths
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """Handle the batch command."""
+    pdf_paths = _collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("Error: No PDF files found")
+        sys.exit(1)
+    
+    batch = BatchExtractor(
+        workers=args.workers,
+        policy=args.schedule,
+        split_pages=args.split_pages or None,
+        page_timeout=args.page_timeout,
+        doc_timeout=args.doc_timeout,
+        search_index=args.search_index,
+        page_cache=args.page_cache,
+        dedupe_pages=args.dedupe_pages,
+        area_cache_size=args.area_cache_size,
+        skip_graphics=args.skip_graphics,
+        font_cache_mb=args.font_cache_mb,
+        profile=args.profile,
+        route=args.route,
+        layout_snapshots=args.layout_snapshots,
+        text_format=args.text_format,
+    )
+    results = batch.run(pdf_paths, args.output_dir)
+    
+    failed = 0
+    for result in results:
+        if result.error:
+            failed += 1
+            print(f"{result.pdf_path}: failed - {result.error}")
+        else:
+            print(
+                f"{result.pdf_path}: {result.characters} characters, "
+                f"{len(result.table_paths)} tables"
+            )
+            _report_timeouts(result.timed_out_pages)
+            _report_duplicates(result.duplicate_pages)
+            _report_low_quality(result.low_quality_pages)
+            if result.skipped_pages:
+                print(f"Skipped {len(result.skipped_pages)} page(s) without text")
+    
+    print(f"Processed {len(results) - failed} of {len(results)} documents into: {args.output_dir}")
+    if failed:
+        sys.exit(1)
+
+
+def _run_enqueue(args: argparse.Namespace) -> None:
+    """Handle the enqueue command."""
+    pdf_paths = _collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("Error: No PDF files found")
+        sys.exit(1)
+    
+    queue = JobQueue(args.queue, journal_mode=args.journal_mode)
+    added = queue.enqueue(pdf_paths, args.output_dir, max_attempts=args.max_attempts)
+    print(f"Queued {added} new job(s) ({len(pdf_paths) - added} already queued)")
+    print(f"Queue status: {queue.stats()}")
+
+
+def _run_worker(args: argparse.Namespace) -> None:
+    """Handle the worker command."""
+    queue = JobQueue(
+        args.queue, lease_seconds=args.lease_seconds, journal_mode=args.journal_mode
+    )
+    worker = Worker(
+        queue,
+        worker_id=args.worker_id,
+        page_timeout=args.page_timeout,
+        doc_timeout=args.doc_timeout,
+        search_index=args.search_index,
+        page_cache=args.page_cache,
+        dedupe_pages=args.dedupe_pages,
+        area_cache_size=args.area_cache_size,
+        skip_graphics=args.skip_graphics,
+        font_cache_mb=args.font_cache_mb,
+        text_format=args.text_format,
+    )
+    completed = worker.run(max_jobs=args.max_jobs)
+    print(f"Worker {worker.worker_id} completed {completed} job(s)")
+    _report_area_cache(worker.extractor.table_extractor.area_cache)
+    _report_font_cache()
+    print(f"Queue status: {queue.stats()}")
+
+
+def _run_serve(args: argparse.Namespace) -> None:
+    """Handle the serve command."""
+    server = ExtractionServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        page_timeout=args.page_timeout,
+        doc_timeout=args.doc_timeout,
+        page_cache=args.page_cache,
+        dedupe_pages=args.dedupe_pages,
+        area_cache_size=args.area_cache_size,
+        skip_graphics=args.skip_graphics,
+        font_cache_mb=args.font_cache_mb,
+        max_body_mb=args.max_body_mb,
+    )
+    host, port = server.address
+    print(f"Serving on http://{host}:{port} with {server.workers} warm worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+def _run_forms(args: argparse.Namespace) -> None:
+    """Handle the extract-forms command."""
+    pdf_paths = _collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("Error: No PDF files found")
+        sys.exit(1)
+    
+    extractor = PDFExtractor()
+    if len(args.inputs) == 1 and not Path(args.inputs[0]).is_dir():
+        frame = extractor.extract_form_fields(pdf_paths[0])
+        summary = f"{frame.height} field(s)"
+    else:
+        frame = extractor.extract_form_records(pdf_paths)
+        summary = f"{frame.height} document(s), {frame.width - 1} field(s)"
+    
+    if args.output:
+        frame.write_parquet(args.output)
+        print(f"Wrote {summary} to: {args.output}")
+    else:
+        print(frame.write_csv(), end="")
+
+
+def _run_grep(args: argparse.Namespace) -> None:
+    """Handle the grep command."""
+    pdf_paths = _collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("Error: No PDF files found")
+        sys.exit(1)
+    
+    extractor = PDFExtractor(
+        page_timeout=args.page_timeout,
+        doc_timeout=args.doc_timeout,
+        page_cache=args.page_cache,
+        skip_graphics=args.skip_graphics,
+        profile=args.profile,
+        font_cache_mb=args.font_cache_mb,
+    )
+    patterns = [args.pattern, *args.regexp]
+    tables_dir = Path(args.tables) if args.tables else None
+    if tables_dir is not None:
+        tables_dir.mkdir(parents=True, exist_ok=True)
+    
+    hits = 0
+    for pdf_path in pdf_paths:
+        for hit in extractor.find_pages(
+            pdf_path, patterns, tables=tables_dir is not None, ignore_case=args.ignore_case
+        ):
+            hits += 1
+            for line in hit.lines or hit.matches:
+                print(f"{pdf_path}:{hit.page}: {line}")
+            if tables_dir is None:
+                continue
+            for i, table in enumerate(hit.tables):
+                name = f"{pdf_path.stem}_page_{hit.page}_table_{i}.parquet"
+                table.write_parquet(tables_dir / name)
+    
+    print(f"{hits} matching page(s) in {len(pdf_paths)} document(s)", file=sys.stderr)
+    if not hits:
+        sys.exit(1)
+
+
+def _run_reextract_table(args: argparse.Namespace) -> None:
+    """Handle the reextract-table command."""
+    if not Path(args.index).exists():
+        print(f"Error: Table index '{args.index}' not found")
+        sys.exit(1)
+    
+    extractor = PDFExtractor(
+        table_method=args.table_method, layout_snapshots=args.layout_snapshots
+    )
+    try:
+        table = extractor.reextract_table(args.index, args.table)
+    except (KeyError, ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    if table is None:
+        print(f"Error: No table found in the indexed area of table {args.table}")
+        sys.exit(1)
+    location = extractor.table_extractor.table_locations[0]
+    print(
+        f"Table {args.table} (page {location.page}, {location.backend}): "
+        f"{table.shape[0]} rows, {table.shape[1]} columns"
+    )
+
+
+def _run_inspect(args: argparse.Namespace) -> None:
+    """Handle the inspect command."""
+    pdf_paths = _collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("Error: No PDF files found")
+        sys.exit(1)
+    
+    extractor = PDFExtractor()
+    profiles = [extractor.inspect(pdf_path) for pdf_path in pdf_paths]
+    if args.json:
+        print(json.dumps([profile.to_dict() for profile in profiles], indent=2))
+        return
+    
+    for profile in profiles:
+        print(
+            f"{profile.pdf_path}: {profile.kind}, {profile.page_count} page(s), "
+            f"{len(profile.text_pages)} with text, "
+            f"{len(profile.image_only_pages)} image-only"
+        )
+        sizes = sorted({(round(page.width), round(page.height)) for page in profile.pages})
+        print(f"  page sizes: {', '.join(f'{w}x{h}' for w, h in sizes) or 'unknown'}")
+        print(
+            f"  fonts: {profile.fonts} ({profile.embedded_fonts} embedded), "
+            f"encrypted: {'yes' if profile.encrypted else 'no'}, "
+            f"revisions: {profile.revisions}"
+        )
+        print(
+            f"  estimated cost: {profile.estimated_cost:.1f} page(s), "
+            f"table backend: {profile.table_method}"
+        )
+
+
+def _run_search(args: argparse.Namespace) -> None:
+    """Handle the search command."""
+    if not Path(args.index).exists():
+        print(f"Error: Search index '{args.index}' not found")
+        sys.exit(1)
+    
+    hits = SearchIndex(args.index).search(args.query, limit=args.limit)
+    if hits.is_empty():
+        print("No matches")
+        return
+    
+    for hit in hits.iter_rows(named=True):
+        snippet = " ".join(hit["snippet"].split())
+        print(f"{hit['document']} page {hit['page']} ({hit['score']:.3f}): {snippet}")
 
 
 def main() -> None:
@@ -13,28 +326,336 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Extract text and tables from PDF files")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
+    # Options shared by all extraction commands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--page-timeout", type=float, help="Skip pages that take longer than this many seconds"
+    )
+    common.add_argument(
+        "--doc-timeout", type=float, help="Stop extracting a document after this many seconds"
+    )
+    common.add_argument(
+        "--page-cache",
+        help="SQLite cache of per-page results; unchanged pages are not extracted again",
+    )
+    common.add_argument(
+        "--dedupe-pages",
+        action="store_true",
+        help="Extract identical pages within a document once and reuse the results",
+    )
+    common.add_argument(
+        "--area-cache-size",
+        type=int,
+        help="Remember table layouts of this many page layouts and skip detection on repeats",
+    )
+    common.add_argument(
+        "--font-cache-mb",
+        type=int,
+        help="Keep parsed fonts across documents in a cache of this many megabytes",
+    )
+    common.add_argument(
+        "--skip-graphics",
+        action="store_true",
+        help="Leave images and vector graphics (curves; for text also lines and rects) "
+        "out of page layout",
+    )
+    
+    # Option for commands that extract text
+    index_options = argparse.ArgumentParser(add_help=False)
+    index_options.add_argument(
+        "--search-index", help="SQLite full-text index to add extracted pages to"
+    )
+    index_options.add_argument(
+        "--text-format",
+        choices=TEXT_FORMATS,
+        default="txt",
+        help="Write text as .txt with a page offset sidecar, or as a Parquet page table",
+    )
+    
+    # Option for single-document commands that extract tables
+    table_options = argparse.ArgumentParser(add_help=False)
+    table_options.add_argument(
+        "--table-method",
+        choices=TABLE_METHODS,
+        default="auto",
+        help=(
+            "Table backend; 'lattice' finds fully ruled tables and 'stream' "
+            "borderless ones without a JVM"
+        ),
+    )
+    
+    # Option for commands that choose backends for text and tables
+    profile_options = argparse.ArgumentParser(add_help=False)
+    profile_options.add_argument(
+        "--profile",
+        choices=PROFILE_NAMES,
+        help="Speed/accuracy profile setting text backends, table methods and "
+        "graphics skipping; an explicit --table-method still takes precedence",
+    )
+    
+    # Option for commands that lay pages out with pdfplumber
+    snapshot_options = argparse.ArgumentParser(add_help=False)
+    snapshot_options.add_argument(
+        "--layout-snapshots",
+        metavar="DIR",
+        help="Save each page's layout objects to DIR and read them from there on later "
+        "runs instead of laying the PDF out again",
+    )
+    
+    # Options for single-document commands that extract text
+    tile_options = argparse.ArgumentParser(add_help=False)
+    tile_options.add_argument(
+        "--tile-threshold",
+        type=int,
+        default=TILE_THRESHOLD,
+        help="Estimated glyphs above which a page is laid out in horizontal tiles "
+        f"(default: {TILE_THRESHOLD}; 0 never tiles)",
+    )
+    tile_options.add_argument(
+        "--tile-workers",
+        type=int,
+        default=1,
+        help="Processes laying out the tiles of a giant page in parallel (default: 1)",
+    )
+    
     # Extract text command
-    text_parser = subparsers.add_parser("extract-text", help="Extract text from PDF")
+    text_parser = subparsers.add_parser(
+        "extract-text",
+        help="Extract text from PDF",
+        parents=[common, index_options, profile_options, tile_options, snapshot_options],
+    )
     text_parser.add_argument("input", help="Input PDF file path")
     text_parser.add_argument("output", nargs="?", help="Output text file path (optional)")
     
     # Extract tables command
-    table_parser = subparsers.add_parser("extract-tables", help="Extract tables from PDF")
+    table_parser = subparsers.add_parser(
+        "extract-tables",
+        help="Extract tables from PDF",
+        parents=[common, table_options, profile_options, snapshot_options],
+    )
     table_parser.add_argument("input", help="Input PDF file path")
     table_parser.add_argument("output_dir", nargs="?", help="Output directory (optional)")
+    table_parser.add_argument(
+        "--arrow-stdout",
+        action="store_true",
+        help="Write tables to stdout as Arrow IPC streams (one per table) instead of Parquet",
+    )
     
     # Extract all command
-    all_parser = subparsers.add_parser("extract-all", help="Extract both text and tables")
+    all_parser = subparsers.add_parser(
+        "extract-all",
+        help="Extract both text and tables",
+        parents=[
+            common, index_options, table_options, profile_options, tile_options, snapshot_options
+        ],
+    )
     all_parser.add_argument("input", help="Input PDF file path")
     all_parser.add_argument("output_dir", nargs="?", help="Output directory (optional)")
     
+    # Extract words command
+    words_parser = subparsers.add_parser(
+        "extract-words",
+        help="Write word (or character) positions to Parquet",
+    )
+    words_parser.add_argument("input", help="Input PDF file path")
+    words_parser.add_argument("output", nargs="?", help="Output .parquet path (optional)")
+    words_parser.add_argument(
+        "--chars", action="store_true", help="Write one row per character instead of per word"
+    )
+    
+    # Extract template record command
+    record_parser = subparsers.add_parser(
+        "extract-record",
+        help="Extract a typed record from a document with a matching template",
+    )
+    record_parser.add_argument("input", help="Input PDF file path")
+    record_parser.add_argument("output", nargs="?", help="Output .json path (default: stdout)")
+    record_parser.add_argument(
+        "--templates", required=True, help="Template JSON/YAML file or directory of them"
+    )
+    
+    # Extract form fields command
+    forms_parser = subparsers.add_parser(
+        "extract-forms",
+        help="Read AcroForm field values without layout analysis",
+    )
+    forms_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input PDF files or directories; one file gives one row per field, "
+        "several give one row per document",
+    )
+    forms_parser.add_argument(
+        "-o", "--output", help="Output .parquet path (default: CSV on stdout)"
+    )
+    
+    # Grep command
+    grep_parser = subparsers.add_parser(
+        "grep",
+        help="Print the pages that match a pattern, laying out only candidate pages",
+        parents=[common, profile_options],
+    )
+    grep_parser.add_argument("pattern", help="Regular expression to search for")
+    grep_parser.add_argument("inputs", nargs="+", help="Input PDF files or directories")
+    grep_parser.add_argument(
+        "-e",
+        "--regexp",
+        action="append",
+        default=[],
+        help="Another pattern; pages matching any pattern are printed",
+    )
+    grep_parser.add_argument(
+        "-i", "--ignore-case", action="store_true", help="Match without regard to case"
+    )
+    grep_parser.add_argument(
+        "--tables", metavar="DIR", help="Write the tables of matching pages here as Parquet"
+    )
+    
+    # Re-extract table command
+    reextract_parser = subparsers.add_parser(
+        "reextract-table",
+        help="Re-extract one table from its indexed area of its page and replace it",
+        parents=[table_options, snapshot_options],
+    )
+    reextract_parser.add_argument(
+        "index", help="Table location index ({name}_tables.index.parquet)"
+    )
+    reextract_parser.add_argument(
+        "table", type=int, help="Table number, as in {name}_table_{i}.parquet"
+    )
+    
+    # Inspect command
+    inspect_parser = subparsers.add_parser(
+        "inspect", help="Profile PDFs without extracting them"
+    )
+    inspect_parser.add_argument("inputs", nargs="+", help="Input PDF files or directories")
+    inspect_parser.add_argument(
+        "--json", action="store_true", help="Print the full per-page profiles as JSON"
+    )
+    
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Extract text and tables from many PDFs in parallel",
+        parents=[common, index_options, profile_options, snapshot_options],
+    )
+    batch_parser.add_argument("inputs", nargs="+", help="Input PDF files or directories")
+    batch_parser.add_argument("-o", "--output-dir", required=True, help="Output directory")
+    batch_parser.add_argument("--workers", type=int, help="Number of worker processes")
+    batch_parser.add_argument(
+        "--schedule",
+        choices=SCHEDULE_POLICIES,
+        default="longest-first",
+        help="Order work longest-first (makespan), shortest-first (latency) or as given",
+    )
+    batch_parser.add_argument(
+        "--split-pages",
+        type=int,
+        default=500,
+        help="Split documents larger than this into page-range tasks (0 disables)",
+    )
+    batch_parser.add_argument(
+        "--route",
+        action="store_true",
+        help="Inspect documents first, skip pages without text and pick the table backend",
+    )
+    
+    # Shared job queue commands
+    queue_options = argparse.ArgumentParser(add_help=False)
+    queue_options.add_argument("queue", help="Path to the SQLite job queue database")
+    queue_options.add_argument(
+        "--journal-mode",
+        choices=JOURNAL_MODES,
+        default="wal",
+        help="Use 'delete' when workers on several hosts share the queue over a network filesystem",
+    )
+    
+    enqueue_parser = subparsers.add_parser(
+        "enqueue", help="Add PDFs to a shared job queue", parents=[queue_options]
+    )
+    enqueue_parser.add_argument("inputs", nargs="+", help="Input PDF files or directories")
+    enqueue_parser.add_argument("-o", "--output-dir", required=True, help="Output directory")
+    enqueue_parser.add_argument(
+        "--max-attempts", type=int, default=3, help="Leases per job before it is marked failed"
+    )
+    
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Process jobs from a shared job queue",
+        parents=[queue_options, common, index_options],
+    )
+    worker_parser.add_argument("--worker-id", help="Unique worker name (default: host:pid:random)")
+    worker_parser.add_argument(
+        "--lease-seconds", type=float, default=300.0, help="Lease length renewed by heartbeats"
+    )
+    worker_parser.add_argument("--max-jobs", type=int, help="Exit after this many jobs")
+    
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local HTTP extraction server with warm workers", parents=[common]
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    serve_parser.add_argument("--workers", type=int, help="Number of worker processes")
+    serve_parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=32,
+        help="Requests allowed to wait for a worker before returning 429",
+    )
+    serve_parser.add_argument(
+        "--max-body-mb",
+        type=int,
+        default=MAX_BODY_MB,
+        help="Largest request body in megabytes before returning 413",
+    )
+    
+    # Search command
+    search_parser = subparsers.add_parser(
+        "search", help="Query a full-text index built with --search-index"
+    )
+    search_parser.add_argument("index", help="Path to the search index database")
+    search_parser.add_argument("query", help="FTS5 query, e.g. 'docket AND \"2024-CV-0001\"'")
+    search_parser.add_argument("--limit", type=int, default=10, help="Maximum number of hits")
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
-    extractor = PDFExtractor()
+    # Commands that do not operate on a single input PDF
+    handlers = {
+        "batch": _run_batch,
+        "enqueue": _run_enqueue,
+        "worker": _run_worker,
+        "serve": _run_serve,
+        "search": _run_search,
+        "extract-forms": _run_forms,
+        "inspect": _run_inspect,
+        "grep": _run_grep,
+        "reextract-table": _run_reextract_table,
+    }
+    if args.command in handlers:
+        handlers[args.command](args)
+        return
+    
+    extractor = PDFExtractor(
+        page_timeout=getattr(args, "page_timeout", None),
+        doc_timeout=getattr(args, "doc_timeout", None),
+        search_index=getattr(args, "search_index", None),
+        page_cache=getattr(args, "page_cache", None),
+        dedupe_pages=getattr(args, "dedupe_pages", False),
+        area_cache_size=getattr(args, "area_cache_size", None),
+        skip_graphics=getattr(args, "skip_graphics", False),
+        font_cache_mb=getattr(args, "font_cache_mb", None),
+        tile_threshold=getattr(args, "tile_threshold", TILE_THRESHOLD) or None,
+        tile_workers=getattr(args, "tile_workers", 1),
+        profile=getattr(args, "profile", None),
+        table_method=getattr(args, "table_method", "auto"),
+        templates=getattr(args, "templates", None),
+        layout_snapshots=getattr(args, "layout_snapshots", None),
+    )
     input_path = Path(args.input)
     
     if not input_path.exists():
@@ -44,10 +665,25 @@ def main() -> None:
     try:
         if args.command == "extract-text":
             output_path = args.output if args.output else None
-            text = extractor.extract_and_save_text(input_path, output_path)
-            output_file = output_path or input_path.with_suffix('.txt')
+            text = extractor.extract_and_save_text(
+                input_path, output_path, format=args.text_format
+            )
+            if args.text_format == "parquet":
+                output_file = output_path or page_table_path(input_path)
+            else:
+                output_file = output_path or input_path.with_suffix('.txt')
             print(f"Text extracted and saved to: {output_file}")
             print(f"Extracted {len(text)} characters")
+            _report_timeouts(extractor.text_extractor.timed_out_pages)
+            _report_duplicates(extractor.text_extractor.duplicate_pages)
+            _report_low_quality(extractor.text_extractor.low_quality_pages)
+        
+        elif args.command == "extract-tables" and args.arrow_stdout:
+            tables = extractor.extract_tables(input_path)
+            for table in tables:
+                write_ipc_stream(table, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+            print(f"Streamed {len(tables)} tables as Arrow IPC", file=sys.stderr)
         
         elif args.command == "extract-tables":
             output_dir = args.output_dir if args.output_dir else None
@@ -55,22 +691,58 @@ def main() -> None:
             print(f"Extracted {len(tables)} tables")
             for i, table in enumerate(tables):
                 print(f"Table {i}: {table.shape[0]} rows, {table.shape[1]} columns")
+            _report_timeouts(extractor.table_extractor.timed_out_pages)
+            _report_duplicates(extractor.table_extractor.duplicate_pages)
+            _report_area_cache(extractor.table_extractor.area_cache)
+        
+        elif args.command == "extract-words":
+            if args.chars:
+                output_file = args.output or input_path.with_suffix(".chars.parquet")
+                count = extractor.extract_and_save_chars(input_path, output_file)
+                print(f"Wrote {count} characters to: {output_file}")
+            else:
+                output_file = args.output or input_path.with_suffix(".words.parquet")
+                count = extractor.extract_and_save_words(input_path, output_file)
+                print(f"Wrote {count} words to: {output_file}")
+        
+        elif args.command == "extract-record":
+            record = extractor.extract_record(input_path)
+            if record is None:
+                print(f"Error: No template matches '{input_path}'")
+                sys.exit(1)
+            payload = json.dumps(record.to_dict(), indent=2)
+            if args.output:
+                Path(args.output).write_text(payload, encoding="utf-8")
+                print(f"Record ({record.template.name}) saved to: {args.output}")
+            else:
+                print(payload)
         
         elif args.command == "extract-all":
             output_dir = Path(args.output_dir) if args.output_dir else input_path.parent
             output_dir.mkdir(exist_ok=True)
             
             # Extract text
-            text_output = output_dir / f"{input_path.stem}.txt"
-            text = extractor.extract_and_save_text(input_path, text_output)
+            if args.text_format == "parquet":
+                text_output = page_table_path(output_dir / input_path.name)
+            else:
+                text_output = output_dir / f"{input_path.stem}.txt"
+            text = extractor.extract_and_save_text(
+                input_path, text_output, format=args.text_format
+            )
             print(f"Text extracted and saved to: {text_output}")
             print(f"Extracted {len(text)} characters")
+            _report_timeouts(extractor.text_extractor.timed_out_pages)
+            _report_duplicates(extractor.text_extractor.duplicate_pages)
+            _report_low_quality(extractor.text_extractor.low_quality_pages)
             
             # Extract tables
             tables = extractor.extract_and_save_tables(input_path, output_dir)
             print(f"Extracted {len(tables)} tables to: {output_dir}")
             for i, table in enumerate(tables):
                 print(f"Table {i}: {table.shape[0]} rows, {table.shape[1]} columns")
+            _report_timeouts(extractor.table_extractor.timed_out_pages)
+            _report_duplicates(extractor.table_extractor.duplicate_pages)
+            _report_area_cache(extractor.table_extractor.area_cache)
     
     except Exception as e:
         print(f"Error: {e}")
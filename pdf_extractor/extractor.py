@@ -1,9 +1,28 @@
 """Main PDF extractor class that combines text and table extraction."""
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Sequence, Union
 import polars as pl
 
+from . import font_cache, forms, glyphs, grep
+from .grep import PageHit
+from .page_store import (
+    TEXT_FORMATS,
+    PageCollector,
+    page_table_path,
+    write_offsets,
+    write_page_table,
+)
+from .area_cache import TableAreaCache
+from .layout_snapshot import LayoutSnapshots
+from .object_filter import RULINGS_ONLY, TEXT_ONLY
+from .page_cache import PageCache
+from .profiles import get_profile
+from .preflight import DocumentProfile, inspect_document
+from .search import SearchIndex
+from .table_index import load_location, update_table_index, write_table_index
+from .templates import Template, TemplateRecord, extract_template, load_templates, match_template
+from .tiles import TILE_THRESHOLD
 from .text_extractor import TextExtractor
 from .table_extractor import TableExtractor
 
@@ -11,10 +30,103 @@ from .table_extractor import TableExtractor
 class PDFExtractor:
     """Main class for extracting text and tabular data from PDF files."""
     
-    def __init__(self) -> None:
-        """Initialize the PDF extractor with text and table extractors."""
-        self.text_extractor = TextExtractor()
-        self.table_extractor = TableExtractor()
+    def __init__(
+        self,
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        search_index: Optional[Union[str, Path]] = None,
+        page_cache: Optional[Union[str, Path]] = None,
+        dedupe_pages: bool = False,
+        table_method: Union[str, Sequence[str]] = "auto",
+        templates: Optional[Union[str, Path, List[Template]]] = None,
+        area_cache_size: Optional[int] = None,
+        skip_graphics: bool = False,
+        tile_threshold: Optional[int] = TILE_THRESHOLD,
+        tile_workers: int = 1,
+        profile: Optional[str] = None,
+        font_cache_mb: Optional[int] = None,
+        layout_snapshots: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize the PDF extractor with text and table extractors.
+        
+        Args:
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per document before extraction stops (optional)
+            search_index: SQLite full-text index to write extracted pages to (optional)
+            page_cache: SQLite cache of per-page results; unchanged pages of a
+                re-extracted document are reused (optional)
+            dedupe_pages: Extract identical pages within a document only once;
+                the repeats are listed in ``duplicate_pages`` on the text and
+                table extractors
+            table_method: Table backend or sequence of backends to try, see
+                ``TableExtractor`` ("auto" by default)
+            templates: Templates for recurring layouts, or a JSON/YAML file or
+                directory to load them from; see ``extract_record`` (optional)
+            area_cache_size: Remember the table layouts of up to this many page
+                layouts, so pages with the same rulings skip table detection;
+                see ``area_cache.TableAreaCache`` (optional)
+            skip_graphics: Leave images and vector graphics out of page
+                layout; text extraction keeps only characters and table
+                extraction keeps characters, lines and rects
+            tile_threshold: Estimated glyph count above which a page's text
+                is laid out in tiles, see ``tiles`` (None never tiles)
+            tile_workers: Processes laying out the tiles of one page
+            profile: Speed/accuracy profile, "fast", "balanced" or "accurate"
+                (see ``profiles``), setting the text backends and fallback,
+                the table methods and graphics skipping. A ``table_method``
+                other than "auto" still takes precedence, and
+                ``skip_graphics=True`` always skips graphics (optional)
+            font_cache_mb: Turn on the process-level cache of parsed fonts
+                with this memory cap in megabytes, so documents that embed
+                the same fonts skip parsing them again; see ``font_cache``.
+                The cache is shared by every extractor in the process (optional)
+            layout_snapshots: Directory of per-document layout snapshots;
+                pages laid out by pdfplumber are saved there and later runs
+                read them instead of the PDF, see ``layout_snapshot`` (optional)
+        """
+        if font_cache_mb:
+            font_cache.enable(font_cache_mb * 1024 * 1024)
+        
+        text_method: Union[str, Sequence[str]] = "auto"
+        fallback = "error"
+        if profile is not None:
+            settings = get_profile(profile)
+            text_method, fallback = settings.text_methods, settings.text_fallback
+            if table_method == "auto":
+                table_method = settings.table_methods
+            skip_graphics = skip_graphics or settings.skip_graphics
+        
+        page_sinks = [SearchIndex(search_index)] if search_index is not None else []
+        cache = PageCache(page_cache) if page_cache is not None else None
+        snapshots = LayoutSnapshots(layout_snapshots) if layout_snapshots is not None else None
+        self.text_extractor = TextExtractor(
+            method=text_method,
+            page_timeout=page_timeout,
+            doc_timeout=doc_timeout,
+            page_sinks=page_sinks,
+            page_cache=cache,
+            dedupe_pages=dedupe_pages,
+            skip_objects=TEXT_ONLY if skip_graphics else None,
+            tile_threshold=tile_threshold,
+            tile_workers=tile_workers,
+            fallback=fallback,
+            layout_snapshots=snapshots,
+        )
+        area_cache = TableAreaCache(area_cache_size) if area_cache_size else None
+        self.table_extractor = TableExtractor(
+            method=table_method,
+            page_timeout=page_timeout,
+            doc_timeout=doc_timeout,
+            page_cache=cache,
+            dedupe_pages=dedupe_pages,
+            area_cache=area_cache,
+            skip_objects=RULINGS_ONLY if skip_graphics else None,
+            layout_snapshots=snapshots,
+        )
+        if isinstance(templates, (str, Path)):
+            templates = load_templates(templates)
+        self.templates: List[Template] = list(templates or [])
     
     def extract_text(self, pdf_path: Union[str, Path]) -> str:
         """
@@ -54,25 +166,49 @@ class PDFExtractor:
     def extract_and_save_text(
         self, 
         pdf_path: Union[str, Path], 
-        output_path: Optional[Union[str, Path]] = None
+        output_path: Optional[Union[str, Path]] = None,
+        format: str = "txt",
     ) -> str:
         """
         Extract text from PDF and save to file.
         
+        With ``format="txt"`` an offset sidecar (``{output}.offsets.parquet``)
+        is written next to the text file; with ``format="parquet"`` the output
+        is a page table with one row per page. Either can be read page by page
+        with ``page_store.PageReader``.
+        
         Args:
             pdf_path: Path to the PDF file
-            output_path: Output file path (optional, defaults to PDF name with .txt extension)
+            output_path: Output file path (optional, defaults to PDF name with
+                .txt or .pages.parquet extension)
+            format: Output format ("txt" or "parquet")
             
         Returns:
             Extracted text content
         """
-        text = self.extract_text(pdf_path)
+        if format not in TEXT_FORMATS:
+            raise ValueError(f"Unknown text format: {format}")
+        
+        collector = PageCollector()
+        self.text_extractor.page_sinks.append(collector)
+        try:
+            text = self.extract_text(pdf_path)
+        finally:
+            self.text_extractor.page_sinks.remove(collector)
         
         if output_path is None:
             pdf_path = Path(pdf_path)
-            output_path = pdf_path.with_suffix('.txt')
+            if format == "parquet":
+                output_path = page_table_path(pdf_path)
+            else:
+                output_path = pdf_path.with_suffix('.txt')
+        
+        if format == "parquet":
+            write_page_table(collector.to_frame(), output_path)
+        else:
+            self.save_text_to_file(text, output_path)
+            write_offsets(collector.to_frame(), text, output_path)
         
-        self.save_text_to_file(text, output_path)
         return text
     
     def extract_and_save_tables(
@@ -83,6 +219,10 @@ class PDFExtractor:
         """
         Extract tables from PDF and save as Parquet files.
         
+        The tables are written as ``{name}_table_{i}.parquet``, with a location
+        index (``{name}_tables.index.parquet``) recording the page, bbox,
+        backend, settings and schema hash of each; see ``reextract_table``.
+        
         Args:
             pdf_path: Path to the PDF file
             output_dir: Output directory (optional, defaults to PDF directory)
@@ -104,5 +244,232 @@ class PDFExtractor:
         for i, table in enumerate(tables):
             output_file = output_dir / f"{pdf_name}_table_{i}.parquet"
             table.write_parquet(output_file)
+        write_table_index(self.table_extractor.table_locations, output_dir, pdf_name)
+        
+        return tables
+    
+    def reextract_table(
+        self, index_path: Union[str, Path], table: int
+    ) -> Optional[pl.DataFrame]:
+        """
+        Re-extract one table listed in a location index and save it in place.
+        
+        Only the table's area of its page is searched, with this extractor's
+        table method ("auto" reuses the recorded backend). The table's
+        Parquet file and its index row are replaced; if no table is found
+        in the area, both are left as they were.
+        
+        Args:
+            index_path: ``{name}_tables.index.parquet`` written with the tables
+            table: Table number, as in ``{name}_table_{table}.parquet``
+        
+        Returns:
+            The re-extracted table, or None if none was found
+        """
+        location, table_path = load_location(index_path, table)
+        frame = self.table_extractor.extract_table(location)
+        if frame is None:
+            return None
+        
+        frame.write_parquet(table_path)
+        update_table_index(index_path, table, self.table_extractor.table_locations[0])
+        return frame
+    
+    def inspect(self, pdf_path: Union[str, Path]) -> DocumentProfile:
+        """
+        Profile a PDF before extracting it.
+        
+        Only the document structure and the raw content streams are read, so
+        this costs milliseconds. The profile reports the page sizes, which
+        pages have text or only images, fonts, encryption, incremental
+        revisions and an estimated extraction cost.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            DocumentProfile of the file
+        """
+        return inspect_document(self._existing(pdf_path))
+    
+    def find_pages(
+        self,
+        pdf_path: Union[str, Path],
+        patterns: Sequence[str],
+        tables: bool = False,
+        ignore_case: bool = False,
+    ) -> List[PageHit]:
+        """
+        Find the pages that match any of the patterns.
+        
+        A first pass decodes only the text operators of each page, without
+        layout; the candidate pages alone are then extracted in full and
+        matched again, so the result agrees with ``extract_text``. See
+        ``grep``.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            patterns: Regular expressions to search for
+            tables: Also extract the tables of each matching page
+            ignore_case: Match without regard to case
+            
+        Returns:
+            One PageHit (page number, matches, matching lines and tables)
+            per matching page
+        """
+        return grep.find_pages(
+            self._existing(pdf_path),
+            patterns,
+            self.text_extractor,
+            self.table_extractor if tables else None,
+            ignore_case=ignore_case,
+        )
+    
+    def extract_record(self, pdf_path: Union[str, Path]) -> Optional[TemplateRecord]:
+        """
+        Extract a typed record from a document that matches one of the templates.
+        
+        Only the matched template's regions are read, which is much cheaper
+        than full-page text and table extraction.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            TemplateRecord with the template's fields and tables, or None if
+            no template matches the document
+        """
+        pdf_path = self._existing(pdf_path)
+        template = match_template(pdf_path, self.templates)
+        if template is None:
+            return None
+        return extract_template(pdf_path, template)
+    
+    def extract_form_fields(self, pdf_path: Union[str, Path]) -> pl.DataFrame:
+        """
+        Read the AcroForm fields of a fillable PDF.
+        
+        Values come straight from the form's field dictionaries, so no page
+        is laid out; a form takes milliseconds.
         
-        return tables
\ No newline at end of file
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            DataFrame with name, type, value and page columns, one row per field
+        """
+        return forms.read_form_fields(self._existing(pdf_path))
+    
+    def extract_form_records(self, pdf_paths: Sequence[Union[str, Path]]) -> pl.DataFrame:
+        """
+        Read the AcroForm fields of many PDFs into one row per document.
+        
+        Args:
+            pdf_paths: PDF files to read
+            
+        Returns:
+            DataFrame with a document column and one column per field name
+        """
+        return forms.form_records([self._existing(pdf_path) for pdf_path in pdf_paths])
+    
+    def extract_chars(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> pl.DataFrame:
+        """
+        Extract character positions as one columnar DataFrame.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: One-based page numbers to read (optional, defaults to all)
+            
+        Returns:
+            DataFrame with page, x0, x1, top, bottom, text, font and size columns
+        """
+        return pl.concat(
+            [pl.DataFrame(schema=glyphs.CHAR_SCHEMA), *self.iter_chars(pdf_path, pages)]
+        )
+    
+    def extract_words(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> pl.DataFrame:
+        """
+        Extract word positions as one columnar DataFrame.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: One-based page numbers to read (optional, defaults to all)
+            
+        Returns:
+            DataFrame with page, x0, x1, top, bottom, text, font and size columns
+        """
+        return pl.concat(
+            [pl.DataFrame(schema=glyphs.WORD_SCHEMA), *self.iter_words(pdf_path, pages)]
+        )
+    
+    def iter_chars(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """Yield one character DataFrame per page, holding only one page at a time."""
+        return glyphs.iter_chars(self._existing(pdf_path), pages)
+    
+    def iter_words(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """Yield one word DataFrame per page, holding only one page at a time."""
+        return glyphs.iter_words(self._existing(pdf_path), pages)
+    
+    def extract_and_save_chars(
+        self,
+        pdf_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        pages: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Stream character positions to a Parquet file, one row group per page.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            output_path: Output file path (optional, defaults to PDF name with
+                .chars.parquet extension)
+            pages: One-based page numbers to read (optional, defaults to all)
+            
+        Returns:
+            Number of characters written
+        """
+        if output_path is None:
+            output_path = Path(pdf_path).with_suffix(".chars.parquet")
+        return glyphs.write_parquet(
+            self.iter_chars(pdf_path, pages), output_path, glyphs.CHAR_SCHEMA
+        )
+    
+    def extract_and_save_words(
+        self,
+        pdf_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        pages: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Stream word positions to a Parquet file, one row group per page.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            output_path: Output file path (optional, defaults to PDF name with
+                .words.parquet extension)
+            pages: One-based page numbers to read (optional, defaults to all)
+            
+        Returns:
+            Number of words written
+        """
+        if output_path is None:
+            output_path = Path(pdf_path).with_suffix(".words.parquet")
+        return glyphs.write_parquet(
+            self.iter_words(pdf_path, pages), output_path, glyphs.WORD_SCHEMA
+        )
+    
+    @staticmethod
+    def _existing(pdf_path: Union[str, Path]) -> Path:
+        """Return the PDF path, raising FileNotFoundError if it does not exist."""
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        return pdf_path
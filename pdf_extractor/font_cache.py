@@ -0,0 +1,299 @@
+"""Process-level cache of parsed fonts shared across documents.
+
+pdfminer caches font objects per document only, so every ``pdfplumber.open``
+parses each font again: its ToUnicode CMap (a PostScript program run
+through pdfminer's pure-Python parser), its embedded TrueType program for
+CID fonts, its widths. Documents from one producer usually embed the same
+fonts byte for byte, and in a warm worker going through one vendor's
+invoices that parsing is a large share of page layout.
+
+``FontCache`` keeps parsed fonts for the lifetime of the process, keyed by
+a hash of the font dictionary with every stream in it (font program,
+ToUnicode CMap, encoding) hashed by content, so two documents share a
+font object only when their font definitions are identical. The cache
+has a memory cap and evicts the least recently used fonts. Predefined
+CMaps (``Identity-H``, CJK encodings) are already cached process-wide by
+pdfminer's ``CMapDB`` and are not counted.
+
+``enable`` turns the cache on for the process and ``attach`` installs it
+on a freshly opened pdfplumber document by replacing its resource
+manager. The cache is off until enabled.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import logging
+import threading
+
+try:
+    from pdfminer.pdfinterp import PDFResourceManager
+    from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
+    from pdfminer.psparser import PSLiteral
+except ImportError:
+    PDFResourceManager = object
+
+logger = logging.getLogger(__name__)
+
+# Default memory cap of the process-level cache
+FONT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Rough cost of a font object and of each width or Unicode mapping it holds
+# (a TrueType subset with ~200 glyphs measures about 30 KB under tracemalloc)
+_BASE_BYTES = 2048
+_ENTRY_BYTES = 100
+
+# Font dictionaries nested deeper than this (Type3 resources) are not cached
+_MAX_DEPTH = 12
+
+
+def font_key(spec: Any) -> Optional[str]:
+    """
+    Hash a font dictionary and everything it references.
+
+    Streams are hashed by their raw (still encoded) bytes and their
+    dictionary, indirect references by what they point to.
+
+    Args:
+        spec: pdfminer font dictionary
+
+    Returns:
+        Hex digest, or None if the dictionary cannot be hashed
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        _feed(digest, spec, 0)
+    except Exception as e:
+        logger.debug(f"Not caching font: {e}")
+        return None
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, obj: Any, depth: int) -> None:
+    """Add one PDF object to a font digest, recursively."""
+    if depth > _MAX_DEPTH:
+        raise ValueError("font dictionary is nested too deeply")
+    obj = resolve1(obj)
+    if isinstance(obj, PDFStream):
+        _feed(digest, obj.attrs, depth + 1)
+        # rawdata is dropped once pdfminer has decoded the stream
+        if obj.rawdata is not None:
+            data, marker = obj.rawdata, b"R"
+        else:
+            data, marker = obj.get_data(), b"S"
+        digest.update(b"%s%d:" % (marker, len(data)))
+        digest.update(data)
+    elif isinstance(obj, dict):
+        digest.update(b"D%d:" % len(obj))
+        for key in sorted(obj, key=str):
+            digest.update(str(key).encode("utf-8", "replace") + b"=")
+            _feed(digest, obj[key], depth + 1)
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"A%d:" % len(obj))
+        for item in obj:
+            _feed(digest, item, depth + 1)
+    elif isinstance(obj, bytes):
+        digest.update(b"B%d:" % len(obj))
+        digest.update(obj)
+    elif isinstance(obj, PSLiteral):
+        digest.update(b"N" + repr(obj.name).encode("utf-8", "replace"))
+    else:
+        digest.update(b"V" + repr(obj).encode("utf-8", "replace"))
+
+
+def estimate_size(font: Any) -> int:
+    """
+    Approximate the memory held by a parsed font, in bytes.
+
+    Counts the widths, vertical displacements and ToUnicode mappings the
+    font holds. Base encodings are shared pdfminer tables and not counted.
+    """
+    entries = len(getattr(font, "widths", ())) + len(getattr(font, "disps", ()))
+    entries += len(getattr(getattr(font, "unicode_map", None), "cid2unichr", ()))
+    return _BASE_BYTES + entries * _ENTRY_BYTES
+
+
+def _detached(value: Any) -> Any:
+    """Copy a dictionary or array without its references into a document."""
+    if isinstance(value, dict):
+        return {
+            key: _detached(item)
+            for key, item in value.items()
+            if not isinstance(item, (PDFObjRef, PDFStream))
+        }
+    if isinstance(value, list):
+        return [_detached(item) for item in value if not isinstance(item, (PDFObjRef, PDFStream))]
+    return value
+
+
+def _detach(font: Any) -> None:
+    """
+    Drop a font's references into its document.
+
+    pdfminer reads the descriptor and font program only while building the
+    font. Object references hold their document, so a cached font that kept
+    them would keep every document it came from alive.
+    """
+    font.descriptor = _detached(font.descriptor)
+    if hasattr(font, "cidsysteminfo"):
+        font.cidsysteminfo = _detached(font.cidsysteminfo)
+    vars(font).pop("fontfile", None)
+
+
+class FontCache:
+    """LRU cache of parsed pdfminer fonts keyed by font definition hash, capped by memory."""
+
+    def __init__(self, max_bytes: int = FONT_CACHE_BYTES) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Approximate memory the cached fonts may take before
+                the least recently used are evicted
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Number of cached fonts."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the cached font for a key (or None), counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, font: Any) -> None:
+        """Cache a parsed font, evicting the least recently used fonts over the cap."""
+        size = estimate_size(font)
+        if size > self.max_bytes:
+            return
+        _detach(font)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (font, size)
+            self.size += size
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the memory cap, evicting fonts if the cache is now over it."""
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every cached font."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _evict(self) -> None:
+        """Evict the least recently used fonts until the cache fits its cap."""
+        while self.size > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hits, misses, hit rate, evictions, current size and memory estimate."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+        }
+
+
+class CachingResourceManager(PDFResourceManager):
+    """pdfminer resource manager that looks fonts up in a ``FontCache`` first."""
+
+    def __init__(self, font_cache: FontCache) -> None:
+        super().__init__(caching=True)
+        self.font_cache = font_cache
+
+    def get_font(self, objid: object, spec: Any) -> Any:
+        """Return a font from this document's fonts, the shared cache, or parse it."""
+        # Direct (unnumbered) font dictionaries and the descendants of
+        # Type0 fonts are left to pdfminer
+        if not objid or objid in self._cached_fonts:
+            return super().get_font(objid, spec)
+
+        key = font_key(spec)
+        font = self.font_cache.get(key) if key is not None else None
+        if font is None:
+            font = super().get_font(objid, spec)
+            if key is not None:
+                self.font_cache.put(key, font)
+        else:
+            self._cached_fonts[objid] = font
+        return font
+
+
+# This process's font cache, None until enabled
+_font_cache: Optional[FontCache] = None
+
+
+def enable(max_bytes: int = FONT_CACHE_BYTES) -> FontCache:
+    """
+    Turn on the process-level font cache, or change its memory cap.
+
+    Args:
+        max_bytes: Approximate memory the cached fonts may take
+
+    Returns:
+        The process's font cache
+    """
+    global _font_cache
+    if _font_cache is None:
+        _font_cache = FontCache(max_bytes)
+    elif _font_cache.max_bytes != max_bytes:
+        _font_cache.resize(max_bytes)
+    return _font_cache
+
+
+def disable() -> None:
+    """Turn off the process-level font cache and drop its fonts."""
+    global _font_cache
+    _font_cache = None
+
+
+def process_cache() -> Optional[FontCache]:
+    """Return this process's font cache (None when disabled)."""
+    return _font_cache
+
+
+def attach(pdf: Any) -> None:
+    """
+    Make a freshly opened pdfplumber document use the process's font cache.
+
+    Call this before any page is laid out; it does nothing while the cache
+    is disabled.
+    """
+    if _font_cache is not None:
+        pdf.rsrcmgr = CachingResourceManager(_font_cache)
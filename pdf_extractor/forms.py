@@ -0,0 +1,173 @@
+"""AcroForm field extraction straight from the document's object tree.
+
+Fillable forms keep their data in the AcroForm field dictionaries, so the
+values can be read with PyPDF2 from ``/Root/AcroForm/Fields`` without
+interpreting any page content or running layout analysis. Reading a form
+this way costs a few milliseconds, most of it parsing the file's xref.
+
+Only AcroForm fields are read; XFA-only forms, whose data lives in an XML
+stream, yield no fields.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import logging
+
+import polars as pl
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+logger = logging.getLogger(__name__)
+
+FIELD_SCHEMA = {
+    "name": pl.Utf8,
+    "type": pl.Utf8,
+    "value": pl.Utf8,
+    "page": pl.Int32,
+}
+
+# Field flags (PDF 32000-1, table 226) that tell button kinds apart
+_FLAG_RADIO = 1 << 15
+_FLAG_PUSHBUTTON = 1 << 16
+_FLAG_COMBO = 1 << 17
+
+
+def _resolve(obj: Any) -> Any:
+    """Return the object an indirect reference points to."""
+    return obj.get_object() if obj is not None else None
+
+
+def _field_type(field_type: Optional[str], flags: int) -> Optional[str]:
+    """Map a field's /FT and /Ff entries to a readable type name."""
+    if field_type == "/Tx":
+        return "text"
+    if field_type == "/Btn":
+        if flags & _FLAG_PUSHBUTTON:
+            return "pushbutton"
+        return "radio" if flags & _FLAG_RADIO else "checkbox"
+    if field_type == "/Ch":
+        return "combo" if flags & _FLAG_COMBO else "list"
+    if field_type == "/Sig":
+        return "signature"
+    return None
+
+
+def _field_value(value: Any) -> Optional[str]:
+    """Convert a field's /V entry to text; names lose their slash, lists are joined."""
+    if value is None:
+        return None
+    if isinstance(value, PyPDF2.generic.IndirectObject):
+        value = value.get_object()
+    if isinstance(value, PyPDF2.generic.NameObject):
+        return str(value)[1:]
+    if isinstance(value, PyPDF2.generic.ByteStringObject):
+        return bytes(value).decode("latin-1")
+    if isinstance(value, list):
+        return "; ".join(filter(None, (_field_value(item) for item in value)))
+    if isinstance(value, PyPDF2.generic.DictionaryObject):
+        return None  # signature dictionaries hold no text value
+    return str(value)
+
+
+def _walk_fields(
+    refs: Sequence[Any], prefix: str = "", inherited: Optional[Dict[str, Any]] = None
+) -> Iterator[Tuple[str, Any, Dict[str, Any]]]:
+    """
+    Yield (full name, field dictionary, inherited entries) for terminal fields.
+
+    /FT, /Ff and /V are inheritable, so they are passed down the field tree.
+    Kids without a /T entry are widget annotations of their parent field,
+    which makes the parent terminal.
+    """
+    inherited = inherited or {}
+    for ref in refs:
+        field = ref.get_object()
+        name = str(field["/T"]) if "/T" in field else ""
+        full_name = f"{prefix}.{name}" if prefix and name else prefix or name
+        entries = dict(inherited)
+        for key in ("/FT", "/Ff", "/V"):
+            if key in field:
+                entries[key] = field[key]
+
+        kids = [kid for kid in _resolve(field.get("/Kids")) or [] if "/T" in kid.get_object()]
+        if kids:
+            yield from _walk_fields(kids, full_name, entries)
+        else:
+            yield full_name, field, entries
+
+
+def _widget_page(field: Any, pages: Dict[int, int]) -> Optional[int]:
+    """Find the one-based page of a field's (first) widget from its /P reference."""
+    widgets = [field, *(kid.get_object() for kid in _resolve(field.get("/Kids")) or [])]
+    for widget in widgets:
+        if "/P" in widget:
+            ref = widget.raw_get("/P")
+            if isinstance(ref, PyPDF2.generic.IndirectObject):
+                return pages.get(ref.idnum)
+    return None
+
+
+def read_form_fields(pdf_path: Union[str, Path]) -> pl.DataFrame:
+    """
+    Read the AcroForm fields of a PDF without laying out any page.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        DataFrame with one row per terminal field: full (dotted) name, type
+        ("text", "checkbox", "radio", "pushbutton", "combo", "list" or
+        "signature"), value as text and the one-based page of its widget.
+        Documents without a form give an empty frame.
+    """
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is required to read form fields")
+
+    reader = PyPDF2.PdfReader(str(pdf_path))
+    form = _resolve(_resolve(reader.trailer["/Root"]).get("/AcroForm"))
+    if form is None:
+        return pl.DataFrame(schema=FIELD_SCHEMA)
+
+    pages = {
+        page.indirect_reference.idnum: number
+        for number, page in enumerate(reader.pages, start=1)
+        if page.indirect_reference is not None
+    }
+
+    rows: Dict[str, List[Any]] = {column: [] for column in FIELD_SCHEMA}
+    for name, field, entries in _walk_fields(_resolve(form.get("/Fields")) or []):
+        rows["name"].append(name)
+        rows["type"].append(_field_type(entries.get("/FT"), int(entries.get("/Ff", 0))))
+        rows["value"].append(_field_value(entries.get("/V")))
+        rows["page"].append(_widget_page(field, pages))
+    return pl.DataFrame(rows, schema=FIELD_SCHEMA)
+
+
+def form_records(pdf_paths: Sequence[Union[str, Path]]) -> pl.DataFrame:
+    """
+    Read the form fields of many PDFs into one row per document.
+
+    Args:
+        pdf_paths: PDF files to read
+
+    Returns:
+        DataFrame with a ``document`` column followed by one text column per
+        field name, in order of first appearance; fields a document lacks are
+        null. Documents that cannot be read are logged and keep a row of nulls.
+    """
+    frames = []
+    for pdf_path in pdf_paths:
+        row: Dict[str, Optional[str]] = {"document": str(pdf_path)}
+        try:
+            fields = read_form_fields(pdf_path)
+            row.update(zip(fields["name"].to_list(), fields["value"].to_list()))
+        except Exception as e:
+            logger.warning(f"Could not read form fields of {pdf_path}: {e}")
+        frames.append(pl.DataFrame([row], schema={name: pl.Utf8 for name in row}))
+
+    if not frames:
+        return pl.DataFrame(schema={"document": pl.Utf8})
+    return pl.concat(frames, how="diagonal")
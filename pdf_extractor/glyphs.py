@@ -0,0 +1,225 @@
+"""Character and word positions as columnar Polars frames.
+
+pdfplumber's ``page.chars`` and ``page.extract_words()`` return one Python
+dict per glyph, which for large documents means tens of millions of dicts.
+Here each page is laid out by pdfminer once, its characters are read straight
+into column buffers, and the layout objects are dropped before the next page.
+Coordinates are stored as Float32 and font names as Categorical, so a
+character costs roughly 30 bytes in the resulting frame.
+
+Coordinates follow pdfplumber: points from the top-left corner of the page,
+with ``top``/``bottom`` measured downwards.
+"""
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+import polars as pl
+import pyarrow.parquet as pq
+
+try:
+    import pdfplumber
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.layout import LTChar, LTContainer
+    from pdfminer.pdfinterp import PDFPageInterpreter
+except ImportError:
+    pdfplumber = None
+
+from . import font_cache
+
+X_TOLERANCE = 3.0
+Y_TOLERANCE = 3.0
+
+CHAR_SCHEMA = {
+    "page": pl.Int32,
+    "x0": pl.Float32,
+    "x1": pl.Float32,
+    "top": pl.Float32,
+    "bottom": pl.Float32,
+    "text": pl.Utf8,
+    "font": pl.Categorical,
+    "size": pl.Float32,
+}
+WORD_SCHEMA = CHAR_SCHEMA
+
+
+def _walk_chars(item: Any) -> Iterator[Any]:
+    """Yield the characters of a layout item in content-stream order."""
+    for child in item:
+        if isinstance(child, LTChar):
+            yield child
+        elif isinstance(child, LTContainer):
+            yield from _walk_chars(child)
+
+
+def page_chars(pdf: Any, page_number: int) -> pl.DataFrame:
+    """
+    Read the characters of one page into a frame.
+
+    Args:
+        pdf: Open pdfplumber PDF
+        page_number: One-based page number
+
+    Returns:
+        Frame with CHAR_SCHEMA columns, in content-stream order
+    """
+    page = pdf.pages[page_number - 1]
+    device = PDFPageAggregator(pdf.rsrcmgr, pageno=page_number, laparams=None)
+    PDFPageInterpreter(pdf.rsrcmgr, device).process_page(page.page_obj)
+    layout = device.get_result()
+
+    # pdfminer coordinates start at the bottom-left corner of the page
+    height = layout.y1
+    columns: List[List[Any]] = [[], [], [], [], [], [], []]
+    x0, x1, top, bottom, text, font, size = columns
+    for char in _walk_chars(layout):
+        x0.append(char.x0)
+        x1.append(char.x1)
+        top.append(height - char.y1)
+        bottom.append(height - char.y0)
+        text.append(char.get_text())
+        font.append(char.fontname)
+        size.append(char.size)
+
+    return pl.DataFrame(
+        {
+            "page": pl.repeat(page_number, len(text), dtype=pl.Int32, eager=True),
+            "x0": x0,
+            "x1": x1,
+            "top": top,
+            "bottom": bottom,
+            "text": text,
+            "font": font,
+            "size": size,
+        },
+        schema=CHAR_SCHEMA,
+    )
+
+
+def chars_to_words(
+    chars: pl.DataFrame,
+    x_tolerance: float = X_TOLERANCE,
+    y_tolerance: float = Y_TOLERANCE,
+) -> pl.DataFrame:
+    """
+    Group the characters of one page into words, as ``extract_words`` does.
+
+    Characters whose tops lie within ``y_tolerance`` form a line; along a
+    line, whitespace or a gap wider than ``x_tolerance`` ends a word. Only
+    upright text is handled.
+
+    Args:
+        chars: Frame of one page's characters (CHAR_SCHEMA)
+        x_tolerance: Largest gap between characters of one word
+        y_tolerance: Largest difference in top between characters of one line
+
+    Returns:
+        Frame with WORD_SCHEMA columns in reading order; font and size are
+        those of the first character of each word
+    """
+    if chars.is_empty():
+        return pl.DataFrame(schema=WORD_SCHEMA)
+
+    blank = pl.col("text").str.contains(r"^\s*$")
+    return (
+        chars.sort("top", maintain_order=True)
+        .with_columns(
+            (pl.col("top").diff().fill_null(0) > y_tolerance).cum_sum().alias("_line")
+        )
+        .sort("_line", "x0", maintain_order=True)
+        .with_columns(blank.alias("_blank"))
+        .with_columns(
+            (
+                (pl.col("_line") != pl.col("_line").shift())
+                | (pl.col("x0") - pl.col("x1").shift() > x_tolerance)
+                | pl.col("_blank")
+                | pl.col("_blank").shift()
+            )
+            .fill_null(True)
+            .cum_sum()
+            .alias("_word")
+        )
+        .filter(~pl.col("_blank"))
+        .group_by("_word", maintain_order=True)
+        .agg(
+            pl.col("page").first(),
+            pl.col("x0").min(),
+            pl.col("x1").max(),
+            pl.col("top").min(),
+            pl.col("bottom").max(),
+            pl.col("text").str.join(""),
+            pl.col("font").first(),
+            pl.col("size").first(),
+        )
+        .select(list(WORD_SCHEMA))
+    )
+
+
+def _page_numbers(pdf: Any, pages: Optional[Sequence[int]]) -> List[int]:
+    """Return the requested one-based pages, or every page of the document."""
+    return list(pages) if pages is not None else list(range(1, len(pdf.pages) + 1))
+
+
+def iter_chars(
+    pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+) -> Iterator[pl.DataFrame]:
+    """
+    Yield one character frame per page.
+
+    Args:
+        pdf_path: Path to the PDF file
+        pages: One-based page numbers to read (optional, defaults to all)
+    """
+    if pdfplumber is None:
+        raise ImportError("pdfplumber is required for character extraction")
+
+    with pdfplumber.open(pdf_path) as pdf:
+        font_cache.attach(pdf)
+        for page_number in _page_numbers(pdf, pages):
+            yield page_chars(pdf, page_number)
+            # Drop pdfplumber's cached page object before moving on
+            pdf.pages[page_number - 1].close()
+
+
+def iter_words(
+    pdf_path: Union[str, Path],
+    pages: Optional[Sequence[int]] = None,
+    x_tolerance: float = X_TOLERANCE,
+    y_tolerance: float = Y_TOLERANCE,
+) -> Iterator[pl.DataFrame]:
+    """
+    Yield one word frame per page.
+
+    Args:
+        pdf_path: Path to the PDF file
+        pages: One-based page numbers to read (optional, defaults to all)
+        x_tolerance: Largest gap between characters of one word
+        y_tolerance: Largest difference in top between characters of one line
+    """
+    for chars in iter_chars(pdf_path, pages):
+        yield chars_to_words(chars, x_tolerance, y_tolerance)
+
+
+def write_parquet(
+    frames: Iterable[pl.DataFrame], output_path: Union[str, Path], schema: dict
+) -> int:
+    """
+    Write page frames to one Parquet file as they arrive, one row group per page.
+
+    Args:
+        frames: Page frames, e.g. from ``iter_chars`` or ``iter_words``
+        output_path: Output .parquet path
+        schema: Schema of the frames (CHAR_SCHEMA or WORD_SCHEMA)
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    empty = pl.DataFrame(schema=schema).to_arrow()
+    with pq.ParquetWriter(str(output_path), empty.schema) as writer:
+        for frame in frames:
+            if frame.is_empty():
+                continue
+            writer.write_table(frame.to_arrow().cast(empty.schema))
+            rows += frame.height
+    return rows
@@ -0,0 +1,263 @@
+"""Find the pages that match patterns without laying out every page.
+
+Searching a large corpus for a docket number only needs the few pages that
+mention it. ``find_pages`` works in two passes:
+
+1. Every page's content streams are interpreted with the path operators
+   stripped (see ``object_filter``), by a device that only decodes the
+   string operands of text-showing operators through their fonts. No
+   character objects, layout or images are built. Each page gives two
+   strings: one with the pieces run together, one with a space wherever a
+   text operator or a wide ``TJ`` gap separates them. A page is a candidate
+   when any pattern matches either, so words split across operators and
+   words separated only by positioning are both found.
+2. The candidate pages alone go through the full ``TextExtractor`` (and
+   ``TableExtractor`` when tables are requested). The patterns are matched
+   again on the real page text, which drops false candidates, and the
+   matching lines are returned.
+
+Text inside form XObjects is found too, because the interpreter recurses
+into them. Text drawn as paths or images (scans) is not.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple, Union
+import logging
+import re
+
+import polars as pl
+
+try:
+    import pdfplumber
+    from pdfminer.pdfdevice import PDFDevice
+    from pdfminer.pdffont import PDFUnicodeNotDefined
+except ImportError:
+    pdfplumber = None
+    PDFDevice = object
+
+from . import font_cache
+from .object_filter import TEXT_ONLY, FilteringInterpreter
+from .page_store import PageCollector
+from .utils import select_pages
+
+logger = logging.getLogger(__name__)
+
+# TJ adjustments (thousandths of an em) wider than this count as a space
+_SPACE_ADJUSTMENT = 200
+
+
+@dataclass
+class PageHit:
+    """A page whose extracted text matches at least one pattern."""
+
+    pdf_path: Path
+    page: int
+    matches: List[str]
+    lines: List[str]
+    tables: List[pl.DataFrame] = field(default_factory=list)
+
+
+class _TextCollector(PDFDevice):
+    """Device that keeps the decoded text of each text-showing operator and nothing else."""
+
+    # Tells FilteringInterpreter to strip every path operator
+    skip = frozenset(TEXT_ONLY)
+
+    def __init__(self, rsrcmgr: Any) -> None:
+        super().__init__(rsrcmgr)
+        self.tight: List[str] = []
+        self.spaced: List[str] = []
+        # Decoded characters by font object id and character id
+        self._chars: Dict[int, Dict[int, str]] = {}
+
+    def render_string(self, textstate: Any, seq: Any, ncs: Any, graphicstate: Any) -> None:
+        """Decode one string or TJ array through the current font."""
+        font = textstate.font
+        chars = self._chars.setdefault(id(font), {})
+        for obj in seq:
+            if isinstance(obj, bytes):
+                cids = font.decode(obj)
+                missing = [cid for cid in cids if cid not in chars]
+                for cid in missing:
+                    try:
+                        chars[cid] = font.to_unichr(cid)
+                    except PDFUnicodeNotDefined:
+                        chars[cid] = ""
+                text = "".join([chars[cid] for cid in cids])
+                self.tight.append(text)
+                self.spaced.append(text)
+            elif isinstance(obj, (int, float)) and -obj > _SPACE_ADJUSTMENT:
+                self.spaced.append(" ")
+        self.spaced.append(" ")
+
+
+def compile_patterns(
+    patterns: Sequence[Union[str, Pattern[str]]], ignore_case: bool = False
+) -> List[Pattern[str]]:
+    """
+    Compile search patterns.
+
+    Args:
+        patterns: Regular expressions (strings or compiled)
+        ignore_case: Match without regard to case; compiled patterns are
+            recompiled with ``re.IGNORECASE`` added to their own flags
+
+    Returns:
+        Compiled patterns
+    """
+    if not patterns:
+        raise ValueError("At least one pattern is required")
+    flags = re.IGNORECASE if ignore_case else 0
+    return [
+        re.compile(pattern.pattern, pattern.flags | flags)
+        if isinstance(pattern, re.Pattern)
+        else re.compile(pattern, flags)
+        for pattern in patterns
+    ]
+
+
+def stream_text(page: Any) -> Tuple[str, str]:
+    """
+    Decode the text a pdfplumber page shows, without laying it out.
+
+    Returns:
+        (text with the pieces run together, text with spaces between them)
+    """
+    device = _TextCollector(page.pdf.rsrcmgr)
+    FilteringInterpreter(page.pdf.rsrcmgr, device).process_page(page.page_obj)
+    return "".join(device.tight), "".join(device.spaced)
+
+
+def candidate_pages(
+    pdf_path: Union[str, Path],
+    patterns: Sequence[Pattern[str]],
+    pages: Optional[Sequence[int]] = None,
+) -> List[int]:
+    """
+    First pass: pages whose content-stream text matches any pattern.
+
+    Pages that cannot be decoded are kept as candidates, so the full
+    extraction decides.
+
+    Args:
+        pdf_path: Path to the PDF file
+        patterns: Compiled patterns
+        pages: One-based page numbers to search (optional, defaults to all)
+
+    Returns:
+        One-based candidate page numbers, ascending
+    """
+    if pdfplumber is None:
+        raise ImportError("pdfplumber is required to find pages")
+
+    candidates = []
+    with pdfplumber.open(pdf_path) as pdf:
+        font_cache.attach(pdf)
+        for page_num in select_pages(len(pdf.pages), pages):
+            try:
+                texts = stream_text(pdf.pages[page_num - 1])
+            except Exception as e:
+                logger.warning(f"Could not decode page {page_num} of {pdf_path}: {e}")
+                candidates.append(page_num)
+                continue
+            if any(pattern.search(text) for pattern in patterns for text in texts):
+                candidates.append(page_num)
+    return candidates
+
+
+def match_page(
+    text: str, patterns: Sequence[Pattern[str]]
+) -> Tuple[List[str], List[str]]:
+    """
+    Second pass: match the patterns on a page's extracted text.
+
+    Returns:
+        (matched strings, lines containing a match), both in page order
+    """
+    matches: List[str] = []
+    lines: List[str] = []
+    for line in text.splitlines():
+        found = [m.group() for pattern in patterns for m in pattern.finditer(line)]
+        if found:
+            matches.extend(found)
+            lines.append(line)
+    if not matches:
+        # Patterns that span lines
+        matches = [m.group() for pattern in patterns for m in pattern.finditer(text)]
+    return matches, lines
+
+
+def find_pages(
+    pdf_path: Union[str, Path],
+    patterns: Sequence[Union[str, Pattern[str]]],
+    text_extractor: Any,
+    table_extractor: Any = None,
+    pages: Optional[Sequence[int]] = None,
+    ignore_case: bool = False,
+) -> List[PageHit]:
+    """
+    Find the pages of a PDF that match any pattern, laying out only candidates.
+
+    Args:
+        pdf_path: Path to the PDF file
+        patterns: Regular expressions to search for
+        text_extractor: ``TextExtractor`` run on the candidate pages
+        table_extractor: ``TableExtractor`` run once on the matching pages (optional)
+        pages: One-based page numbers to search (optional, defaults to all)
+        ignore_case: Match without regard to case
+
+    Returns:
+        One PageHit per matching page, in page order
+    """
+    compiled = compile_patterns(patterns, ignore_case)
+    candidates = candidate_pages(pdf_path, compiled, pages)
+    if not candidates:
+        return []
+
+    texts = _page_texts(pdf_path, candidates, text_extractor)
+    hits = []
+    for page_num in candidates:
+        matches, lines = match_page(texts.get(page_num, ""), compiled)
+        if matches:
+            hits.append(PageHit(Path(pdf_path), page_num, matches, lines))
+
+    if table_extractor is not None and hits:
+        tables = _page_tables(pdf_path, [hit.page for hit in hits], table_extractor)
+        for hit in hits:
+            hit.tables = tables.get(hit.page, [])
+    return hits
+
+
+def _page_texts(
+    pdf_path: Union[str, Path], page_nums: List[int], text_extractor: Any
+) -> Dict[int, str]:
+    """Extract the given pages and return their text by page number."""
+    collector = PageCollector()
+    text_extractor.page_sinks.append(collector)
+    try:
+        text_extractor.extract(pdf_path, page_nums)
+    finally:
+        text_extractor.page_sinks.remove(collector)
+    return {page: record["text"] for page, record in collector.records.items()}
+
+
+def _page_tables(
+    pdf_path: Union[str, Path], page_nums: List[int], table_extractor: Any
+) -> Dict[int, List[pl.DataFrame]]:
+    """
+    Extract tables from the given pages in one run and group them by page.
+
+    Tables are assigned to pages through ``table_locations``. If any table
+    has no recorded page, which happens when tabula cannot locate its
+    tables, each page is extracted on its own instead.
+    """
+    tables = table_extractor.extract(pdf_path, page_nums)
+    locations = table_extractor.table_locations
+    if len(locations) != len(tables) or any(loc.page is None for loc in locations):
+        return {page: table_extractor.extract(pdf_path, [page]) for page in page_nums}
+
+    by_page: Dict[int, List[pl.DataFrame]] = {}
+    for table, location in zip(tables, locations):
+        by_page.setdefault(location.page, []).append(table)
+    return by_page
@@ -0,0 +1,160 @@
+"""Hand extraction results between processes as memory-mapped Arrow IPC.
+
+Returning DataFrames and strings from a worker process normally means
+pickling them, copying them through a pipe and unpickling them. Instead,
+``export_result`` writes tables as Arrow IPC streams and text as UTF-8 bytes
+into one spool file on a RAM-backed filesystem (``/dev/shm`` where available).
+Only a small handle is pickled back to the parent. ``import_result`` memory
+maps the file and reads the tables straight out of the mapping.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, cast
+import os
+import tempfile
+import uuid
+
+import polars as pl
+import pyarrow as pa
+
+SPOOL_PREFIX = "pdf-extractor-"
+
+
+def default_spool_dir() -> Path:
+    """Return ``/dev/shm`` when it is usable, otherwise the temp directory."""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+class SharedResult:
+    """Picklable handle to a result written by ``export_result``."""
+
+    def __init__(
+        self,
+        path: str,
+        text: Optional[Tuple[int, int]],
+        tables: List[Tuple[int, int]],
+    ) -> None:
+        """
+        Initialize a handle.
+
+        Args:
+            path: Spool file holding the result
+            text: (offset, length) of the UTF-8 text, or None if there is no text
+            tables: (offset, length) of each table's Arrow IPC stream
+        """
+        self.path = path
+        self.text = text
+        self.tables = tables
+
+    def discard(self) -> None:
+        """Delete the spool file without reading it."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def export_result(
+    text: Optional[str],
+    tables: List[pl.DataFrame],
+    spool_dir: Optional[Path] = None,
+) -> SharedResult:
+    """
+    Write text and tables to a spool file for another process to map.
+
+    Args:
+        text: Extracted text (optional)
+        tables: Extracted tables
+        spool_dir: Directory for the spool file (optional, see ``default_spool_dir``)
+
+    Returns:
+        Handle to pass back to the parent process
+    """
+    spool_dir = Path(spool_dir) if spool_dir is not None else default_spool_dir()
+    path = spool_dir / f"{SPOOL_PREFIX}{os.getpid()}-{uuid.uuid4().hex}.arrows"
+
+    text_span: Optional[Tuple[int, int]] = None
+    table_spans: List[Tuple[int, int]] = []
+
+    with open(path, "wb") as sink:
+        if text is not None:
+            data = text.encode("utf-8")
+            sink.write(data)
+            text_span = (0, len(data))
+
+        for table in tables:
+            start = sink.tell()
+            write_ipc_stream(table, sink)
+            table_spans.append((start, sink.tell() - start))
+
+    return SharedResult(str(path), text_span, table_spans)
+
+
+def import_result(handle: SharedResult) -> Tuple[Optional[str], List[pl.DataFrame]]:
+    """
+    Map a spool file and read its text and tables.
+
+    Table buffers are read directly from the mapping rather than copied. The
+    spool file is unlinked right away; the mapping stays valid for as long
+    as the returned tables reference it.
+
+    Args:
+        handle: Handle returned by ``export_result``
+
+    Returns:
+        Tuple of (text or None, list of Polars DataFrames)
+    """
+    buffer = map_result(handle)
+
+    text: Optional[str] = None
+    if handle.text is not None:
+        offset, length = handle.text
+        text = buffer.slice(offset, length).to_pybytes().decode("utf-8")
+
+    tables = [
+        cast(
+            pl.DataFrame,
+            pl.from_arrow(
+                pa.ipc.open_stream(buffer.slice(offset, length)).read_all(), rechunk=False
+            ),
+        )
+        for offset, length in handle.tables
+    ]
+
+    return text, tables
+
+
+def map_result(handle: SharedResult) -> pa.Buffer:
+    """
+    Memory-map a spool file and unlink it.
+
+    Args:
+        handle: Handle returned by ``export_result``
+
+    Returns:
+        Arrow buffer over the whole file, without copying it
+    """
+    with pa.memory_map(handle.path, "r") as mapped:
+        buffer = mapped.read_buffer()
+    handle.discard()
+    return buffer
+
+
+def table_streams(handle: SharedResult) -> List[pa.Buffer]:
+    """
+    Return each table's Arrow IPC stream bytes without decoding them.
+
+    Useful for passing tables straight on, e.g. to stdout or an HTTP client.
+    """
+    buffer = map_result(handle)
+    return [buffer.slice(offset, length) for offset, length in handle.tables]
+
+
+def write_ipc_stream(table: pl.DataFrame, sink: BinaryIO) -> None:
+    """Write one table as a complete Arrow IPC stream."""
+    arrow_table = table.to_arrow()
+    with pa.ipc.new_stream(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
@@ -0,0 +1,454 @@
+"""Shared SQLite job queue for draining a corpus with many worker processes.
+
+Any number of ``pdf-extractor worker`` processes can point at the same queue
+database. Jobs are handed out under a time-limited lease that workers renew
+with heartbeats. A job whose worker dies becomes available again once the
+lease expires, until it runs out of attempts.
+
+WAL mode (the default) is the fastest choice when all workers share a host.
+SQLite's WAL index lives in shared memory, so for workers on several machines
+that share a network filesystem use ``journal_mode="delete"``. That mode
+relies on the filesystem's POSIX locks instead.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import glob
+import logging
+import os
+import re
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from .batch import estimate_cost
+from .extractor import PDFExtractor
+from .page_store import TEXT_FORMATS, page_table_path
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_MODES = ("wal", "delete")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pdf_path TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker TEXT,
+    lease_expires REAL,
+    error TEXT,
+    updated REAL,
+    UNIQUE (pdf_path, output_dir)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, priority);
+"""
+
+
+class Job:
+    """A job leased from the queue."""
+
+    def __init__(self, job_id: int, pdf_path: str, output_dir: str, attempts: int) -> None:
+        """
+        Initialize a leased job.
+
+        Args:
+            job_id: Queue row id
+            pdf_path: PDF file to extract
+            output_dir: Directory to commit outputs into
+            attempts: Number of times the job has been leased, including this one
+        """
+        self.job_id = job_id
+        self.pdf_path = Path(pdf_path)
+        self.output_dir = Path(output_dir)
+        self.attempts = attempts
+
+
+class JobQueue:
+    """Job queue stored in a SQLite database shared by all workers."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        lease_seconds: float = 300.0,
+        journal_mode: str = "wal",
+    ) -> None:
+        """
+        Open (and create if needed) a job queue.
+
+        Args:
+            db_path: Path to the SQLite database file
+            lease_seconds: How long a lease lasts without a heartbeat
+            journal_mode: "wal" for workers on one host, "delete" for a
+                network filesystem shared by several hosts
+        """
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Unknown journal mode: {journal_mode}")
+
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.journal_mode = journal_mode
+
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode; transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute("PRAGMA busy_timeout=60000")
+        return conn
+
+    def enqueue(
+        self,
+        pdf_paths: Sequence[Union[str, Path]],
+        output_dir: Union[str, Path],
+        max_attempts: int = 3,
+    ) -> int:
+        """
+        Add PDFs to the queue, largest estimated cost first.
+
+        PDFs already queued for the same output directory are skipped, so
+        enqueueing a corpus twice is harmless. Outputs are named after the
+        PDF's stem, so a PDF whose stem is already taken in the output
+        directory by a different PDF (``a/doc.pdf`` and ``b/doc.pdf``) is
+        rejected with a warning rather than left to overwrite the other's
+        outputs.
+
+        Args:
+            pdf_paths: PDF files to extract
+            output_dir: Directory the outputs are committed to
+            max_attempts: How many leases a job gets before it is marked failed
+
+        Returns:
+            Number of newly queued jobs
+        """
+        output_dir = str(Path(output_dir).resolve())
+        rows = [
+            (str(Path(pdf_path).resolve()), output_dir, estimate_cost(pdf_path).cost,
+             max_attempts, time.time())
+            for pdf_path in pdf_paths
+        ]
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            stems = {
+                Path(pdf_path).stem: pdf_path
+                for (pdf_path,) in conn.execute(
+                    "SELECT pdf_path FROM jobs WHERE output_dir = ?", (output_dir,)
+                )
+            }
+            accepted = []
+            for row in rows:
+                owner = stems.setdefault(Path(row[0]).stem, row[0])
+                if owner != row[0]:
+                    logger.warning(
+                        f"Not queueing {row[0]}: {owner} already writes outputs named "
+                        f"{Path(owner).stem!r} to {output_dir}"
+                    )
+                    continue
+                accepted.append(row)
+
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (pdf_path, output_dir, priority, max_attempts, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                accepted,
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        return added
+
+    def lease(self, worker_id: str) -> Optional[Job]:
+        """
+        Lease the highest-priority available job.
+
+        Args:
+            worker_id: Identifier of the leasing worker
+
+        Returns:
+            The leased Job, or None if nothing is available right now
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Expired leases that used up their attempts will never succeed
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease expired', updated = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (now, now),
+            )
+            row = conn.execute(
+                "SELECT id, pdf_path, output_dir, attempts FROM jobs "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY priority DESC, id LIMIT 1",
+                (now,),
+            ).fetchone()
+
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row[0]),
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        return Job(row[0], row[1], row[2], row[3] + 1)
+
+    def heartbeat(self, job: Job, worker_id: str) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        now = time.time()
+        return self._update_leased(
+            "UPDATE jobs SET lease_expires = ?, updated = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (now + self.lease_seconds, now, job.job_id, worker_id),
+        )
+
+    def complete(self, job: Job, worker_id: str) -> bool:
+        """
+        Mark a leased job as done.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        return self._update_leased(
+            "UPDATE jobs SET status = 'done', error = NULL, updated = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (time.time(), job.job_id, worker_id),
+        )
+
+    def fail(self, job: Job, worker_id: str, error: str) -> bool:
+        """
+        Release a leased job after an error.
+
+        The job goes back to pending unless it has used all of its attempts.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        return self._update_leased(
+            "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts "
+            "THEN 'failed' ELSE 'pending' END, error = ?, updated = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (error, time.time(), job.job_id, worker_id),
+        )
+
+    def _update_leased(self, sql: str, params: Sequence[Any]) -> bool:
+        """Run a lease-guarded update and report whether it matched a row."""
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).rowcount == 1
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of jobs in each status."""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        finally:
+            conn.close()
+
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def failures(self) -> List[Dict[str, Any]]:
+        """Return the path, attempts and last error of every failed job."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT pdf_path, attempts, error FROM jobs WHERE status = 'failed' ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [{"pdf_path": r[0], "attempts": r[1], "error": r[2]} for r in rows]
+
+
+def default_worker_id() -> str:
+    """Return a worker id that is unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class Worker:
+    """Drain a JobQueue, committing outputs idempotently."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        search_index: Optional[Union[str, Path]] = None,
+        page_cache: Optional[Union[str, Path]] = None,
+        dedupe_pages: bool = False,
+        area_cache_size: Optional[int] = None,
+        skip_graphics: bool = False,
+        font_cache_mb: Optional[int] = None,
+        text_format: str = "txt",
+    ) -> None:
+        """
+        Initialize a worker.
+
+        Args:
+            queue: Queue to take jobs from
+            worker_id: Unique worker identifier (optional, generated by default)
+            poll_interval: Seconds to wait before polling again when the queue
+                has only leased jobs left
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per document before extraction stops (optional)
+            search_index: SQLite full-text index to write extracted pages to (optional)
+            page_cache: SQLite cache of per-page results (optional)
+            dedupe_pages: Extract identical pages within a document only once
+            area_cache_size: Table layouts to remember across jobs, see
+                ``PDFExtractor`` (optional)
+            skip_graphics: Leave images and vector graphics out of page
+                layout, see ``PDFExtractor``
+            font_cache_mb: Memory cap of the parsed-font cache kept across
+                jobs, see ``PDFExtractor`` (optional)
+            text_format: "txt" for ``{name}.txt`` with an offset sidecar, or
+                "parquet" for a ``{name}.pages.parquet`` page table
+        """
+        if text_format not in TEXT_FORMATS:
+            raise ValueError(f"Unknown text format: {text_format}")
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+        self.text_format = text_format
+        self.extractor = PDFExtractor(
+            page_timeout=page_timeout,
+            doc_timeout=doc_timeout,
+            search_index=search_index,
+            page_cache=page_cache,
+            dedupe_pages=dedupe_pages,
+            area_cache_size=area_cache_size,
+            skip_graphics=skip_graphics,
+            font_cache_mb=font_cache_mb,
+        )
+
+    def run(self, max_jobs: Optional[int] = None) -> int:
+        """
+        Process jobs until the queue is drained.
+
+        Args:
+            max_jobs: Stop after this many jobs (optional)
+
+        Returns:
+            Number of jobs this worker completed
+        """
+        completed = 0
+
+        while max_jobs is None or completed < max_jobs:
+            job = self.queue.lease(self.worker_id)
+
+            if job is None:
+                stats = self.queue.stats()
+                if stats["pending"] == 0 and stats["leased"] == 0:
+                    break
+                # Other workers hold the remaining leases; one may expire
+                time.sleep(self.poll_interval)
+                continue
+
+            if self.process(job):
+                completed += 1
+
+        return completed
+
+    def process(self, job: Job) -> bool:
+        """
+        Extract one leased job and commit its outputs.
+
+        Returns:
+            True if the job was completed by this worker
+        """
+        lease_lost = threading.Event()
+        stop = threading.Event()
+
+        def heartbeat() -> None:
+            while not stop.wait(self.queue.lease_seconds / 3):
+                if not self.queue.heartbeat(job, self.worker_id):
+                    lease_lost.set()
+                    return
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+
+        staging = job.output_dir / f".staging-{job.job_id}-{uuid.uuid4().hex[:8]}"
+        try:
+            self._extract(job, staging)
+        except Exception as e:
+            logger.error(f"Error extracting {job.pdf_path}: {e}")
+            stop.set()
+            thread.join()
+            self.queue.fail(job, self.worker_id, str(e))
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+        stop.set()
+        thread.join()
+
+        try:
+            if lease_lost.is_set() or not self.queue.heartbeat(job, self.worker_id):
+                logger.warning(f"Lost lease on {job.pdf_path}; discarding results")
+                return False
+            self._commit(staging, job.output_dir, job.pdf_path.stem)
+            return self.queue.complete(job, self.worker_id)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _extract(self, job: Job, staging: Path) -> None:
+        """Write the job's text and tables into a private staging directory."""
+        staging.mkdir(parents=True)
+        self.extractor.extract_and_save_text(
+            job.pdf_path,
+            page_table_path(staging / job.pdf_path.name)
+            if self.text_format == "parquet"
+            else staging / f"{job.pdf_path.stem}.txt",
+            format=self.text_format,
+        )
+        self.extractor.extract_and_save_tables(job.pdf_path, staging)
+
+    def _commit(self, staging: Path, output_dir: Path, pdf_name: str) -> None:
+        """
+        Move staged outputs into place.
+
+        Each file is renamed atomically, so a rerun or a second worker that
+        raced on an expired lease replaces files with identical content
+        instead of leaving partial ones. Table files of an earlier run that
+        the new run did not write, because it found fewer tables, are
+        removed afterwards.
+        """
+        staged = {path.name for path in staging.iterdir()}
+        for name in sorted(staged):
+            os.replace(staging / name, output_dir / name)
+
+        table_file = re.compile(rf"{re.escape(pdf_name)}_table_\d+\.parquet")
+        for path in output_dir.glob(f"{glob.escape(pdf_name)}_table_*.parquet"):
+            if table_file.fullmatch(path.name) and path.name not in staged:
+                path.unlink(missing_ok=True)
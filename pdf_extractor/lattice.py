@@ -0,0 +1,380 @@
+"""Ruled-table ("lattice") detection built on vectorized NumPy grid operations.
+
+Tables whose cells are fully ruled can be found from the page's line and
+rect objects alone:
+
+1. Every line and rect is turned into horizontal and vertical edges.
+2. Edge coordinates are snapped into grid lines, and collinear pieces are
+   joined into segments.
+3. For every pair of adjacent grid lines, a boolean matrix records whether
+   a drawn segment covers the gap. Neighbouring grid cells with no rule
+   between them are merged into spanning cells.
+4. Cells whose outline is fully drawn are grouped into tables, and words
+   are assigned to cells in one ``searchsorted`` pass.
+
+``find_table_cells`` stops after step 4's grouping and returns the cell
+boxes; ``fill_cells`` assigns words to any such cell layout, so a layout
+found on one page can be reused for another page with the same rulings.
+``cluster``, the coordinate snapping of step 2, is shared with ``stream``.
+
+Everything after reading the page objects works on whole arrays at once,
+instead of pairwise Python loops over edges and intersections.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SNAP_TOLERANCE = 3.0
+JOIN_TOLERANCE = 3.0
+MIN_EDGE_LENGTH = 3.0
+
+Bbox = Tuple[float, float, float, float]
+
+
+def find_tables(
+    page: Any,
+    snap_tolerance: float = SNAP_TOLERANCE,
+    join_tolerance: float = JOIN_TOLERANCE,
+) -> List[Tuple[Bbox, List[List[Optional[str]]]]]:
+    """
+    Find the ruled tables on a pdfplumber page.
+
+    Args:
+        page: pdfplumber page
+        snap_tolerance: Edges closer than this are treated as one grid line
+        join_tolerance: Collinear edges with gaps up to this are joined
+
+    Returns:
+        List of (bbox as (x0, top, x1, bottom), rows) per table, top to
+        bottom. Rows are lists of cell strings; positions covered by a
+        spanning cell other than its top-left one are None.
+    """
+    tables = find_table_cells(page, snap_tolerance, join_tolerance)
+    if not tables:
+        return []
+    filled = fill_cells(page.extract_words(), [cells for _, cells in tables])
+    return [(bbox, rows) for (bbox, _), rows in zip(tables, filled)]
+
+
+def find_table_cells(
+    page: Any,
+    snap_tolerance: float = SNAP_TOLERANCE,
+    join_tolerance: float = JOIN_TOLERANCE,
+) -> List[Tuple[Bbox, List[List[Optional[Bbox]]]]]:
+    """
+    Find the cell layout of the ruled tables on a pdfplumber page.
+
+    Args:
+        page: pdfplumber page
+        snap_tolerance: Edges closer than this are treated as one grid line
+        join_tolerance: Collinear edges with gaps up to this are joined
+
+    Returns:
+        List of (bbox, cells) per table, top to bottom. ``cells`` has the
+        table's rows of cell boxes, laid out like ``find_tables`` rows.
+    """
+    horizontal, vertical = _page_edges(page, snap_tolerance)
+    if len(horizontal) < 2 or len(vertical) < 2:
+        return []
+
+    row_ids, ys = cluster(horizontal[:, 0], snap_tolerance)
+    col_ids, xs = cluster(vertical[:, 0], snap_tolerance)
+    if len(ys) < 2 or len(xs) < 2:
+        return []
+
+    h_rows, h_start, h_end = _join(row_ids, horizontal[:, 1], horizontal[:, 2], join_tolerance)
+    v_cols, v_start, v_end = _join(col_ids, vertical[:, 1], vertical[:, 2], join_tolerance)
+
+    # drawn_h[r, c]: a rule on grid row r spans grid columns c..c+1
+    covers_h = (h_start[:, None] <= xs[None, :-1] + snap_tolerance) & (
+        h_end[:, None] >= xs[None, 1:] - snap_tolerance
+    )
+    drawn_h = np.zeros((len(ys), len(xs) - 1), dtype=bool)
+    np.logical_or.at(drawn_h, h_rows, covers_h)
+
+    # drawn_v[r, c]: a rule on grid column c spans grid rows r..r+1
+    covers_v = (v_start[:, None] <= ys[None, :-1] + snap_tolerance) & (
+        v_end[:, None] >= ys[None, 1:] - snap_tolerance
+    )
+    drawn_v = np.zeros((len(xs), len(ys) - 1), dtype=bool)
+    np.logical_or.at(drawn_v, v_cols, covers_v)
+    drawn_v = drawn_v.T
+
+    labels, valid = _cells(drawn_h, drawn_v)
+    tables = _label_components(valid[:, :-1] & valid[:, 1:], valid[:-1, :] & valid[1:, :])
+
+    results = []
+    for table_id in np.unique(tables[valid]):
+        in_table = valid & (tables == table_id)
+        results.append(_table_cells(labels, in_table, xs, ys))
+    results.sort(key=lambda table: (table[0][1], table[0][0]))
+    return results
+
+
+def _page_edges(page: Any, snap_tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read line and rect objects as edge arrays.
+
+    Returns:
+        Tuple of horizontal edges as rows of (y, x0, x1) and vertical edges
+        as rows of (x, top, bottom)
+    """
+    boxes = [
+        (obj["x0"], obj["top"], obj["x1"], obj["bottom"], obj["object_type"] == "rect")
+        for kind in ("line", "rect")
+        for obj in page.objects.get(kind, [])
+    ]
+    if not boxes:
+        return np.empty((0, 3)), np.empty((0, 3))
+
+    data = np.asarray(boxes, dtype=float)
+    x0, top, x1, bottom, is_rect = data.T
+    is_rect = is_rect.astype(bool)
+    width, height = x1 - x0, bottom - top
+
+    flat = height <= snap_tolerance
+    thin = width <= snap_tolerance
+    box = is_rect & ~flat & ~thin
+
+    # Thin lines and rects become single rules; other rects contribute all four sides
+    horizontal = np.concatenate([
+        np.column_stack([(top + bottom)[flat] / 2, x0[flat], x1[flat]]),
+        np.column_stack([top[box], x0[box], x1[box]]),
+        np.column_stack([bottom[box], x0[box], x1[box]]),
+    ])
+    vertical = np.concatenate([
+        np.column_stack([(x0 + x1)[thin & ~flat] / 2, top[thin & ~flat], bottom[thin & ~flat]]),
+        np.column_stack([x0[box], top[box], bottom[box]]),
+        np.column_stack([x1[box], top[box], bottom[box]]),
+    ])
+
+    horizontal = horizontal[horizontal[:, 2] - horizontal[:, 1] >= MIN_EDGE_LENGTH]
+    vertical = vertical[vertical[:, 2] - vertical[:, 1] >= MIN_EDGE_LENGTH]
+    return horizontal, vertical
+
+
+def cluster(values: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Snap coordinates that lie within ``tolerance`` of each other.
+
+    Returns:
+        Tuple of (cluster id per value, ascending cluster centres)
+    """
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    sorted_ids = np.concatenate([[0], np.cumsum(np.diff(ordered) > tolerance)])
+    ids = np.empty_like(sorted_ids)
+    ids[order] = sorted_ids
+    centres = np.bincount(ids, weights=values) / np.bincount(ids)
+    return ids, centres
+
+
+def _join(
+    line_ids: np.ndarray, starts: np.ndarray, ends: np.ndarray, tolerance: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Join overlapping or nearly touching collinear edges into segments.
+
+    Returns:
+        Tuple of (grid line id, start, end) per joined segment
+    """
+    order = np.lexsort((starts, line_ids))
+    ids, starts, ends = line_ids[order], starts[order], ends[order]
+
+    # Shift each grid line into its own coordinate range, so that one running
+    # maximum over all edges never carries over from one line to the next.
+    low = starts.min()
+    shift = ids * (ends.max() - low + 2 * tolerance + 1)
+    shifted_starts = starts - low + shift
+    reach = np.maximum.accumulate(ends - low + shift)
+
+    new_segment = np.ones(len(ids), dtype=bool)
+    new_segment[1:] = shifted_starts[1:] > reach[:-1] + tolerance
+    first = np.flatnonzero(new_segment)
+    return ids[first], starts[first], np.maximum.reduceat(ends, first)
+
+
+def _label_components(join_right: np.ndarray, join_down: np.ndarray) -> np.ndarray:
+    """
+    Label connected components of a grid by min-label propagation.
+
+    Args:
+        join_right: (rows, cols - 1) links between horizontal neighbours
+        join_down: (rows - 1, cols) links between vertical neighbours
+
+    Returns:
+        Component label per cell (the smallest flat index in the component)
+    """
+    shape = (join_right.shape[0], join_down.shape[1])
+    labels: np.ndarray = np.arange(shape[0] * shape[1]).reshape(shape)
+    while True:
+        previous = labels
+        labels = labels.copy()
+        across = np.where(join_right, np.minimum(labels[:, :-1], labels[:, 1:]), labels[:, :-1])
+        labels[:, :-1] = across
+        labels[:, 1:] = np.where(join_right, np.minimum(labels[:, 1:], across), labels[:, 1:])
+        along = np.where(join_down, np.minimum(labels[:-1, :], labels[1:, :]), labels[:-1, :])
+        labels[:-1, :] = along
+        labels[1:, :] = np.where(join_down, np.minimum(labels[1:, :], along), labels[1:, :])
+        # Pointer jumping: follow labels to their own labels to converge faster
+        labels = labels.ravel()[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _cells(drawn_h: np.ndarray, drawn_v: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge grid cells that have no rule between them into spanning cells.
+
+    Args:
+        drawn_h: (rows + 1, cols) rules along the horizontal grid lines
+        drawn_v: (rows, cols + 1) rules along the vertical grid lines
+
+    Returns:
+        Tuple of (spanning-cell label per grid cell, whether the grid cell
+        belongs to a closed rectangular cell)
+    """
+    rows, cols = drawn_v.shape[0], drawn_h.shape[1]
+    labels = _label_components(~drawn_v[:, 1:-1], ~drawn_h[1:-1, :])
+
+    # A rule between two different cells is always drawn (otherwise they
+    # would have merged), so a cell is open only where it reaches the grid
+    # border without a rule.
+    open_side = np.zeros((rows, cols), dtype=bool)
+    open_side[0, :] |= ~drawn_h[0, :]
+    open_side[-1, :] |= ~drawn_h[-1, :]
+    open_side[:, 0] |= ~drawn_v[:, 0]
+    open_side[:, -1] |= ~drawn_v[:, -1]
+
+    flat = labels.ravel()
+    row_index, col_index = np.divmod(np.arange(flat.size), cols)
+    size = flat.size
+    is_open = np.zeros(size, dtype=bool)
+    np.logical_or.at(is_open, flat, open_side.ravel())
+
+    # Spanning cells must be rectangles; anything else is a broken ruling
+    bounds = np.full((4, size), -1)
+    bounds[0] = bounds[1] = size
+    np.minimum.at(bounds[0], flat, row_index)
+    np.minimum.at(bounds[1], flat, col_index)
+    np.maximum.at(bounds[2], flat, row_index)
+    np.maximum.at(bounds[3], flat, col_index)
+    area = (bounds[2] - bounds[0] + 1) * (bounds[3] - bounds[1] + 1)
+    rectangular = np.bincount(flat, minlength=size) == area
+
+    valid = (~is_open & rectangular)[flat].reshape(rows, cols)
+    return labels, valid
+
+
+def fill_cells(
+    words: List[Dict[str, Any]], tables: List[List[List[Optional[Bbox]]]]
+) -> List[List[List[Optional[str]]]]:
+    """
+    Assign words to cells by their centre point and join them per cell.
+
+    Args:
+        words: Words as returned by pdfplumber's ``extract_words``
+        tables: Cell layouts as returned by ``find_table_cells``
+
+    Returns:
+        Rows of cell strings per table; empty cells are "" and positions
+        without a cell stay None
+    """
+    boxes = [cell for cells in tables for row in cells for cell in row if cell is not None]
+    texts = _cell_text(words, np.asarray(boxes, dtype=float).reshape(-1, 4))
+
+    index = iter(range(len(boxes)))
+    return [
+        [[None if cell is None else texts.get(next(index), "") for cell in row] for row in cells]
+        for cells in tables
+    ]
+
+
+def _cell_text(words: List[Dict[str, Any]], boxes: np.ndarray) -> Dict[int, str]:
+    """Join the words whose centre falls in each of the non-overlapping boxes."""
+    if not words or not len(boxes):
+        return {}
+
+    # Paint every cell onto the grid spanned by all cell edges
+    xs = np.unique(boxes[:, [0, 2]])
+    ys = np.unique(boxes[:, [1, 3]])
+    grid = np.full((len(ys) - 1, len(xs) - 1), -1)
+    c0, c1 = np.searchsorted(xs, boxes[:, 0]), np.searchsorted(xs, boxes[:, 2])
+    r0, r1 = np.searchsorted(ys, boxes[:, 1]), np.searchsorted(ys, boxes[:, 3])
+    for box, (top, bottom, left, right) in enumerate(zip(r0, r1, c0, c1)):
+        grid[top:bottom, left:right] = box
+
+    centres = np.array(
+        [((w["x0"] + w["x1"]) / 2, (w["top"] + w["bottom"]) / 2, w["top"]) for w in words]
+    )
+    col = np.searchsorted(xs, centres[:, 0]) - 1
+    row = np.searchsorted(ys, centres[:, 1]) - 1
+    inside = (col >= 0) & (col < len(xs) - 1) & (row >= 0) & (row < len(ys) - 1)
+    cell = np.full(len(words), -1)
+    cell[inside] = grid[row[inside], col[inside]]
+
+    word_index = np.flatnonzero(cell >= 0)
+    # Stable sort keeps pdfplumber's reading order of words within a cell
+    order = np.argsort(cell[word_index], kind="stable")
+    word_index = word_index[order]
+
+    text: Dict[int, List[str]] = {}
+    previous_top: Dict[int, float] = {}
+    for index, label in zip(word_index.tolist(), cell[word_index].tolist()):
+        top = centres[index, 2]
+        parts = text.setdefault(label, [])
+        if parts:
+            parts.append("\n" if top - previous_top[label] > SNAP_TOLERANCE else " ")
+        parts.append(words[index]["text"])
+        previous_top[label] = top
+    return {label: "".join(parts) for label, parts in text.items()}
+
+
+def _table_cells(
+    labels: np.ndarray,
+    in_table: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+) -> Tuple[Bbox, List[List[Optional[Bbox]]]]:
+    """Lay out one table's spanning cells on its own row and column lines."""
+    grid_rows, grid_cols = np.nonzero(in_table)
+    cell_labels = labels[grid_rows, grid_cols]
+
+    # Top-left and bottom-right grid cell of every spanning cell
+    unique_labels, first = np.unique(cell_labels, return_index=True)
+    top_rows = grid_rows[first]
+    left_cols = grid_cols[first]
+    bottom_rows = np.zeros(len(unique_labels), dtype=int)
+    right_cols = np.zeros(len(unique_labels), dtype=int)
+    position = np.searchsorted(unique_labels, cell_labels)
+    np.maximum.at(bottom_rows, position, grid_rows)
+    np.maximum.at(right_cols, position, grid_cols)
+
+    # Grid lines used by this table; lines drawn only for other tables drop out
+    row_lines = np.unique(top_rows)
+    col_lines = np.unique(left_cols)
+
+    cells: List[List[Optional[Bbox]]] = [[None] * len(col_lines) for _ in row_lines]
+    for row, col, top, left, bottom, right in zip(
+        np.searchsorted(row_lines, top_rows).tolist(),
+        np.searchsorted(col_lines, left_cols).tolist(),
+        top_rows.tolist(),
+        left_cols.tolist(),
+        bottom_rows.tolist(),
+        right_cols.tolist(),
+    ):
+        cells[row][col] = (
+            float(xs[left]),
+            float(ys[top]),
+            float(xs[right + 1]),
+            float(ys[bottom + 1]),
+        )
+
+    bbox = (
+        float(xs[grid_cols.min()]),
+        float(ys[grid_rows.min()]),
+        float(xs[grid_cols.max() + 1]),
+        float(ys[grid_rows.max() + 1]),
+    )
+    return bbox, cells
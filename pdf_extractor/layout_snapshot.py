@@ -0,0 +1,382 @@
+"""Persisted page layouts that later runs read instead of laying pages out again.
+
+Tuning table settings means rerunning ``TableExtractor`` over a corpus
+where nothing changes between runs except the table-finding parameters,
+yet every run parses content streams and lays out every page again. A
+layout snapshot keeps the objects pdfplumber builds for each page (chars,
+lines, rects and curves, with every attribute) and the page's words in one
+Parquet file per document, one row group per page.
+
+Geometry, text, font name and size are typed Float64/Utf8 columns. The
+remaining attributes (matrix, colours, path points, marked-content ids...)
+are kept per object in a compact JSON column. Restoring a page puts the
+objects back on the pdfplumber page (``page._objects``), so
+``extract_text()``, ``find_tables()``, ``crop()`` and the lattice and
+stream backends all work on it without touching its content stream.
+Results are the same as from the PDF.
+
+A snapshot belongs to one version of a document: it records the PDF's
+size and modification time and is ignored once either changes. Batch
+tasks for different page ranges of one document save into the same file
+at the same time, so saving takes a lock on ``{snapshot}.lock``, reads
+the file again and merges its pages with the ones just recorded. It also
+records which object kinds it holds. Text extraction with graphics skipped
+lays out characters only, and such a snapshot is not used for tables.
+Words are computed with pdfplumber's default tolerances when the snapshot
+is written and are read with ``DocumentSnapshot.words``. The table
+backends group words from the restored characters themselves, since the
+tolerances are among the settings being tuned.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+import hashlib
+import json
+import logging
+import os
+
+import polars as pl
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Layout objects kept in a snapshot
+SNAPSHOT_KINDS = ("char", "line", "rect", "curve")
+SNAPSHOT_SUFFIX = ".layout.parquet"
+
+_FORMAT_VERSION = 1
+_METADATA_KEY = b"pdf_extractor.layout"
+
+_SNAPSHOT_SCHEMA = {
+    "page": pl.Int32,
+    "kind": pl.Utf8,
+    "x0": pl.Float64,
+    "y0": pl.Float64,
+    "x1": pl.Float64,
+    "y1": pl.Float64,
+    "top": pl.Float64,
+    "bottom": pl.Float64,
+    "doctop": pl.Float64,
+    "width": pl.Float64,
+    "height": pl.Float64,
+    "text": pl.Utf8,
+    "fontname": pl.Utf8,
+    "size": pl.Float64,
+    "upright": pl.Boolean,
+    "extra": pl.Utf8,
+}
+_TYPED = tuple(column for column in _SNAPSHOT_SCHEMA if column not in ("page", "kind", "extra"))
+# Attributes that come from the row itself rather than the object
+_IMPLIED = {"object_type", "page_number"}
+
+
+def _fingerprint(pdf_path: Path) -> Dict[str, int]:
+    """Size and modification time identifying one version of a PDF."""
+    stat = pdf_path.stat()
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+
+def _tuples(value: Any) -> Any:
+    """Turn the lists JSON gives back into the tuples pdfplumber uses."""
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    return value
+
+
+def _restore(row: Dict[str, Any], page_number: int) -> Dict[str, Any]:
+    """Rebuild a pdfplumber object dict from a snapshot row."""
+    obj = {column: row[column] for column in _TYPED if row[column] is not None}
+    obj["object_type"] = row["kind"]
+    obj["page_number"] = page_number
+    for key, value in json.loads(row["extra"]).items():
+        # Points and path segments are lists of tuples, e.g. ("c", (x, y), ...);
+        # they are by far the largest attributes, so they skip the recursion
+        if key == "pts" and value is not None:
+            obj[key] = [tuple(point) for point in value]
+        elif key == "path" and value is not None:
+            obj[key] = [(segment[0], *map(tuple, segment[1:])) for segment in value]
+        else:
+            obj[key] = _tuples(value)
+    return obj
+
+
+def page_frame(page: Any, kinds: Iterable[str] = SNAPSHOT_KINDS) -> pl.DataFrame:
+    """
+    Read the layout objects and words of a laid-out pdfplumber page into a frame.
+
+    Args:
+        page: pdfplumber page
+        kinds: Object kinds to keep
+
+    Returns:
+        Frame with one row per object, then one per word
+    """
+    columns: Dict[str, List[Any]] = {column: [] for column in _SNAPSHOT_SCHEMA}
+    objects = page.objects
+    groups = [(kind, objects.get(kind, [])) for kind in kinds]
+    groups.append(("word", page.extract_words()))
+    for kind, objs in groups:
+        for obj in objs:
+            columns["page"].append(page.page_number)
+            columns["kind"].append(kind)
+            for column in _TYPED:
+                columns[column].append(obj.get(column))
+            extra = {
+                key: value
+                for key, value in obj.items()
+                if key not in _SNAPSHOT_SCHEMA and key not in _IMPLIED
+            }
+            columns["extra"].append(json.dumps(extra, separators=(",", ":"), default=str))
+    return pl.DataFrame(columns, schema=_SNAPSHOT_SCHEMA)
+
+
+class DocumentSnapshot:
+    """The layout snapshot of one document: pages to restore and pages to record."""
+
+    def __init__(
+        self,
+        path: Path,
+        pdf_path: Path,
+        kinds: FrozenSet[str],
+        frame: Optional[pl.DataFrame] = None,
+        stored_kinds: FrozenSet[str] = frozenset(),
+    ) -> None:
+        """
+        Initialize the snapshot of one document.
+
+        Args:
+            path: Snapshot file
+            pdf_path: The PDF it belongs to
+            kinds: Object kinds this run lays out and records
+            frame: Usable rows read from an existing snapshot (optional)
+            stored_kinds: Object kinds the existing rows hold
+        """
+        self.path = path
+        self.pdf_path = pdf_path
+        self.kinds = kinds
+        self.stored_kinds = stored_kinds
+        self.restored_pages: List[int] = []
+        self.recorded_pages: List[int] = []
+        self._pages: Dict[int, pl.DataFrame] = {}
+        if frame is not None:
+            self._pages = _by_page(frame)
+        self._recorded: Dict[int, pl.DataFrame] = {}
+
+    def __len__(self) -> int:
+        """Number of pages the snapshot holds."""
+        return len(self._pages)
+
+    def __contains__(self, page_num: int) -> bool:
+        """Return True if the snapshot holds the one-based page."""
+        return page_num in self._pages
+
+    def restore(self, page: Any) -> bool:
+        """
+        Put a page's snapshot objects on a pdfplumber page that was not laid out.
+
+        Returns:
+            True if the page was restored, False if the snapshot lacks it
+        """
+        frame = self._pages.get(page.page_number)
+        if frame is None:
+            return False
+
+        objects: Dict[str, List[Dict[str, Any]]] = {}
+        for row in frame.filter(pl.col("kind") != "word").iter_rows(named=True):
+            objects.setdefault(row["kind"], []).append(_restore(row, page.page_number))
+        page._objects = objects
+        self.restored_pages.append(page.page_number)
+        return True
+
+    def record(self, page: Any) -> None:
+        """Add a page that was just laid out from the PDF to the snapshot."""
+        kinds = [kind for kind in SNAPSHOT_KINDS if kind in self.kinds]
+        try:
+            self._recorded[page.page_number] = page_frame(page, kinds)
+        except Exception as e:
+            logger.warning(f"Could not snapshot page {page.page_number} of {self.pdf_path}: {e}")
+            return
+        self.recorded_pages.append(page.page_number)
+
+    def words(self, page_num: int) -> List[Dict[str, Any]]:
+        """Words of a one-based page as ``extract_words()`` returned them (empty if absent)."""
+        frame = self._pages.get(page_num)
+        if frame is None:
+            return []
+        words = []
+        for row in frame.filter(pl.col("kind") == "word").iter_rows(named=True):
+            word = _restore(row, page_num)
+            del word["object_type"], word["page_number"]
+            words.append(word)
+        return words
+
+    def save(self) -> None:
+        """
+        Write the snapshot if pages were recorded, keeping the pages it already held.
+
+        The file is read again under a lock and its current pages are kept,
+        so snapshots of other page ranges saved since this one was opened
+        are merged rather than overwritten.
+        """
+        if not self._recorded:
+            return
+
+        with _locked(self.path):
+            current = _read_snapshot(self.path, self.pdf_path)
+            if current is not None:
+                self._pages, self.stored_kinds = _by_page(current[0]), current[1]
+            self._write()
+
+    def _write(self) -> None:
+        """Write the held and recorded pages; the caller holds the file's lock."""
+        kinds = self.kinds
+        if set(self._pages) - set(self._recorded):
+            # Pages kept from the existing snapshot hold only its kinds
+            kinds = kinds & self.stored_kinds
+        pages = {**self._pages, **self._recorded}
+        metadata = {
+            "version": _FORMAT_VERSION,
+            **_fingerprint(self.pdf_path),
+            "kinds": sorted(kinds),
+            "pages": sorted(pages),
+        }
+
+        schema = pl.DataFrame(schema=_SNAPSHOT_SCHEMA).to_arrow().schema
+        schema = schema.with_metadata({_METADATA_KEY: json.dumps(metadata)})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and rename, so readers never see a partial file
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with pq.ParquetWriter(str(temp_path), schema, compression="zstd") as writer:
+            for page in sorted(pages):
+                writer.write_table(pages[page].to_arrow().cast(schema))
+        os.replace(temp_path, self.path)
+        self._pages = pages
+        self.stored_kinds = kinds
+        self._recorded = {}
+
+
+class LayoutSnapshots:
+    """Directory of layout snapshots, one Parquet file per document."""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        Initialize the snapshot directory (created when the first snapshot is written).
+
+        Args:
+            directory: Directory holding the ``.layout.parquet`` files
+        """
+        self.directory = Path(directory)
+
+    def path(self, pdf_path: Union[str, Path]) -> Path:
+        """Snapshot file of a PDF; the name carries a hash of its full path."""
+        pdf_path = Path(pdf_path)
+        digest = hashlib.sha1(str(pdf_path.resolve()).encode("utf-8")).hexdigest()[:8]
+        return self.directory / f"{pdf_path.stem}.{digest}{SNAPSHOT_SUFFIX}"
+
+    def open(
+        self,
+        pdf_path: Union[str, Path],
+        kinds: Iterable[str],
+        needed: Optional[Iterable[str]] = None,
+    ) -> DocumentSnapshot:
+        """
+        Open the snapshot of a PDF for one extraction run.
+
+        An existing snapshot is used if it was written from the current
+        version of the PDF and holds every kind the run needs; otherwise the
+        run starts a new one.
+
+        Args:
+            pdf_path: Path to the PDF file
+            kinds: Object kinds the run lays out (and records)
+            needed: Object kinds the run reads (optional, defaults to ``kinds``)
+
+        Returns:
+            DocumentSnapshot to restore pages from and record pages to
+        """
+        pdf_path = Path(pdf_path)
+        kinds = frozenset(kinds) & frozenset(SNAPSHOT_KINDS)
+        needed = kinds if needed is None else frozenset(needed)
+        path = self.path(pdf_path)
+        current = _read_snapshot(path, pdf_path)
+        if current is not None:
+            frame, stored_kinds = current
+            if needed <= stored_kinds:
+                return DocumentSnapshot(path, pdf_path, kinds, frame, stored_kinds)
+            logger.info(f"Layout snapshot of {pdf_path} lacks objects, rebuilding it")
+        return DocumentSnapshot(path, pdf_path, kinds)
+
+
+def _read_snapshot(path: Path, pdf_path: Path) -> Optional[Tuple[pl.DataFrame, FrozenSet[str]]]:
+    """Rows and object kinds of a snapshot file, or None if it is missing or stale."""
+    if not path.exists():
+        return None
+    try:
+        table = pq.read_table(str(path))
+        metadata = json.loads((table.schema.metadata or {})[_METADATA_KEY])
+    except Exception as e:
+        logger.warning(f"Could not read layout snapshot {path}: {e}")
+        return None
+
+    current = {"version": _FORMAT_VERSION, **_fingerprint(pdf_path)}
+    if any(metadata.get(key) != value for key, value in current.items()):
+        logger.info(f"Layout snapshot of {pdf_path} is stale, rebuilding it")
+        return None
+    return cast(pl.DataFrame, pl.from_arrow(table)), frozenset(metadata["kinds"])
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on ``{path}.lock`` while reading and replacing a snapshot.
+
+    Without ``fcntl`` (Windows) saves are not serialized, and concurrent
+    saves of one document keep only the last one's pages.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _by_page(frame: pl.DataFrame) -> Dict[int, pl.DataFrame]:
+    """Split snapshot rows by page number."""
+    return {part["page"][0]: part for part in frame.partition_by("page")}
+
+
+def snapshot_kinds(skip: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Object kinds a run records when it leaves ``skip`` out of page layout."""
+    return frozenset(SNAPSHOT_KINDS) - frozenset(skip or ())
+
+
+def save_snapshot(snapshot: Optional[DocumentSnapshot]) -> None:
+    """Save a run's snapshot, logging rather than raising on failure."""
+    if snapshot is None:
+        return
+    try:
+        snapshot.save()
+    except Exception as e:
+        logger.warning(f"Could not write layout snapshot {snapshot.path}: {e}")
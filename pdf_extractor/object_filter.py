@@ -0,0 +1,209 @@
+"""Skip unneeded object types while pdfminer interprets a page.
+
+pdfplumber lays a page out once and turns every layout object into a dict,
+including the thousands of curves on a drawing and every image on a slide.
+Text extraction then reads only the characters, and table detection reads
+only the characters and the ruling lines. ``load_layout`` runs the page
+through a device that drops the unwanted types before any layout object is
+built:
+
+- images are never wrapped in ``LTImage``;
+- Bezier paths are dropped as soon as their path operators show they are
+  curves, before their points are transformed;
+- lines and rects can be dropped too.
+
+When every path type is skipped, the path operators are also removed from
+the content streams before pdfminer tokenizes them. Tokenizing the operands
+of thousands of curves is what costs the most on drawings. Streams with
+inline images are left alone, because their binary data cannot be told
+apart from operators with a regular expression.
+
+Characters are always kept. Annotations need no filtering: pdfplumber only
+parses them when ``page.annots`` or ``page.hyperlinks`` is read, and
+extraction never reads them.
+"""
+
+from functools import partial
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Sequence
+import copy
+import re
+
+try:
+    from pdfminer.pdfinterp import PDFPageInterpreter
+    from pdfminer.pdftypes import stream_value
+    from pdfplumber.page import PDFPageAggregatorWithMarkedContent
+    from pdfplumber.utils.exceptions import PdfminerException
+except ImportError:
+    PDFPageInterpreter = object
+    PDFPageAggregatorWithMarkedContent = object
+    PdfminerException = Exception
+
+# Object types that can be skipped
+OBJECT_TYPES = ("image", "line", "rect", "curve")
+
+# Everything but characters, for text extraction
+TEXT_ONLY = OBJECT_TYPES
+
+# Characters plus the lines and rects table detection uses as rulings
+RULINGS_ONLY = ("image", "curve")
+
+_PATH_TYPES = frozenset({"line", "rect", "curve"})
+_LAYOUT_TYPES = {"LTImage": "image", "LTLine": "line", "LTRect": "rect", "LTCurve": "curve"}
+# Subpaths made only of straight segments can become a line or rect
+_STRAIGHT = re.compile(r"ml+h?")
+
+_N = rb"[-+]?(?:\d+\.?\d*|\.\d+)\s+"
+# Strings, dict delimiters and hex strings are matched first and kept, so
+# that text which looks like path operators is never touched.
+_PATH_OPERATORS = re.compile(
+    rb"(?P<keep>\((?:\\.|[^\\()]|\((?:\\.|[^\\()])*\))*\)|<<|>>|<[^<>]*>)"
+    rb"|(?<![^\s\[\]()<>])"
+    rb"(?:(?:%s){6}c|(?:%s){4}(?:re|v|y)|(?:%s){2}[ml]|[hnSsfFBbW]\*?)"
+    rb"(?=[\s\[\]()<>{}/%%]|$)" % (_N, _N, _N),
+    re.DOTALL,
+)
+_INLINE_IMAGE = re.compile(rb"(?<!\S)BI(?=\s)")
+
+
+def normalize_skip(skip: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Validate a set of object types to skip.
+
+    Args:
+        skip: Names from ``OBJECT_TYPES`` (optional)
+
+    Returns:
+        The names as a frozenset (empty when nothing is skipped)
+    """
+    skip = frozenset(skip or ())
+    unknown = skip - set(OBJECT_TYPES)
+    if unknown:
+        raise ValueError(
+            f"Unknown object type(s): {', '.join(sorted(unknown))}; "
+            f"choose from {', '.join(OBJECT_TYPES)}"
+        )
+    return skip
+
+
+class FilteringAggregator(PDFPageAggregatorWithMarkedContent):
+    """pdfplumber's page aggregator, without the layout objects of skipped types."""
+
+    def __init__(self, *args: Any, skip: FrozenSet[str] = frozenset(), **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.skip = skip
+
+    def render_image(self, name: str, stream: Any) -> None:
+        """Add an image unless images are skipped."""
+        if "image" not in self.skip:
+            super().render_image(name, stream)
+
+    def paint_path(
+        self, gstate: Any, stroke: bool, fill: bool, evenodd: bool, path: Any
+    ) -> None:
+        """Add a path's line, rect or curve unless its type is skipped."""
+        if _PATH_TYPES <= self.skip:
+            return
+
+        shape = "".join(segment[0] for segment in path)
+        if shape.count("m") > 1:
+            # One subpath at a time, as pdfminer does, so each can be rejected early
+            for match in re.finditer(r"m[^m]+", shape):
+                self.paint_path(gstate, stroke, fill, evenodd, path[match.start():match.end()])
+            return
+        if "curve" in self.skip and not _STRAIGHT.fullmatch(shape):
+            return
+
+        objects = self.cur_item._objs
+        start = len(objects)
+        super().paint_path(gstate, stroke, fill, evenodd, path)
+        if len(objects) > start and self.skip:
+            # Straight subpaths that are not lines or rects still become curves
+            objects[start:] = [
+                obj for obj in objects[start:]
+                if _LAYOUT_TYPES.get(type(obj).__name__) not in self.skip
+            ]
+
+
+def strip_path_operators(data: bytes) -> bytes:
+    """
+    Remove path construction, painting and clipping operators from a content stream.
+
+    Args:
+        data: Decoded content stream
+
+    Returns:
+        The stream without paths, or unchanged if it contains inline images
+    """
+    if _INLINE_IMAGE.search(data):
+        return data
+    return _PATH_OPERATORS.sub(
+        lambda match: match.group("keep") or b" ", data
+    )
+
+
+class FilteringInterpreter(PDFPageInterpreter):
+    """Interpreter that hands pdfminer content streams without paths when no path is kept."""
+
+    def execute(self, streams: Sequence[Any]) -> None:
+        """Run content streams, stripped of path operators if the device skips all paths."""
+        if _PATH_TYPES <= getattr(self.device, "skip", frozenset()):
+            streams = [_stripped(stream_value(stream)) for stream in streams]
+        super().execute(streams)
+
+
+def _stripped(stream: Any) -> Any:
+    """Copy a content stream (keeping its object id) with its path operators removed."""
+    stripped = copy.copy(stream)
+    stripped.data = strip_path_operators(stream.get_data())
+    return stripped
+
+
+def load_layout(page: Any, skip: Optional[Iterable[str]]) -> None:
+    """
+    Lay out a pdfplumber page without the skipped object types.
+
+    The layout is stored on the page, so ``page.chars``, ``page.lines``,
+    ``extract_text()``, ``find_tables()`` and so on use it. Does nothing when
+    nothing is skipped or the page is already laid out.
+
+    Args:
+        page: pdfplumber page
+        skip: Object types to leave out, from ``OBJECT_TYPES``
+    """
+    skip = normalize_skip(skip)
+    if not skip or hasattr(page, "_layout"):
+        return
+
+    device = FilteringAggregator(
+        page.pdf.rsrcmgr,
+        pageno=page.page_number,
+        laparams=page.pdf.laparams,
+        skip=skip,
+    )
+    interpreter = FilteringInterpreter(page.pdf.rsrcmgr, device)
+    try:
+        interpreter.process_page(page.page_obj)
+    except Exception as e:
+        raise PdfminerException(e)
+    page._layout = device.get_result()
+
+
+def _run_filtered(page_func: Callable[[Any], Any], skip: FrozenSet[str], page: Any) -> Any:
+    """Lay out a page without the skipped object types, then run ``page_func`` on it."""
+    load_layout(page, skip)
+    return page_func(page)
+
+
+def filtered(
+    page_func: Callable[[Any], Any], skip: Optional[Iterable[str]]
+) -> Callable[[Any], Any]:
+    """
+    Wrap a per-page function so that it sees pages without the skipped types.
+
+    The wrapper can be pickled whenever ``page_func`` can, so it also works
+    with ``timeouts.PageTimeoutRunner``.
+    """
+    skip = normalize_skip(skip)
+    if not skip:
+        return page_func
+    return partial(_run_filtered, page_func, skip)
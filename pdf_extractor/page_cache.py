@@ -0,0 +1,449 @@
+"""Per-page result cache keyed by page content hashes.
+
+PDFs amended with incremental updates (a signature, one corrected page)
+keep every unchanged page's content stream and resources byte-for-byte.
+Each page is fingerprinted by hashing its decoded content stream, its
+resources (fonts, images, form XObjects, followed recursively) and its
+geometry, and extraction results are stored under that fingerprint. On a
+re-extraction only pages whose fingerprint changed are laid out again.
+
+The same fingerprints find repeated pages within one document (boilerplate
+terms, blank signature pages): each distinct page is extracted once and its
+result reused for every copy, with or without a persistent cache.
+"""
+
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+import hashlib
+import json
+import logging
+import sqlite3
+
+try:
+    import PyPDF2
+    from PyPDF2.generic import (
+        ArrayObject,
+        DictionaryObject,
+        IndirectObject,
+        StreamObject,
+    )
+except ImportError:
+    PyPDF2 = None
+
+from .utils import select_pages
+
+logger = logging.getLogger(__name__)
+
+# Page attributes that change how the content stream is laid out
+_GEOMETRY_KEYS = ("/MediaBox", "/CropBox", "/Rotate", "/UserUnit")
+
+_EOF_MARKER = b"%%EOF"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    document TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    revisions INTEGER NOT NULL,
+    fingerprints TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS page_results (
+    fingerprint TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, kind)
+);
+"""
+
+
+def count_revisions(pdf_path: Union[str, Path], chunk_size: int = 1 << 20) -> int:
+    """
+    Count the revisions of a PDF: the original save plus each incremental update.
+
+    Every save, full or incremental, ends with its own ``%%EOF`` marker.
+    A linearized file also ends its first-page section with one, which is
+    not an update.
+
+    Args:
+        pdf_path: Path to the PDF file
+        chunk_size: Bytes read at a time
+
+    Returns:
+        Number of revisions, at least 1
+    """
+    count = 0
+    tail = b""
+    linearized = False
+    with open(pdf_path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            data = tail + chunk
+            if not tail:
+                linearized = b"/Linearized" in data[:1024]
+            count += data.count(_EOF_MARKER)
+            # Keep a partial marker at the chunk boundary for the next read,
+            # without keeping a whole one that was already counted.
+            tail = data[-(len(_EOF_MARKER) - 1):]
+    if linearized and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def page_fingerprints(pdf_path: Union[str, Path]) -> List[str]:
+    """
+    Hash every page's content stream, resources and geometry.
+
+    Shared objects such as fonts are hashed once per document.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Hex digest per page, in page order
+    """
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is required to fingerprint pages")
+
+    memo: Dict[Tuple[int, int], bytes] = {}
+    fingerprints = []
+
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        for page in reader.pages:
+            digest = hashlib.sha256()
+            for key in ("/Contents", "/Resources") + _GEOMETRY_KEYS:
+                value = page.raw_get(key) if key in page else None
+                digest.update(_object_digest(value, memo, set()))
+            fingerprints.append(digest.hexdigest())
+
+    return fingerprints
+
+
+def _object_digest(
+    obj: Any, memo: Dict[Tuple[int, int], bytes], stack: Set[Tuple[int, int]]
+) -> bytes:
+    """Hash a PDF object by value, following indirect references."""
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key in memo:
+            return memo[key]
+        if key in stack:
+            # Reference cycle; the object is already being hashed further up
+            return b"cycle"
+        stack.add(key)
+        try:
+            memo[key] = _object_digest(obj.get_object(), memo, stack)
+        finally:
+            stack.discard(key)
+        return memo[key]
+
+    digest = hashlib.sha256()
+    if isinstance(obj, StreamObject):
+        digest.update(b"stream")
+        skip = ("/Length", "/Filter", "/DecodeParms")
+        digest.update(_dictionary_digest(obj, memo, stack, skip=skip))
+        # get_data is defined on StreamObject's encoded and decoded subclasses
+        digest.update(cast(Any, obj).get_data())
+    elif isinstance(obj, DictionaryObject):
+        digest.update(b"dict")
+        digest.update(_dictionary_digest(obj, memo, stack))
+    elif isinstance(obj, (ArrayObject, list)):
+        digest.update(b"array")
+        for item in obj:
+            digest.update(_object_digest(item, memo, stack))
+    else:
+        digest.update(f"{type(obj).__name__}:{obj!r}".encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _dictionary_digest(
+    obj: "DictionaryObject",
+    memo: Dict[Tuple[int, int], bytes],
+    stack: Set[Tuple[int, int]],
+    skip: Iterable[str] = (),
+) -> bytes:
+    """Hash a dictionary independent of key order."""
+    digest = hashlib.sha256()
+    for key in sorted(obj):
+        if key in skip or key == "/Parent":
+            continue
+        digest.update(str(key).encode("utf-8", "surrogatepass"))
+        # raw_get keeps indirect references, so shared objects hit the memo
+        digest.update(_object_digest(obj.raw_get(key), memo, stack))
+    return digest.digest()
+
+
+class PageResults:
+    """Cached results of one kind for the pages of one document."""
+
+    def __init__(
+        self,
+        cache: Optional["PageCache"],
+        kind: str,
+        fingerprints: List[str],
+        results: Dict[str, Any],
+    ) -> None:
+        """
+        Initialize the per-document view.
+
+        Args:
+            cache: Cache new results are written back to (optional, None
+                keeps results for this document only)
+            kind: Result kind, e.g. ``"text/pdfplumber"``
+            fingerprints: Fingerprint of every page, in page order
+            results: Cached results by fingerprint
+        """
+        self.cache = cache
+        self.kind = kind
+        self.fingerprints = fingerprints
+        self.results = results
+        self.reused_pages: List[int] = []
+        self.duplicate_pages: List[int] = []
+        self._extracted: Set[str] = set()
+
+    def __contains__(self, page_num: int) -> bool:
+        """Return True if a result for the one-based page is cached."""
+        return self._fingerprint(page_num) in self.results
+
+    def __getitem__(self, page_num: int) -> Any:
+        """
+        Return the cached result for a one-based page.
+
+        The page is counted as a duplicate if an identical page of this
+        document was extracted earlier in the run, otherwise as reused from
+        the cache.
+        """
+        fingerprint = self._fingerprint(page_num)
+        if fingerprint is None:
+            raise KeyError(page_num)
+        if fingerprint in self._extracted:
+            self.duplicate_pages.append(page_num)
+        else:
+            self.reused_pages.append(page_num)
+        return self.results[fingerprint]
+
+    def put(self, page_num: int, result: Any) -> None:
+        """Store the result of a one-based page that was just extracted."""
+        fingerprint = self._fingerprint(page_num)
+        if fingerprint is None:
+            return
+        self.results[fingerprint] = result
+        self._extracted.add(fingerprint)
+        if self.cache is not None:
+            self.cache.put(fingerprint, self.kind, result)
+
+    def _fingerprint(self, page_num: int) -> Optional[str]:
+        """Fingerprint of a one-based page, or None if it is out of range."""
+        if 1 <= page_num <= len(self.fingerprints):
+            return self.fingerprints[page_num - 1]
+        return None
+
+
+class PageCache:
+    """
+    SQLite store of per-page extraction results keyed by page fingerprint.
+
+    Fingerprints of a document are themselves cached under its path, size
+    and modification time, so an unchanged file is not hashed again.
+    """
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        """
+        Open (and create if needed) a page cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection suitable for several concurrent writers."""
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=wal")
+        conn.execute("PRAGMA busy_timeout=60000")
+        return conn
+
+    def fingerprints(self, pdf_path: Union[str, Path]) -> List[str]:
+        """
+        Return the page fingerprints of a PDF, hashing it only if it changed.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Hex digest per page, in page order
+        """
+        pdf_path = Path(pdf_path)
+        document = str(pdf_path.resolve())
+        stat = pdf_path.stat()
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns, fingerprints FROM documents WHERE document = ?",
+                (document,),
+            ).fetchone()
+            if row is not None and (row[0], row[1]) == (stat.st_size, stat.st_mtime_ns):
+                fingerprints: List[str] = json.loads(row[2])
+                return fingerprints
+
+            revisions = count_revisions(pdf_path)
+            fingerprints = page_fingerprints(pdf_path)
+            if revisions > 1:
+                logger.info(
+                    f"{pdf_path} has {revisions - 1} incremental update(s); "
+                    "only changed pages will be extracted again"
+                )
+
+            conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(document, size, mtime_ns, revisions, fingerprints) VALUES (?, ?, ?, ?, ?)",
+                (document, stat.st_size, stat.st_mtime_ns, revisions, json.dumps(fingerprints)),
+            )
+            return fingerprints
+        finally:
+            conn.close()
+
+    def results(self, pdf_path: Union[str, Path], kind: str) -> PageResults:
+        """
+        Look up the cached results of every page of a document.
+
+        Args:
+            pdf_path: Path to the PDF file
+            kind: Result kind, e.g. ``"text/pdfplumber"``
+
+        Returns:
+            PageResults for the document
+        """
+        fingerprints = self.fingerprints(pdf_path)
+        unique = sorted(set(fingerprints))
+        results: Dict[str, Any] = {}
+
+        conn = self._connect()
+        try:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                rows = conn.execute(
+                    "SELECT fingerprint, result FROM page_results WHERE kind = ? "
+                    f"AND fingerprint IN ({', '.join('?' * len(batch))})",
+                    (kind, *batch),
+                ).fetchall()
+                results.update((fingerprint, json.loads(result)) for fingerprint, result in rows)
+        finally:
+            conn.close()
+
+        return PageResults(self, kind, fingerprints, results)
+
+    def put(self, fingerprint: str, kind: str, result: Any) -> None:
+        """Store one page result; results must be JSON-serializable."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO page_results (fingerprint, kind, result) VALUES (?, ?, ?)",
+                (fingerprint, kind, json.dumps(result)),
+            )
+        finally:
+            conn.close()
+
+
+def lookup(
+    cache: Optional[PageCache],
+    pdf_path: Union[str, Path],
+    kind: str,
+    dedupe: bool = False,
+) -> Optional[PageResults]:
+    """
+    Return a document's page results, or None if neither caching nor
+    duplicate detection is in use.
+
+    A cache that cannot be read (e.g. a PDF PyPDF2 cannot parse) only costs
+    the reuse; extraction then runs on every page as usual.
+
+    Args:
+        cache: Persistent page cache (optional)
+        pdf_path: Path to the PDF file
+        kind: Result kind, e.g. ``"text/pdfplumber"``
+        dedupe: Fingerprint the document to reuse results across its
+            identical pages even without a persistent cache
+    """
+    if cache is None and not dedupe:
+        return None
+    try:
+        if cache is not None:
+            return cache.results(pdf_path, kind)
+        return PageResults(None, kind, page_fingerprints(pdf_path), {})
+    except Exception as e:
+        logger.warning(f"Page fingerprints unavailable for {pdf_path}: {e}")
+        return None
+
+
+def run_uncached(
+    runner: Any,
+    pdf_path: Union[str, Path],
+    page_func: Callable[[Any], Any],
+    pages: Optional[Sequence[int]],
+    cached: Optional[PageResults],
+) -> Tuple[List[Tuple[int, Any]], List[int]]:
+    """
+    Run only the pages missing from the cache through a ``PageTimeoutRunner``.
+
+    Args:
+        runner: PageTimeoutRunner to extract uncached pages with
+        pdf_path: Path to the PDF file
+        page_func: Picklable function applied to each pdfplumber page
+        pages: One-based page numbers to extract (optional, defaults to all)
+        cached: Cached results of the document, or None
+
+    Returns:
+        Tuple of ((one-based page, result) pairs in page order, sorted
+        one-based page numbers that timed out)
+    """
+    if cached is None:
+        page_indices = [page - 1 for page in pages] if pages is not None else None
+        results, timed_out = runner.run(pdf_path, page_func, page_indices)
+        return [(index + 1, results[index]) for index in sorted(results)], timed_out
+
+    selected = select_pages(len(cached.fingerprints), pages)
+
+    # Only the first copy of each distinct uncached page goes to the runner
+    first_copies: Dict[str, int] = {}
+    for page in selected:
+        if page not in cached:
+            first_copies.setdefault(cached.fingerprints[page - 1], page)
+    missing = sorted(first_copies.values())
+    results, timed_out = (
+        runner.run(pdf_path, page_func, [page - 1 for page in missing]) if missing else ({}, [])
+    )
+
+    page_results = []
+    timed_out_copies = set(timed_out)
+    for page in selected:
+        if page in cached:
+            page_results.append((page, cached[page]))
+        elif page - 1 in results:
+            cached.put(page, results[page - 1])
+            page_results.append((page, results[page - 1]))
+        elif first_copies.get(cached.fingerprints[page - 1]) in timed_out_copies:
+            # A copy of a page that timed out is skipped along with it
+            timed_out_copies.add(page)
+    return page_results, sorted(timed_out_copies)
@@ -0,0 +1,249 @@
+"""Page-indexed text outputs with direct access to any page.
+
+Two layouts are supported:
+
+* A Parquet page table (``{name}.pages.parquet``) with ``page``, ``text``,
+  ``char_count``, ``backend`` and ``quality`` columns, written one page per
+  row group so that a page lookup only reads that page. ``quality`` is the
+  page's ``quality.score_text`` score, so weak pages can be found and
+  re-extracted without rerunning whole documents.
+* The plain ``.txt`` output plus an offset sidecar
+  (``{name}.txt.offsets.parquet``) holding the byte offset and length of each
+  page's text inside the ``.txt`` file.
+
+Both are built during extraction from the pages ``TextExtractor`` hands to
+its page sinks; the written output is never read back.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import mmap
+
+import polars as pl
+
+TEXT_FORMATS = ("txt", "parquet")
+PAGE_TABLE_SUFFIX = ".pages.parquet"
+OFFSETS_SUFFIX = ".offsets.parquet"
+
+_PAGE_SCHEMA = {
+    "page": pl.Int32,
+    "text": pl.Utf8,
+    "char_count": pl.Int64,
+    "backend": pl.Utf8,
+    "quality": pl.Float64,
+}
+
+_OFFSETS_SCHEMA = {
+    "page": pl.Int32,
+    "offset": pl.Int64,
+    "length": pl.Int64,
+    "char_count": pl.Int64,
+    "backend": pl.Utf8,
+    "quality": pl.Float64,
+}
+
+
+class PageCollector:
+    """Page sink that keeps each extracted page of the current document."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self.records: Dict[int, Dict[str, Any]] = {}
+
+    def begin_document(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> None:
+        """Forget pages from any previous document."""
+        self.records = {}
+
+    def write_page(
+        self,
+        pdf_path: Union[str, Path],
+        page: int,
+        text: str,
+        backend: Optional[str] = None,
+        quality: Optional[float] = None,
+    ) -> None:
+        """Record one page; a fallback backend replaces earlier output for the page."""
+        self.records[page] = {
+            "page": page,
+            "text": text,
+            "char_count": len(text),
+            "backend": backend,
+            "quality": quality,
+        }
+
+    def end_document(self, pdf_path: Union[str, Path], success: bool = True) -> None:
+        """Nothing to finish; records stay available until the next document."""
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return the collected pages in page order."""
+        return pl.DataFrame(
+            [self.records[page] for page in sorted(self.records)], schema=_PAGE_SCHEMA
+        )
+
+
+def page_table_path(pdf_path: Union[str, Path]) -> Path:
+    """Default Parquet page-table path for a PDF."""
+    pdf_path = Path(pdf_path)
+    return pdf_path.with_name(pdf_path.stem + PAGE_TABLE_SUFFIX)
+
+
+def offsets_path(text_path: Union[str, Path]) -> Path:
+    """Offset sidecar path for a ``.txt`` output."""
+    text_path = Path(text_path)
+    return text_path.with_name(text_path.name + OFFSETS_SUFFIX)
+
+
+def write_page_table(pages: pl.DataFrame, output_path: Union[str, Path]) -> None:
+    """
+    Write a page table as Parquet with one page per row group.
+
+    Args:
+        pages: Frame with page, text, char_count, backend and quality columns
+        output_path: Output .parquet path
+    """
+    pages.write_parquet(output_path, row_group_size=1, statistics=True)
+
+
+def write_offsets(pages: pl.DataFrame, text: str, text_path: Union[str, Path]) -> Path:
+    """
+    Write the offset sidecar for a ``.txt`` output.
+
+    Args:
+        pages: Frame with page, text, char_count, backend and quality columns
+        text: The exact text written to ``text_path``
+        text_path: Path of the .txt output
+
+    Returns:
+        Path of the sidecar file
+    """
+    sidecar = offsets_path(text_path)
+    page_offsets(pages, text).write_parquet(sidecar)
+    return sidecar
+
+
+def page_offsets(pages: pl.DataFrame, text: str) -> pl.DataFrame:
+    """
+    Locate each page's text inside the text it was extracted into.
+
+    Page texts are located in order right after their ``--- Page N ---``
+    marker, so the cost is one pass over the in-memory text. Batch workers
+    locate the pages of their part of a document, and the parent shifts
+    them by the part's position in the merged ``.txt``.
+
+    Args:
+        pages: Frame with page, text, char_count, backend and quality columns
+        text: The text the pages were extracted into
+
+    Returns:
+        Frame with page, offset, length, char_count, backend and quality columns
+    """
+    data = text.encode("utf-8")
+    rows: List[Dict[str, Any]] = []
+    cursor = 0
+
+    for record in pages.iter_rows(named=True):
+        marker = f"--- Page {record['page']} ---\n".encode("utf-8")
+        page_bytes = record["text"].encode("utf-8")
+
+        position = data.find(marker, cursor)
+        if position < 0:
+            continue
+        begin = position + len(marker)
+        if data[begin:begin + len(page_bytes)] != page_bytes:
+            continue
+
+        rows.append({
+            "page": record["page"],
+            "offset": begin,
+            "length": len(page_bytes),
+            "char_count": record["char_count"],
+            "backend": record["backend"],
+            "quality": record["quality"],
+        })
+        cursor = begin + len(page_bytes)
+
+    return pl.DataFrame(rows, schema=_OFFSETS_SCHEMA)
+
+
+class PageReader:
+    """Random access to the pages of a page table or an indexed ``.txt`` file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open a page-indexed text output.
+
+        Args:
+            path: A ``.pages.parquet`` page table, or a ``.txt`` file with an
+                offset sidecar next to it
+        """
+        self.path = Path(path)
+        self._is_table = self.path.suffix == ".parquet"
+
+        if self._is_table:
+            self.index = pl.read_parquet(self.path, columns=["page", "char_count", "backend"])
+            self._mmap = None
+        else:
+            sidecar = offsets_path(self.path)
+            if not sidecar.exists():
+                raise FileNotFoundError(f"Offset sidecar not found: {sidecar}")
+            self.index = pl.read_parquet(sidecar)
+            self._offsets = {
+                row[0]: (row[1], row[2])
+                for row in self.index.select("page", "offset", "length").iter_rows()
+            }
+            self._mmap = None
+            if self.path.stat().st_size > 0:
+                with open(self.path, "rb") as file:
+                    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def page_numbers(self) -> List[int]:
+        """Pages that have text, in order."""
+        return self.index["page"].to_list()
+
+    def page(self, page: int) -> Optional[str]:
+        """Return the text of one page, or None if the page has no text."""
+        pages = self.pages(page, page)
+        return pages[0]["text"] if pages else None
+
+    def pages(self, first: int, last: int) -> List[Dict[str, Any]]:
+        """
+        Return the pages in an inclusive range.
+
+        Returns:
+            List of {"page", "text"} dicts in page order
+        """
+        if self._is_table:
+            return (
+                pl.scan_parquet(self.path)
+                .filter(pl.col("page").is_between(first, last))
+                .select("page", "text")
+                .collect()
+                .to_dicts()
+            )
+
+        result = []
+        for page in range(first, last + 1):
+            if page in self._offsets:
+                offset, length = self._offsets[page]
+                # An empty text file is not mapped; all its pages are empty
+                data = self._mmap[offset:offset + length] if self._mmap is not None else b""
+                text = data.decode("utf-8")
+                result.append({"page": page, "text": text})
+        return result
+
+    def close(self) -> None:
+        """Release the memory map, if any."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "PageReader":
+        """Use the reader as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the reader on leaving the context."""
+        self.close()
@@ -0,0 +1,306 @@
+"""Cheap pre-flight inspection of PDFs, used to route them before extraction.
+
+``inspect_document`` reads the trailer, xref, page tree and resource
+dictionaries with PyPDF2. It also scans each page's decoded content stream
+(and the form XObjects it draws) for operators with regular expressions.
+Nothing is interpreted or laid out, so a profile costs a few milliseconds
+per page.
+
+The per-page scan finds:
+
+- text-showing operators (``Tj``, ``TJ``, ``'`` and ``"`` after a string),
+- images drawn with ``Do`` or inline (``BI``),
+- fonts selected with ``Tf``,
+- path segments that can form table rulings (``re`` and ``l``).
+
+``BatchExtractor(route=True)`` uses the profile to skip pages without text
+(scanned or blank) and to pick the table backend.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple, Union
+import logging
+import re
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+from .page_cache import count_revisions
+from .quality import shows_text
+
+logger = logging.getLogger(__name__)
+
+# Decoded content bytes that cost about as much to lay out as one extra page
+CONTENT_BYTES_PER_PAGE_EQUIVALENT = 64 * 1024
+
+_DRAW_XOBJECT = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s+Do\b")
+_INLINE_IMAGE = re.compile(rb"(?<![A-Za-z])BI\s")
+_SET_FONT = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s+[-\d.]+\s+Tf\b")
+_RULING = re.compile(rb"[\d.]\s+(?:re|l)\s")
+_STRING = re.compile(rb"\((?:\\.|[^\\)])*\)", re.DOTALL)
+
+_FONT_FILES = ("/FontFile", "/FontFile2", "/FontFile3")
+
+
+@dataclass
+class PageProfile:
+    """What one page contains, read without laying it out."""
+
+    page: int
+    width: float
+    height: float
+    rotation: int = 0
+    has_text: bool = False
+    images: int = 0
+    fonts: int = 0
+    has_rulings: bool = False
+    content_bytes: int = 0
+
+    @property
+    def kind(self) -> str:
+        """ "text", "image" (scanned), "mixed" or "empty"."""
+        if self.has_text:
+            return "mixed" if self.images else "text"
+        return "image" if self.images else "empty"
+
+    @property
+    def cost(self) -> float:
+        """Estimated layout cost in page-equivalents; pages without text cost nothing."""
+        if not self.has_text:
+            return 0.0
+        return 1.0 + self.content_bytes / CONTENT_BYTES_PER_PAGE_EQUIVALENT
+
+
+@dataclass
+class DocumentProfile:
+    """Pre-flight profile of a PDF: structure, per-page content and cost."""
+
+    pdf_path: Path
+    file_size: int
+    page_count: int
+    encrypted: bool = False
+    readable: bool = True
+    revisions: int = 1
+    fonts: int = 0
+    embedded_fonts: int = 0
+    pages: List[PageProfile] = field(default_factory=list)
+
+    @property
+    def text_pages(self) -> List[int]:
+        """One-based numbers of the pages with text operators."""
+        return [page.page for page in self.pages if page.has_text]
+
+    @property
+    def image_only_pages(self) -> List[int]:
+        """One-based numbers of the pages with images but no text (scanned pages)."""
+        return [page.page for page in self.pages if page.kind == "image"]
+
+    @property
+    def kind(self) -> str:
+        """ "digital", "scanned", "mixed" (some scanned pages), "empty" or "encrypted"."""
+        if not self.readable:
+            return "encrypted"
+        if not self.text_pages:
+            return "scanned" if self.image_only_pages else "empty"
+        return "mixed" if self.image_only_pages else "digital"
+
+    @property
+    def estimated_cost(self) -> float:
+        """Estimated extraction cost of the text pages, in page-equivalents."""
+        if not self.readable:
+            return float(self.page_count)
+        return sum(page.cost for page in self.pages)
+
+    @property
+    def table_method(self) -> str:
+        """
+        Cheapest table backend suited to the document.
+
+        Ruled tables need ruling segments, so documents without any on their
+        text pages go to the whitespace "stream" backend; the others go to
+        "lattice". Unreadable documents keep "auto".
+        """
+        if not self.readable:
+            return "auto"
+        ruled = any(page.has_rulings for page in self.pages if page.has_text)
+        return "lattice" if ruled else "stream"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the profile as JSON-serializable data."""
+        data = asdict(self)
+        data["pdf_path"] = str(self.pdf_path)
+        data["kind"] = self.kind
+        data["estimated_cost"] = round(self.estimated_cost, 3)
+        data["table_method"] = self.table_method
+        for page, profile in zip(data["pages"], self.pages):
+            page["kind"] = profile.kind
+        return data
+
+
+class _ContentScanner:
+    """Scan content streams, following form XObjects and remembering them by object id."""
+
+    def __init__(self) -> None:
+        self.fonts: Dict[int, Any] = {}
+        self._forms: Dict[int, Tuple[bool, int, Set[int], bool]] = {}
+
+    def scan(
+        self, data: bytes, resources: Any, depth: int = 0
+    ) -> Tuple[bool, int, Set[int], bool]:
+        """
+        Scan one content stream.
+
+        Returns:
+            (has text, image count, ids of the fonts selected, has rulings)
+        """
+        resources = _resolve(resources) or {}
+        has_text = shows_text(data)
+        images = len(_INLINE_IMAGE.findall(data))
+        # Drop string operands so text like "(a 1 l )" is not read as operators
+        operators = _STRING.sub(b"()", data)
+        has_rulings = bool(_RULING.search(operators))
+
+        fonts: Set[int] = set()
+        font_dict: Any = _resolve(resources.get("/Font")) or {}
+        for name in set(_SET_FONT.findall(operators)):
+            ref = font_dict.raw_get(f"/{name.decode('latin-1')}") if font_dict else None
+            if ref is not None:
+                key = ref.idnum if isinstance(ref, PyPDF2.generic.IndirectObject) else id(ref)
+                fonts.add(key)
+                self.fonts.setdefault(key, ref)
+
+        xobjects: Any = _resolve(resources.get("/XObject")) or {}
+        for name in set(_DRAW_XOBJECT.findall(operators)):
+            ref = xobjects.raw_get(f"/{name.decode('latin-1')}") if xobjects else None
+            if ref is None:
+                continue
+            xobject = _resolve(ref)
+            subtype = xobject.get("/Subtype")
+            if subtype == "/Image":
+                images += 1
+            elif subtype == "/Form" and depth < 8:
+                form = self._scan_form(ref, xobject, resources, depth)
+                has_text = has_text or form[0]
+                images += form[1]
+                fonts |= form[2]
+                has_rulings = has_rulings or form[3]
+
+        return has_text, images, fonts, has_rulings
+
+    def _scan_form(
+        self, ref: Any, xobject: Any, resources: Any, depth: int
+    ) -> Tuple[bool, int, Set[int], bool]:
+        """Scan a form XObject once and reuse the result wherever it is drawn again."""
+        key = ref.idnum if isinstance(ref, PyPDF2.generic.IndirectObject) else None
+        if key is not None and key in self._forms:
+            return self._forms[key]
+        result = self.scan(
+            xobject.get_data(), xobject.get("/Resources", resources), depth + 1
+        )
+        if key is not None:
+            self._forms[key] = result
+        return result
+
+
+def _resolve(obj: Any) -> Any:
+    """Return the object an indirect reference points to."""
+    return obj.get_object() if obj is not None else None
+
+
+def _page_content(page: Any) -> bytes:
+    """Concatenate a page's decoded content streams without parsing them."""
+    contents = _resolve(page.get("/Contents"))
+    if contents is None:
+        return b""
+    if isinstance(contents, PyPDF2.generic.ArrayObject):
+        return b"\n".join(_resolve(part).get_data() for part in contents)
+    data: bytes = contents.get_data()
+    return data
+
+
+def _is_embedded(font: Any) -> bool:
+    """Whether a font dictionary carries its font program (Type3 fonts always do)."""
+    font = _resolve(font)
+    if font.get("/Subtype") == "/Type3":
+        return True
+    if font.get("/Subtype") == "/Type0":
+        font = _resolve(_resolve(font["/DescendantFonts"])[0])
+    descriptor = _resolve(font.get("/FontDescriptor"))
+    return descriptor is not None and any(key in descriptor for key in _FONT_FILES)
+
+
+def inspect_document(pdf_path: Union[str, Path]) -> DocumentProfile:
+    """
+    Profile a PDF without interpreting or laying out its pages.
+
+    Encrypted documents are opened with the empty user password; when that
+    fails the profile has ``readable=False`` and no page details.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        DocumentProfile of the file
+    """
+    if PyPDF2 is None:
+        raise ImportError("PyPDF2 is required to inspect documents")
+
+    pdf_path = Path(pdf_path)
+    # The reader seeks to the trailer, xref and objects it needs; passing it
+    # the open file rather than the path keeps it from reading the whole file
+    with open(pdf_path, "rb") as file:
+        return _inspect(pdf_path, PyPDF2.PdfReader(file))
+
+
+def _inspect(pdf_path: Path, reader: Any) -> DocumentProfile:
+    """Profile a document through a reader on its open file."""
+    profile = DocumentProfile(
+        pdf_path=pdf_path,
+        file_size=pdf_path.stat().st_size,
+        page_count=0,
+        encrypted=reader.is_encrypted,
+        revisions=count_revisions(pdf_path),
+    )
+
+    try:
+        if reader.is_encrypted and not reader.decrypt(""):
+            raise PyPDF2.errors.FileNotDecryptedError("a user password is required")
+        profile.page_count = len(reader.pages)
+    except Exception as e:
+        logger.warning(f"Could not read pages of {pdf_path}: {e}")
+        profile.readable = False
+        return profile
+
+    scanner = _ContentScanner()
+    for number, page in enumerate(reader.pages, start=1):
+        box = page.mediabox
+        page_profile = PageProfile(
+            page=number,
+            width=float(box.width),
+            height=float(box.height),
+            rotation=int(page.get("/Rotate", 0) or 0),
+        )
+        try:
+            content = _page_content(page)
+            has_text, images, fonts, has_rulings = scanner.scan(content, page.get("/Resources"))
+            page_profile.has_text = has_text
+            page_profile.images = images
+            page_profile.fonts = len(fonts)
+            page_profile.has_rulings = has_rulings
+            page_profile.content_bytes = len(content)
+        except Exception as e:
+            logger.warning(f"Could not scan page {number} of {pdf_path}: {e}")
+            # Treat the page as text so routing still extracts it
+            page_profile.has_text = True
+        profile.pages.append(page_profile)
+
+    profile.fonts = len(scanner.fonts)
+    for font in scanner.fonts.values():
+        try:
+            profile.embedded_fonts += _is_embedded(font)
+        except Exception:
+            pass
+    return profile
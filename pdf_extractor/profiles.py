@@ -0,0 +1,86 @@
+"""Named speed/accuracy profiles that choose backends and layout settings.
+
+A profile bundles everything that trades extraction quality for speed:
+
+- the text backends, in the order they are tried, and when to move on to the
+  next one ("error": only when a backend fails; "empty": also when it finds
+  no text at all, as PyPDF2 does on fonts it cannot decode);
+- the table methods, tried in order until one finds tables;
+- whether graphics are left out of page layout (see ``object_filter``).
+
+Profiles:
+
+- ``fast`` reads text straight from the content streams with PyPDF2 and only
+  lays pages out with pdfplumber when that finds nothing. Tables come from
+  the NumPy lattice detector alone, so only ruled tables are found.
+- ``balanced`` uses pdfplumber's text with graphics skipped (the text is the
+  same), and looks for ruled tables with the lattice detector, then for
+  borderless ones with the stream detector.
+- ``accurate`` is pdfplumber with every object laid out, and tabula with
+  pdfplumber as the table fallback, as ``method="auto"`` does.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+# How the text backends fall back
+TEXT_FALLBACKS = ("error", "empty")
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Backend order, fallback rule and layout settings for one profile."""
+
+    name: str
+    text_methods: Tuple[str, ...]
+    text_fallback: str
+    table_methods: Tuple[str, ...]
+    skip_graphics: bool
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        Profile(
+            name="fast",
+            text_methods=("pypdf2", "pdfplumber"),
+            text_fallback="empty",
+            table_methods=("lattice",),
+            skip_graphics=True,
+        ),
+        Profile(
+            name="balanced",
+            text_methods=("pdfplumber", "pypdf2"),
+            text_fallback="error",
+            table_methods=("lattice", "stream"),
+            skip_graphics=True,
+        ),
+        Profile(
+            name="accurate",
+            text_methods=("pdfplumber", "pypdf2"),
+            text_fallback="error",
+            table_methods=("tabula", "pdfplumber"),
+            skip_graphics=False,
+        ),
+    )
+}
+
+PROFILE_NAMES = tuple(PROFILES)
+
+
+def get_profile(name: str) -> Profile:
+    """
+    Look up a profile by name.
+
+    Args:
+        name: One of ``PROFILE_NAMES``
+
+    Returns:
+        The profile
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown profile: {name}; choose from {', '.join(PROFILE_NAMES)}"
+        ) from None
@@ -0,0 +1,73 @@
+"""Cheap per-page text quality scores that drive backend fallback.
+
+A backend can return text without failing and still return garbage:
+``(cid:12)`` markers for glyphs whose font has no Unicode mapping, mojibake
+from a wrong encoding, words run together without spaces, or nothing at all
+on a page that shows text. ``score_text`` rates a page's text from 0 to 1 by
+multiplying three factors:
+
+- the share of non-space characters that are letters, digits, punctuation
+  or symbols, excluding replacement, control, private-use and unassigned
+  characters and UTF-8-read-as-Latin-1 pairs such as ``Ã©``;
+- one minus the share of the text taken up by ``(cid:N)`` markers;
+- a whitespace factor that drops when under 5% of a longer text is
+  whitespace (missing word spaces) or over 80% is.
+
+Ordinary text scores 1.0 or close to it. ``TextExtractor`` re-extracts pages
+below ``QUALITY_THRESHOLD`` with its next backend and keeps the better text.
+"""
+
+from typing import Optional
+import re
+import unicodedata
+
+# Pages scoring below this are re-extracted with the next backend
+QUALITY_THRESHOLD = 0.8
+
+# Texts shorter than this (without whitespace) are not judged on spacing
+_MIN_SPACED_LENGTH = 50
+
+_CID = re.compile(r"\(cid:\d+\)")
+_MOJIBAKE = re.compile("[ÂÃ][\u0080-¿]|â€.")
+_BAD_CATEGORIES = {"Cc", "Cf", "Co", "Cn", "Cs"}
+_TEXT_SHOW = re.compile(rb"[)\]>]\s*(?:Tj|TJ|'|\")")
+
+
+def score_text(text: Optional[str]) -> float:
+    """
+    Rate how much a page's extracted text looks like real text.
+
+    Args:
+        text: Extracted page text
+
+    Returns:
+        Score from 0.0 (empty or garbage) to 1.0, rounded to three places
+    """
+    if not text or not text.strip():
+        return 0.0
+
+    cid_length = sum(len(marker) for marker in _CID.findall(text))
+    text = _CID.sub("", text)
+    visible = [char for char in text if not char.isspace()]
+    if not visible:
+        return 0.0
+
+    bad = sum(len(match) for match in _MOJIBAKE.findall(text))
+    bad += sum(
+        1 for char in visible
+        if char == "�" or unicodedata.category(char) in _BAD_CATEGORIES
+    )
+    char_factor = max(0.0, 1 - bad / len(visible))
+    cid_factor = 1 - cid_length / (cid_length + len(visible))
+
+    whitespace = 1 - len(visible) / len(text)
+    space_factor = 1.0
+    if len(visible) >= _MIN_SPACED_LENGTH:
+        space_factor = min(1.0, whitespace / 0.05, (1 - whitespace) / 0.2)
+
+    return round(char_factor * cid_factor * space_factor, 3)
+
+
+def shows_text(content: bytes) -> bool:
+    """Whether a decoded content stream has text-showing operators."""
+    return bool(_TEXT_SHOW.search(content))
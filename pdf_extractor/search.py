@@ -0,0 +1,221 @@
+"""SQLite FTS5 full-text index fed page by page during text extraction."""
+
+from pathlib import Path
+from typing import Optional, Sequence, Union
+import logging
+import sqlite3
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    document TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    document TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    UNIQUE (document, page)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    text, content='pages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS pages_ai AFTER INSERT ON pages BEGIN
+    INSERT INTO pages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS pages_ad AFTER DELETE ON pages BEGIN
+    INSERT INTO pages_fts (pages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+class SearchIndex:
+    """
+    Full-text index of extracted pages.
+
+    The index acts as a page sink for ``TextExtractor``: pages are written as
+    they are extracted, so there is no second pass over the text output.
+    Documents whose size and modification time are unchanged since they were
+    last indexed are skipped on reruns; changed documents have their pages
+    replaced.
+    """
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        """
+        Open (and create if needed) a search index.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._current: Optional[str] = None
+        self._partial = False
+
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection suitable for several concurrent writers."""
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=wal")
+        conn.execute("PRAGMA busy_timeout=60000")
+        return conn
+
+    @staticmethod
+    def document_key(pdf_path: Union[str, Path]) -> str:
+        """Return the key a PDF is stored under (its resolved path)."""
+        return str(Path(pdf_path).resolve())
+
+    def is_current(self, pdf_path: Union[str, Path]) -> bool:
+        """Return True if the PDF is indexed and unchanged since then."""
+        stat = Path(pdf_path).stat()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns FROM documents WHERE document = ?",
+                (self.document_key(pdf_path),),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None and tuple(row) == (stat.st_size, stat.st_mtime_ns)
+
+    def begin_document(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        Start indexing a document, dropping its previously indexed pages.
+
+        Unchanged documents are left as they are and their pages are ignored.
+        When only some pages are being extracted (a page-range task), only
+        those pages are replaced and the document is not marked as indexed;
+        call ``finish_document`` once every range is done.
+        """
+        if self.is_current(pdf_path):
+            logger.info(f"{pdf_path} unchanged since last indexed, skipping")
+            self._current = None
+            return
+
+        # Every write is its own short transaction so that concurrent workers
+        # indexing other documents are never blocked for a whole extraction.
+        self._current = self.document_key(pdf_path)
+        self._partial = pages is not None
+        self._conn = self._connect()
+        if pages is None:
+            self._conn.execute("DELETE FROM pages WHERE document = ?", (self._current,))
+        else:
+            self._conn.executemany(
+                "DELETE FROM pages WHERE document = ? AND page = ?",
+                [(self._current, page) for page in pages],
+            )
+
+    def write_page(
+        self,
+        pdf_path: Union[str, Path],
+        page: int,
+        text: str,
+        backend: Optional[str] = None,
+        quality: Optional[float] = None,
+    ) -> None:
+        """Index one page of the current document."""
+        conn = self._conn
+        if conn is None or self._current != self.document_key(pdf_path):
+            return
+
+        # A fallback backend may re-emit pages already written
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM pages WHERE document = ? AND page = ?", (self._current, page))
+        conn.execute(
+            "INSERT INTO pages (document, page, text) VALUES (?, ?, ?)",
+            (self._current, page, text),
+        )
+        conn.execute("COMMIT")
+
+    def end_document(self, pdf_path: Union[str, Path], success: bool = True) -> None:
+        """
+        Finish the current document.
+
+        Only a successful whole-document run marks the document as indexed,
+        so a failed or partial run is redone on the next extraction.
+        """
+        conn = self._conn
+        if conn is None:
+            return
+
+        try:
+            if success and not self._partial:
+                self._mark_indexed(conn, pdf_path)
+        finally:
+            conn.close()
+            self._conn = None
+            self._current = None
+
+    def finish_document(self, pdf_path: Union[str, Path], page_count: int) -> None:
+        """
+        Mark a document indexed by several page-range runs as complete.
+
+        Pages beyond ``page_count`` (left over from an older, longer version of
+        the document) are removed.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM pages WHERE document = ? AND page > ?",
+                (self.document_key(pdf_path), page_count),
+            )
+            self._mark_indexed(conn, pdf_path)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _mark_indexed(self, conn: sqlite3.Connection, pdf_path: Union[str, Path]) -> None:
+        """Record the size and modification time the document was indexed at."""
+        stat = Path(pdf_path).stat()
+        conn.execute(
+            "INSERT OR REPLACE INTO documents (document, size, mtime_ns) VALUES (?, ?, ?)",
+            (self.document_key(pdf_path), stat.st_size, stat.st_mtime_ns),
+        )
+
+    def search(self, query: str, limit: int = 10) -> pl.DataFrame:
+        """
+        Run a ranked full-text query.
+
+        Args:
+            query: FTS5 query string, e.g. ``"docket AND 2024-CV-0001"``
+            limit: Maximum number of page hits to return
+
+        Returns:
+            DataFrame with document, page, score (lower is better, BM25) and
+            snippet columns, best matches first
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT p.document, p.page, bm25(pages_fts) AS score, "
+                "snippet(pages_fts, 0, '[', ']', '...', 12) "
+                "FROM pages_fts JOIN pages p ON p.id = pages_fts.rowid "
+                "WHERE pages_fts MATCH ? ORDER BY score LIMIT ?",
+                (query, limit),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return pl.DataFrame(
+            rows,
+            schema={
+                "document": pl.Utf8,
+                "page": pl.Int64,
+                "score": pl.Float64,
+                "snippet": pl.Utf8,
+            },
+            orient="row",
+        )
@@ -0,0 +1,433 @@
+"""Long-running local HTTP extraction server with a pool of warm workers.
+
+Starting the interpreter and importing pdfplumber, PyPDF2 and tabula costs
+far more than extracting a small document. The server pays that cost once
+per worker process at startup and then serves requests from the warm pool.
+
+Endpoints:
+    POST /extract/text, /extract/tables, /extract/all
+        Body is either the raw PDF (``Content-Type: application/pdf``) or a
+        JSON object ``{"path": "/path/to/file.pdf"}``. Responses are JSON.
+        Table requests that send ``Accept: application/vnd.apache.arrow.stream``
+        get one Arrow IPC stream per table, written back to back. A malformed
+        request or a body that is not a PDF gets 400, a body over the size
+        limit gets 413, and a PDF that cannot be parsed gets 422. Only
+        failures of the server itself are 500s and count towards
+        ``errors_total``.
+    GET /health
+    GET /metrics
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+import polars as pl
+
+try:
+    from PyPDF2.errors import PyPdfError
+except ImportError:
+    PyPdfError = None
+
+try:
+    from pdfminer.psparser import PSException
+    from pdfplumber.utils.exceptions import MalformedPDFException, PdfminerException
+except ImportError:
+    PSException = MalformedPDFException = PdfminerException = None
+
+from .extractor import PDFExtractor
+from .ipc import export_result, import_result, table_streams
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+EXTRACT_KINDS = ("text", "tables", "all")
+
+# Seconds the workers may take to start and import their dependencies
+WARM_UP_TIMEOUT = 120
+
+# Largest request body accepted by default
+MAX_BODY_MB = 256
+
+# A PDF starts with this header within its first kilobyte
+PDF_HEADER = b"%PDF-"
+
+# Raised by the parsers for a document they cannot read, not a server fault
+DOCUMENT_ERRORS = tuple(
+    error
+    for error in (PyPdfError, PSException, MalformedPDFException, PdfminerException)
+    if error is not None
+)
+
+_worker_extractor: Optional[PDFExtractor] = None
+_warm_barrier: Any = None
+
+
+def _init_worker(
+    page_timeout: Optional[float],
+    doc_timeout: Optional[float],
+    page_cache: Optional[str],
+    dedupe_pages: bool,
+    area_cache_size: Optional[int],
+    skip_graphics: bool,
+    font_cache_mb: Optional[int],
+    warm_barrier: Any,
+) -> None:
+    """Worker process initializer: build the extractor once and keep it warm."""
+    global _worker_extractor, _warm_barrier
+    _warm_barrier = warm_barrier
+    _worker_extractor = PDFExtractor(
+        page_timeout=page_timeout,
+        doc_timeout=doc_timeout,
+        page_cache=page_cache,
+        dedupe_pages=dedupe_pages,
+        area_cache_size=area_cache_size,
+        skip_graphics=skip_graphics,
+        font_cache_mb=font_cache_mb,
+    )
+
+
+def _ping() -> int:
+    """Task used to start every worker process up front."""
+    # Each ping holds its worker until all of them have one, so the pool
+    # cannot hand two pings to the same worker and has to start them all
+    _warm_barrier.wait(timeout=WARM_UP_TIMEOUT)
+    return os.getpid()
+
+
+def _extract_in_worker(pdf_path: str, kind: str) -> Dict[str, Any]:
+    """
+    Run one extraction request inside a warm worker process.
+
+    Text and tables go back through a memory-mapped Arrow spool file; only
+    the handle, the timed-out, duplicate and low-quality page lists and the
+    page quality scores are pickled.
+    """
+    text = None
+    tables: List[pl.DataFrame] = []
+    timed_out_pages: List[int] = []
+    duplicate_pages: List[int] = []
+    quality: Dict[str, Any] = {}
+    extractor = _worker_extractor
+    if extractor is None:
+        raise RuntimeError("Extraction worker was not initialized")
+
+    if kind in ("text", "all"):
+        text = extractor.extract_text(pdf_path)
+        timed_out_pages.extend(extractor.text_extractor.timed_out_pages)
+        duplicate_pages.extend(extractor.text_extractor.duplicate_pages)
+        quality = {
+            "low_quality_pages": extractor.text_extractor.low_quality_pages,
+            "page_scores": extractor.text_extractor.page_scores,
+        }
+
+    if kind in ("tables", "all"):
+        tables = extractor.extract_tables(pdf_path)
+        timed_out_pages.extend(extractor.table_extractor.timed_out_pages)
+        duplicate_pages.extend(extractor.table_extractor.duplicate_pages)
+
+    return {
+        "shared": export_result(text, tables),
+        "timed_out_pages": sorted(set(timed_out_pages)),
+        "duplicate_pages": sorted(set(duplicate_pages)),
+        **quality,
+    }
+
+
+class _Metrics:
+    """Thread-safe request counters exposed on /metrics."""
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+
+    def begin(self) -> None:
+        """Record an accepted request."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+
+    def end(self, seconds: float, error: bool = False) -> None:
+        """Record a finished request and its latency."""
+        with self._lock:
+            self.in_flight -= 1
+            self.total_seconds += seconds
+            if error:
+                self.errors += 1
+
+    def reject(self) -> None:
+        """Record a request rejected by backpressure."""
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current counters."""
+        with self._lock:
+            completed = self.requests - self.in_flight
+            return {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "requests_total": self.requests,
+                "rejected_total": self.rejected,
+                "errors_total": self.errors,
+                "in_flight": self.in_flight,
+                "mean_latency_seconds": (
+                    round(self.total_seconds / completed, 6) if completed else 0.0
+                ),
+            }
+
+
+class ExtractionServer:
+    """HTTP server that hands extraction requests to a pool of warm workers."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: Optional[int] = None,
+        max_queue: int = 32,
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        page_cache: Optional[str] = None,
+        dedupe_pages: bool = False,
+        area_cache_size: Optional[int] = None,
+        skip_graphics: bool = False,
+        font_cache_mb: Optional[int] = None,
+        max_body_mb: int = MAX_BODY_MB,
+    ) -> None:
+        """
+        Initialize the server and start its worker processes.
+
+        Args:
+            host: Interface to bind (keep the default to stay local-only)
+            port: Port to bind, 0 picks a free port
+            workers: Number of worker processes (optional, defaults to CPU count)
+            max_queue: Requests allowed to wait for a worker before new ones
+                are rejected with 429
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per document before extraction stops (optional)
+            page_cache: SQLite cache of per-page results shared by the workers (optional)
+            dedupe_pages: Extract identical pages within a document only once
+            area_cache_size: Table layouts each worker remembers, see
+                ``PDFExtractor`` (optional)
+            skip_graphics: Leave images and vector graphics out of page
+                layout, see ``PDFExtractor``
+            font_cache_mb: Memory cap of each worker's parsed-font cache,
+                see ``PDFExtractor`` (optional)
+            max_body_mb: Largest request body in megabytes; larger ones are
+                rejected with 413 before they are read
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_mb * 1024 * 1024
+        self.metrics = _Metrics()
+        self.slots = threading.BoundedSemaphore(self.workers + max_queue)
+
+        # Spawn rather than fork: a forked child inherits Polars' thread pool
+        # in whatever state the parent left it and can deadlock on first use.
+        context = multiprocessing.get_context("spawn")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                page_timeout,
+                doc_timeout,
+                page_cache,
+                dedupe_pages,
+                area_cache_size,
+                skip_graphics,
+                font_cache_mb,
+                context.Barrier(self.workers),
+            ),
+        )
+        self._warm_up()
+
+        handler = type("Handler", (_RequestHandler,), {"server_state": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The (host, port) the server is bound to."""
+        host, port = self.httpd.server_address[:2]
+        return str(host), port
+
+    def _warm_up(self) -> None:
+        """Start every worker process now instead of on the first requests."""
+        futures = [self.executor.submit(_ping) for _ in range(self.workers)]
+        pids = {future.result() for future in futures}
+        logger.debug(f"Started {len(pids)} worker processes")
+
+    def serve_forever(self) -> None:
+        """Serve requests until ``shutdown`` is called."""
+        self.httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serving and terminate the worker pool."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.executor.shutdown()
+
+    def extract(self, pdf_path: str, kind: str) -> Dict[str, Any]:
+        """Run one extraction on the pool and wait for the result."""
+        return self.executor.submit(_extract_in_worker, pdf_path, kind).result()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Translate HTTP requests into pool submissions."""
+
+    server_state: ExtractionServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route access logs through the module logger."""
+        logger.debug(format % args)
+
+    def do_GET(self) -> None:
+        """Serve /health and /metrics."""
+        state = self.server_state
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "workers": state.workers})
+        elif self.path == "/metrics":
+            metrics = state.metrics.snapshot()
+            metrics.update({"workers": state.workers, "max_queue": state.max_queue})
+            self._send_json(200, metrics)
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        """Serve /extract/{text,tables,all} with queue-limit backpressure."""
+        state = self.server_state
+        kind = self.path.rstrip("/").rsplit("/", 1)[-1]
+        if not self.path.startswith("/extract/") or kind not in EXTRACT_KINDS:
+            self._refuse(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._refuse(400, {"error": "Invalid Content-Length"})
+            return
+        if length > state.max_body_bytes:
+            self._refuse(413, {"error": f"Request body over {state.max_body_bytes} bytes"})
+            return
+
+        if not state.slots.acquire(blocking=False):
+            state.metrics.reject()
+            self._refuse(429, {"error": "Server busy, retry later"}, {"Retry-After": "1"})
+            return
+
+        state.metrics.begin()
+        started = time.perf_counter()
+        error = False
+        try:
+            body = self.rfile.read(length)
+            status, payload, content_type = self._handle_extract(kind, body)
+            error = status >= 500
+            self._send(status, payload, content_type)
+        finally:
+            state.slots.release()
+            state.metrics.end(time.perf_counter() - started, error)
+
+    def _handle_extract(self, kind: str, body: bytes) -> Tuple[int, bytes, str]:
+        """Run the extraction and build (status, body, content type)."""
+        temp_path: Optional[str] = None
+        try:
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                try:
+                    request = json.loads(body or b"{}")
+                except ValueError as e:
+                    return _json_body(400, {"error": f"Invalid JSON body: {e}"})
+                if not isinstance(request, dict):
+                    return _json_body(400, {"error": "JSON body must be an object"})
+                pdf_path = request.get("path")
+                if not isinstance(pdf_path, str) or not Path(pdf_path).is_file():
+                    return _json_body(400, {"error": f"PDF file not found: {pdf_path}"})
+                with open(pdf_path, "rb") as file:
+                    if PDF_HEADER not in file.read(1024):
+                        return _json_body(400, {"error": f"Not a PDF: {pdf_path}"})
+            else:
+                if PDF_HEADER not in body[:1024]:
+                    return _json_body(400, {"error": "Request body is not a PDF"})
+                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                    tmp.write(body)
+                    temp_path = pdf_path = tmp.name
+
+            result = self.server_state.extract(pdf_path, kind)
+        except DOCUMENT_ERRORS as e:
+            logger.warning(f"Could not read the PDF of an extraction request: {e}")
+            return _json_body(422, {"error": f"Could not read PDF: {e}"})
+        except Exception as e:
+            logger.error(f"Error handling extraction request: {e}")
+            return _json_body(500, {"error": str(e)})
+        finally:
+            if temp_path is not None:
+                os.unlink(temp_path)
+
+        shared = result.pop("shared")
+        if kind == "tables" and ARROW_STREAM in self.headers.get("Accept", ""):
+            # Pass the workers' IPC streams through without decoding them
+            body = b"".join(stream.to_pybytes() for stream in table_streams(shared))
+            return 200, body, ARROW_STREAM
+
+        text, tables = import_result(shared)
+        if kind in ("text", "all"):
+            result["text"] = text
+        if kind in ("tables", "all"):
+            result["tables"] = [_table_to_json(table) for table in tables]
+        return _json_body(200, result)
+
+    def _send_json(
+        self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a JSON response."""
+        self._send(*_json_body(status, payload), headers=headers)
+
+    def _refuse(
+        self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Send a JSON error without reading the request body, then close the connection."""
+        self.close_connection = True
+        self._send_json(status, payload, {"Connection": "close", **(headers or {})})
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Send a complete response with a Content-Length header."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _json_body(status: int, payload: Dict[str, Any]) -> Tuple[int, bytes, str]:
+    """Encode a JSON response."""
+    return status, json.dumps(payload, default=str).encode("utf-8"), "application/json"
+
+
+def _table_to_json(table: pl.DataFrame) -> Dict[str, List[Any]]:
+    """Represent a table as column names plus row tuples."""
+    return {"columns": table.columns, "rows": [list(row) for row in table.rows()]}
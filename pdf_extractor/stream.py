@@ -0,0 +1,142 @@
+"""Borderless-table ("stream") detection by vectorized clustering of word positions.
+
+Tables without ruling lines are recovered from the layout of the words alone:
+
+1. Word baselines are snapped into text lines.
+2. Within each line, words separated by a gap wider than ``column_gap`` start
+   a new chunk. Lines with at least two chunks are candidate table rows, and
+   each run of consecutive candidate rows is a table region.
+3. For each region, a coverage histogram of the words' x-extents is built
+   with one ``cumsum`` over 1pt bins. Every run of empty bins at least
+   ``column_gap`` wide is whitespace shared by all rows, so its middle becomes
+   a column boundary.
+4. Words are assigned to (row, column) cells in one ``searchsorted`` pass.
+
+No ruling lines, JVM or pairwise word comparisons are involved.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .lattice import Bbox, cluster
+
+# Gaps and line tolerances are relative to the median word height on the page
+COLUMN_GAP = 0.75
+LINE_TOLERANCE = 0.5
+MIN_ROWS = 2
+MIN_COLUMNS = 2
+
+
+def find_tables(
+    page: Any,
+    column_gap: float = COLUMN_GAP,
+    line_tolerance: float = LINE_TOLERANCE,
+    min_rows: int = MIN_ROWS,
+    min_columns: int = MIN_COLUMNS,
+) -> List[Tuple[Bbox, List[List[Optional[str]]]]]:
+    """
+    Find the whitespace-separated tables on a pdfplumber page.
+
+    Args:
+        page: pdfplumber page
+        column_gap: Smallest gap between columns, in median word heights
+        line_tolerance: Baselines closer than this, in median word heights,
+            are one text line
+        min_rows: Fewest rows (header included) a table may have
+        min_columns: Fewest columns a table may have
+
+    Returns:
+        List of (bbox as (x0, top, x1, bottom), rows) per table, top to
+        bottom. Rows are lists of cell strings, "" for empty cells.
+    """
+    words = page.extract_words()
+    if not words:
+        return []
+
+    text = [w["text"] for w in words]
+    boxes = np.array([(w["x0"], w["top"], w["x1"], w["bottom"]) for w in words], dtype=float)
+    x0, top, x1, bottom = boxes.T
+    height = float(np.median(bottom - top))
+    gap = column_gap * height
+
+    line_ids, _ = cluster(bottom, line_tolerance * height)
+    order = np.lexsort((x0, line_ids))
+    lines, x0, top, x1, bottom = line_ids[order], x0[order], top[order], x1[order], bottom[order]
+    text = [text[i] for i in order]
+
+    # Chunks: runs of words on one line without a column-sized gap between them
+    new_chunk = np.ones(len(lines), dtype=bool)
+    new_chunk[1:] = (lines[1:] != lines[:-1]) | (x0[1:] - x1[:-1] > gap)
+    chunks = np.bincount(lines, weights=new_chunk)
+
+    candidate = np.flatnonzero(chunks >= min_columns)
+    if len(candidate) < min_rows:
+        return []
+    region_starts = np.flatnonzero(np.diff(candidate, prepend=-2) != 1)
+    region_ends = np.append(region_starts[1:], len(candidate))
+
+    results = []
+    for start, end in zip(region_starts.tolist(), region_ends.tolist()):
+        region_lines = candidate[start:end]
+        if len(region_lines) < min_rows:
+            continue
+
+        in_region = np.isin(lines, region_lines)
+        bounds = _column_bounds(x0[in_region], x1[in_region], gap)
+        if len(bounds) + 1 < min_columns:
+            continue
+
+        rows = _region_rows(
+            np.searchsorted(region_lines, lines[in_region]),
+            np.searchsorted(bounds, x0[in_region]),
+            [t for t, keep in zip(text, in_region.tolist()) if keep],
+            len(region_lines),
+            len(bounds) + 1,
+        )
+        bbox = (
+            float(x0[in_region].min()),
+            float(top[in_region].min()),
+            float(x1[in_region].max()),
+            float(bottom[in_region].max()),
+        )
+        results.append((bbox, rows))
+    return results
+
+
+def _column_bounds(x0: np.ndarray, x1: np.ndarray, gap: float) -> np.ndarray:
+    """
+    Find the column boundaries of a region from its words' horizontal extents.
+
+    Returns:
+        Ascending x positions of the middles of the empty runs at least
+        ``gap`` wide between the leftmost and rightmost word
+    """
+    origin = x0.min()
+    size = int(np.ceil(x1.max() - origin)) + 1
+
+    # Coverage histogram: +1 where a word starts, -1 where it ends
+    delta = np.zeros(size + 1)
+    np.add.at(delta, np.floor(x0 - origin).astype(int), 1)
+    np.add.at(delta, np.ceil(x1 - origin).astype(int), -1)
+    empty = np.cumsum(delta)[:size] <= 0
+
+    edges = np.diff(empty.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    wide = run_ends - run_starts >= gap
+    centres: np.ndarray = origin + (run_starts[wide] + run_ends[wide]) / 2
+    return centres
+
+
+def _region_rows(
+    row: np.ndarray, col: np.ndarray, text: List[str], n_rows: int, n_cols: int
+) -> List[List[Optional[str]]]:
+    """Join each cell's words, which arrive in reading order, with spaces."""
+    cells: Dict[Tuple[int, int], List[str]] = {}
+    for r, c, word in zip(row.tolist(), col.tolist(), text):
+        cells.setdefault((r, c), []).append(word)
+    return [
+        [" ".join(cells.get((r, c), [])) for c in range(n_cols)]
+        for r in range(n_rows)
+    ]
@@ -1,7 +1,7 @@
 """Table extraction from PDF files and conversion to Polars DataFrames."""
 
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 import logging
 
 import polars as pl
@@ -17,119 +17,619 @@ try:
 except ImportError:
     pdfplumber = None
 
+from . import font_cache, lattice, stream
+from .area_cache import CACHEABLE_BACKENDS, TableAreaCache, page_tables
+from .layout_snapshot import LayoutSnapshots, save_snapshot, snapshot_kinds
+from .object_filter import filtered, load_layout, normalize_skip
+from .page_cache import PageCache, lookup, run_uncached
+from .table_index import TableLocation, overlap, table_schema_hash
+from .timeouts import PageTimeoutRunner
+from .utils import select_pages
+
 logger = logging.getLogger(__name__)
 
+Bbox = Tuple[float, float, float, float]
+
+
+def _as_bbox(values: Sequence[float]) -> Bbox:
+    """Return an (x0, top, x1, bottom) sequence as a tuple of floats."""
+    x0, top, x1, bottom = values
+    return (float(x0), float(top), float(x1), float(bottom))
+
+def _page_tables(page: Any) -> List[Tuple[Bbox, List[List[Any]]]]:
+    """Extract the bbox and raw rows of each table on a single pdfplumber page."""
+    return [(table.bbox, table.extract()) for table in page.find_tables()]
+
+
+def _page_lattice_tables(page: Any) -> List[Tuple[Bbox, List[List[Optional[str]]]]]:
+    """Extract the ruled tables on a page with the NumPy lattice detector."""
+    return lattice.find_tables(page)
+
+
+def _page_stream_tables(page: Any) -> List[Tuple[Bbox, List[List[Optional[str]]]]]:
+    """Extract the whitespace-separated tables on a page."""
+    return stream.find_tables(page)
+
+
+# Backends that run on pdfplumber pages, by method name; each returns
+# (bbox, raw rows) per table
+_PAGE_TABLE_FUNCS = {
+    "pdfplumber": _page_tables,
+    "lattice": _page_lattice_tables,
+    "stream": _page_stream_tables,
+}
+
+# Detection settings each backend runs with, recorded in table locations
+_BACKEND_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "tabula": {"multiple_tables": True, "pandas_options": {"header": 0}},
+    "pdfplumber": {"table_settings": {}},
+    "lattice": {
+        "snap_tolerance": lattice.SNAP_TOLERANCE,
+        "join_tolerance": lattice.JOIN_TOLERANCE,
+    },
+    "stream": {
+        "column_gap": stream.COLUMN_GAP,
+        "line_tolerance": stream.LINE_TOLERANCE,
+        "min_rows": stream.MIN_ROWS,
+        "min_columns": stream.MIN_COLUMNS,
+    },
+}
+
+# Points added around an indexed table's bbox when re-extracting it, so
+# rulings drawn on its border stay inside the crop
+REGION_MARGIN = 2.0
+
+TABLE_METHODS = ("auto", "tabula", *_PAGE_TABLE_FUNCS)
+
 
 class TableExtractor:
     """Extract tabular data from PDF files and convert to Polars DataFrames."""
     
-    def __init__(self, method: str = "auto") -> None:
+    def __init__(
+        self,
+        method: Union[str, Sequence[str]] = "auto",
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        page_cache: Optional[PageCache] = None,
+        dedupe_pages: bool = False,
+        area_cache: Optional[TableAreaCache] = None,
+        skip_objects: Optional[Sequence[str]] = None,
+        layout_snapshots: Optional[LayoutSnapshots] = None,
+    ) -> None:
         """
         Initialize table extractor.
         
         Args:
-            method: Extraction method ("tabula", "pdfplumber", or "auto")
+            method: Extraction method ("tabula", "pdfplumber", "lattice", "stream"
+                or "auto"); "lattice" finds fully ruled tables from the page's
+                lines and rects, "stream" finds borderless tables from the
+                whitespace between words. A sequence of methods is tried in
+                order until one finds tables; "auto" is ("tabula", "pdfplumber")
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per document before extraction stops (optional)
+            page_cache: Cache of per-page results keyed by page content hash;
+                pdfplumber only detects tables on pages it has not seen (optional)
+            dedupe_pages: Detect tables on each distinct page of a document once
+                and reuse them for identical pages (optional)
+            area_cache: Cache of table cell layouts by page layout signature;
+                pages whose rulings match a cached page skip table detection.
+                Used by the pdfplumber and lattice methods without timeouts
+                (optional)
+            skip_objects: Object types pdfplumber leaves out while laying out
+                pages ("image", "line", "rect", "curve"). Use
+                ``object_filter.RULINGS_ONLY`` to keep only the lines and rects
+                tables are detected from; rulings drawn as curves are then
+                ignored (optional)
+            layout_snapshots: Store of per-document layout snapshots; pages
+                held in a document's snapshot are restored from it instead
+                of being laid out, and pages laid out are added to it. Used
+                by the pdfplumber-based methods without timeouts (optional)
         """
+        if not isinstance(method, str):
+            method = tuple(method)
+            unknown = set(method) - set(TABLE_METHODS[1:])
+            if unknown or not method:
+                raise ValueError(f"Unknown table method(s): {', '.join(sorted(unknown))}")
+        
         self.method = method
+        self.page_timeout = page_timeout
+        self.doc_timeout = doc_timeout
+        self.page_cache = page_cache
+        self.dedupe_pages = dedupe_pages
+        self.area_cache = area_cache
+        self.skip_objects = normalize_skip(skip_objects)
+        self.layout_snapshots = layout_snapshots
+        self.timed_out_pages: List[int] = []
+        self.reused_pages: List[int] = []
+        self.duplicate_pages: List[int] = []
+        self._table_locations: List[TableLocation] = []
+        # (pdf_path, pages, tables read_pdf returned, positions of those kept)
+        # of a tabula run whose tables are not located yet
+        self._unlocated_tabula: Optional[
+            Tuple[Path, Optional[Sequence[int]], int, List[int]]
+        ] = None
         
         if method == "tabula" and tabula is None:
             raise ImportError("tabula-py is required for tabula method")
-        elif method == "pdfplumber" and pdfplumber is None:
-            raise ImportError("pdfplumber is required for pdfplumber method")
+        elif method in _PAGE_TABLE_FUNCS and pdfplumber is None:
+            raise ImportError(f"pdfplumber is required for {method} method")
     
-    def extract(self, pdf_path: Union[str, Path]) -> List[pl.DataFrame]:
+    @property
+    def table_locations(self) -> List[TableLocation]:
+        """
+        Location of each table the last run returned, in the same order.
+        
+        tabula tables are located on first access rather than during
+        extraction, because that reads every page again with tabula; runs
+        that never write a location index do not pay for it.
+        """
+        if self._unlocated_tabula is not None:
+            self._locate_tabula_tables(*self._unlocated_tabula)
+            self._unlocated_tabula = None
+        return self._table_locations
+    
+    @table_locations.setter
+    def table_locations(self, locations: List[TableLocation]) -> None:
+        self._table_locations = locations
+        self._unlocated_tabula = None
+    
+    def extract(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> List[pl.DataFrame]:
         """
         Extract tables from PDF file as Polars DataFrames.
         
         Args:
             pdf_path: Path to the PDF file
+            pages: One-based page numbers to extract (optional, defaults to all)
             
         Returns:
-            List of Polars DataFrames containing table data
+            List of Polars DataFrames containing table data; where each one
+            came from is left in ``table_locations``, in the same order
         """
         pdf_path = Path(pdf_path)
         
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
+        self.timed_out_pages = []
+        self.reused_pages = []
+        self.duplicate_pages = []
+        self.table_locations = []
+        
         if self.method == "tabula":
-            return self._extract_with_tabula(pdf_path)
-        elif self.method == "pdfplumber":
-            return self._extract_with_pdfplumber(pdf_path)
-        else:  # auto method
-            # Try tabula first (generally better for complex tables)
-            if tabula is not None:
-                try:
-                    tables = self._extract_with_tabula(pdf_path)
-                    if tables:  # If we found tables, return them
-                        return tables
-                except Exception as e:
-                    logger.warning(f"tabula failed: {e}, trying pdfplumber")
-            
-            # Fallback to pdfplumber
-            if pdfplumber is not None:
-                return self._extract_with_pdfplumber(pdf_path)
-            
+            return self._extract_with_tabula(pdf_path, pages)
+        elif self.method in _PAGE_TABLE_FUNCS:
+            return self._extract_with_pdfplumber(pdf_path, pages, self.method)
+        
+        # auto method or a sequence: tabula is generally better for complex tables
+        methods = ("tabula", "pdfplumber") if self.method == "auto" else self.method
+        available = [
+            method for method in methods
+            if (tabula if method == "tabula" else pdfplumber) is not None
+        ]
+        if not available:
             raise ImportError("No table extraction library available")
+        
+        tables: List[pl.DataFrame] = []
+        for method in available:
+            if method == "tabula":
+                tables = self._extract_with_tabula(pdf_path, pages)
+            else:
+                tables = self._extract_with_pdfplumber(pdf_path, pages, method)
+            if tables:
+                break
+        return tables
+    
+    def extract_page_region(self, page: Any, bbox: Sequence[float]) -> List[pl.DataFrame]:
+        """
+        Extract the tables inside one area of an open pdfplumber page.
+        
+        Only the area is searched, so detection cost scales with the area
+        rather than the page. The "auto" method uses pdfplumber here.
+        
+        Args:
+            page: pdfplumber page
+            bbox: Area as (x0, top, x1, bottom) in points from the top-left corner
+        
+        Returns:
+            List of Polars DataFrames for the tables found in the area
+        """
+        if self.method == "tabula":
+            raise ValueError(
+                "tabula cannot extract from an open page; use a pdfplumber-based method"
+            )
+        
+        backend = self._page_backend()
+        load_layout(page, self.skip_objects)
+        tables = _PAGE_TABLE_FUNCS[backend](page.crop(tuple(bbox), strict=False))
+        return self._to_polars([rows for _, rows in tables], backend)
     
-    def _extract_with_tabula(self, pdf_path: Path) -> List[pl.DataFrame]:
+    def extract_table(self, location: TableLocation) -> Optional[pl.DataFrame]:
+        """
+        Re-extract one indexed table from just its area of its page.
+        
+        Only the table's page is loaded (or restored from a layout
+        snapshot), and only the recorded bbox plus ``REGION_MARGIN`` is
+        searched. The extractor's own method and skipped objects are used;
+        "auto" reuses the backend recorded in the location, so a table found
+        by tabula is read again by tabula from just that area. If the area
+        holds several tables, the one overlapping the recorded bbox most is
+        returned. Its new location is left in ``table_locations``.
+        
+        Args:
+            location: Location of the table, e.g. from ``table_index.load_location``
+        
+        Returns:
+            The table as a Polars DataFrame, or None if none is found in the area
+        """
+        if location.page is None or location.bbox is None:
+            raise ValueError(
+                f"Table from {location.document} was indexed with no page or bbox "
+                f"({location.backend} could not locate it); re-extract the whole "
+                "document instead"
+            )
+        pdf_path = Path(location.document)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        self.table_locations = []
+        recorded = self.method == "auto" and location.backend == "tabula"
+        if (self.method == "tabula" or recorded) and tabula is not None:
+            return self._extract_tabula_area(pdf_path, location.page, location.bbox)
+        if self.method == "auto" and location.backend in _PAGE_TABLE_FUNCS:
+            backend = location.backend
+        else:
+            backend = self._page_backend()
+        
+        snapshot = None
+        if self.layout_snapshots is not None:
+            snapshot = self.layout_snapshots.open(pdf_path, snapshot_kinds(self.skip_objects))
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            font_cache.attach(pdf)
+            page = pdf.pages[location.page - 1]
+            if snapshot is None or not snapshot.restore(page):
+                load_layout(page, self.skip_objects)
+            x0, top, x1, bottom = location.bbox
+            region = (
+                max(x0 - REGION_MARGIN, page.bbox[0]),
+                max(top - REGION_MARGIN, page.bbox[1]),
+                min(x1 + REGION_MARGIN, page.bbox[2]),
+                min(bottom + REGION_MARGIN, page.bbox[3]),
+            )
+            found = _PAGE_TABLE_FUNCS[backend](page.crop(region, strict=False))
+        
+        best = None
+        for bbox, rows in found:
+            for table in self._to_polars([rows], backend):
+                shared = overlap(bbox, location.bbox)
+                if best is None or shared > best[0]:
+                    best = (shared, bbox, table)
+        if best is None:
+            return None
+        
+        _, bbox, table = best
+        self.table_locations = [self._locate(pdf_path, location.page, bbox, backend, table)]
+        return table
+    
+    def _extract_with_tabula(
+        self, pdf_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> List[pl.DataFrame]:
         """Extract tables using tabula-py."""
         try:
-            # Extract all tables from all pages
-            pandas_tables = tabula.read_pdf(
+            # Extract all tables from the requested pages
+            pandas_tables = cast(List[pd.DataFrame], tabula.read_pdf(
                 str(pdf_path), 
-                pages='all', 
+                pages=sorted(set(pages)) if pages is not None else 'all', 
                 multiple_tables=True,
                 pandas_options={'header': 0}
-            )
-            
-            # Convert pandas DataFrames to Polars DataFrames
-            polars_tables = []
-            for i, df in enumerate(pandas_tables):
-                if not df.empty:
-                    # Clean up the DataFrame
-                    df = df.dropna(how='all')  # Remove completely empty rows
-                    df = df.dropna(axis=1, how='all')  # Remove completely empty columns
-                    
-                    if not df.empty:
-                        # Convert to Polars
-                        polars_df = pl.from_pandas(df)
-                        polars_tables.append(polars_df)
-            
-            return polars_tables
+            ))
+            kept = self._tabula_to_polars(pandas_tables)
             
         except Exception as e:
             logger.error(f"Error extracting tables with tabula: {e}")
             return []
+        
+        self.table_locations = [
+            self._locate(pdf_path, None, None, "tabula", table) for _, table in kept
+        ]
+        if kept:
+            self._unlocated_tabula = (
+                pdf_path, pages, len(pandas_tables), [i for i, _ in kept]
+            )
+        return [table for _, table in kept]
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> List[pl.DataFrame]:
-        """Extract tables using pdfplumber."""
-        polars_tables = []
+    def _locate_tabula_tables(
+        self,
+        pdf_path: Path,
+        pages: Optional[Sequence[int]],
+        table_count: int,
+        positions: List[int],
+    ) -> None:
+        """Fill in the page and bbox of the tables of the last tabula run."""
+        areas = self._tabula_areas(pdf_path, pages)
+        if areas is None:
+            return
+        if len(areas) != table_count:
+            logger.warning(
+                f"tabula found {table_count} tables in {pdf_path} but located "
+                f"{len(areas)}; indexing them without pages"
+            )
+            return
+        for location, position in zip(self._table_locations, positions):
+            location.page, location.bbox = areas[position]
+    
+    def _tabula_to_polars(
+        self, pandas_tables: List[pd.DataFrame]
+    ) -> List[Tuple[int, pl.DataFrame]]:
+        """Clean tabula's DataFrames and convert them, keeping each one's position."""
+        polars_tables: List[Tuple[int, pl.DataFrame]] = []
+        for i, df in enumerate(pandas_tables):
+            if not df.empty:
+                # Clean up the DataFrame
+                df = df.dropna(how='all')  # Remove completely empty rows
+                df = df.dropna(axis=1, how='all')  # Remove completely empty columns
+                
+                if not df.empty:
+                    # Convert to Polars
+                    polars_tables.append((i, pl.from_pandas(df)))
+        return polars_tables
+    
+    def _tabula_areas(
+        self, pdf_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> Optional[List[Tuple[int, Bbox]]]:
+        """
+        Page and bbox of each table tabula finds, in the order ``read_pdf`` returns them.
+        
+        tabula's DataFrames do not say where they came from, so each page is
+        read again as tabula-java JSON, which gives every table's top, left,
+        width and height in points from the top-left corner. One JSON read
+        of all the pages would not do: tabula-java's JSON has no page
+        number. This repeats tabula's detection, and without jpype starts a
+        JVM, once per page. Tables without cells are skipped, as
+        ``read_pdf`` skips them.
         
+        Returns:
+            List of (one-based page, bbox) per table, or None if a page could
+            not be read
+        """
+        if pdfplumber is None:
+            return None
+        
+        areas: List[Tuple[int, Bbox]] = []
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
+                page_numbers = select_pages(len(pdf.pages), pages)
+            for page_num in page_numbers:
+                raw = cast(
+                    List[Dict[str, Any]],
+                    tabula.read_pdf(str(pdf_path), pages=page_num, output_format="json"),
+                )
+                for table in raw:
+                    if table["data"]:
+                        left, top = table["left"], table["top"]
+                        bbox = (left, top, left + table["width"], top + table["height"])
+                        areas.append((page_num, _as_bbox(bbox)))
+        except Exception as e:
+            logger.warning(f"Could not locate tabula tables in {pdf_path}: {e}")
+            return None
+        return areas
+    
+    def _extract_tabula_area(
+        self, pdf_path: Path, page_num: int, bbox: Bbox
+    ) -> Optional[pl.DataFrame]:
+        """Read one indexed table again with tabula from just its area of its page."""
+        x0, top, x1, bottom = bbox
+        pandas_tables = cast(List[pd.DataFrame], tabula.read_pdf(
+            str(pdf_path),
+            pages=page_num,
+            area=[
+                max(top - REGION_MARGIN, 0.0),
+                max(x0 - REGION_MARGIN, 0.0),
+                bottom + REGION_MARGIN,
+                x1 + REGION_MARGIN,
+            ],
+            guess=False,
+            multiple_tables=True,
+            pandas_options={'header': 0},
+        ))
+        kept = self._tabula_to_polars(pandas_tables)
+        if not kept:
+            return None
+        
+        table = kept[0][1]
+        self.table_locations = [self._locate(pdf_path, page_num, bbox, "tabula", table)]
+        return table
+    
+    def _extract_with_pdfplumber(
+        self,
+        pdf_path: Path,
+        pages: Optional[Sequence[int]] = None,
+        backend: str = "pdfplumber",
+    ) -> List[pl.DataFrame]:
+        """Extract tables with one of the backends that run on pdfplumber pages."""
+        if self.page_timeout is not None or self.doc_timeout is not None:
+            return self._extract_with_pdfplumber_timed(pdf_path, pages, backend)
+        
+        polars_tables: List[pl.DataFrame] = []
+        locations: List[TableLocation] = []
+        page_func = _PAGE_TABLE_FUNCS[backend]
+        cached = lookup(self.page_cache, pdf_path, self._cache_kind(backend), self.dedupe_pages)
+        snapshot = None
+        if self.layout_snapshots is not None:
+            snapshot = self.layout_snapshots.open(pdf_path, snapshot_kinds(self.skip_objects))
+        
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                font_cache.attach(pdf)
+                for page_num in select_pages(len(pdf.pages), pages):
                     try:
-                        tables = page.extract_tables()
-                        
-                        for table_num, table in enumerate(tables):
-                            if table and len(table) > 1:  # Must have header + at least one data row
-                                # Convert table to pandas DataFrame first
-                                df = pd.DataFrame(table[1:], columns=table[0])
-                                
-                                # Clean up the DataFrame
-                                df = df.dropna(how='all')
-                                df = df.dropna(axis=1, how='all')
-                                
-                                if not df.empty:
-                                    # Convert to Polars
-                                    polars_df = pl.from_pandas(df)
-                                    polars_tables.append(polars_df)
+                        if cached is not None and page_num in cached:
+                            tables = cached[page_num]
+                        else:
+                            page = pdf.pages[page_num - 1]
+                            if snapshot is None or not snapshot.restore(page):
+                                load_layout(page, self.skip_objects)
+                                if snapshot is not None:
+                                    snapshot.record(page)
+                            if self.area_cache is not None and backend in CACHEABLE_BACKENDS:
+                                tables = page_tables(page, backend, self.area_cache)
+                            else:
+                                tables = page_func(page)
+                            if cached is not None:
+                                cached.put(page_num, tables)
+                        self._add_tables(
+                            polars_tables, locations, pdf_path, page_num, tables, backend
+                        )
                     
                     except Exception as e:
-                        logger.warning(f"Error extracting tables from page {page_num + 1}: {e}")
+                        logger.warning(f"Error extracting tables from page {page_num}: {e}")
+        
+        except Exception as e:
+            logger.error(f"Error extracting tables with {backend}: {e}")
+        
+        save_snapshot(snapshot)
+        if cached is not None:
+            self.reused_pages = cached.reused_pages
+            self.duplicate_pages = cached.duplicate_pages
+        self.table_locations = locations
+        return polars_tables
+    
+    def _extract_with_pdfplumber_timed(
+        self,
+        pdf_path: Path,
+        pages: Optional[Sequence[int]] = None,
+        backend: str = "pdfplumber",
+    ) -> List[pl.DataFrame]:
+        """Extract tables from pdfplumber pages in a subprocess with page/document deadlines."""
+        polars_tables: List[pl.DataFrame] = []
+        locations: List[TableLocation] = []
+        
+        cached = lookup(self.page_cache, pdf_path, self._cache_kind(backend), self.dedupe_pages)
+        
+        try:
+            page_results, self.timed_out_pages = run_uncached(
+                PageTimeoutRunner(self.page_timeout, self.doc_timeout),
+                pdf_path,
+                filtered(_PAGE_TABLE_FUNCS[backend], self.skip_objects),
+                pages,
+                cached,
+            )
+            
+            for page_num, tables in page_results:
+                self._add_tables(polars_tables, locations, pdf_path, page_num, tables, backend)
         
         except Exception as e:
-            logger.error(f"Error extracting tables with pdfplumber: {e}")
+            logger.error(f"Error extracting tables with {backend}: {e}")
+        
+        if cached is not None:
+            self.reused_pages = cached.reused_pages
+            self.duplicate_pages = cached.duplicate_pages
+        self.table_locations = locations
+        return polars_tables
+    
+    def _page_backend(self) -> str:
+        """The first pdfplumber-page backend among the methods; "pdfplumber" for "auto"."""
+        methods = (self.method,) if isinstance(self.method, str) else self.method
+        return next((m for m in methods if m in _PAGE_TABLE_FUNCS), "pdfplumber")
+    
+    def _cache_kind(self, backend: str) -> str:
+        """Page cache key for a backend; skipped object types change the tables found."""
+        # Results hold (bbox, rows) per table since table locations were added
+        if self.skip_objects:
+            return f"tables/{backend}/bbox/skip={','.join(sorted(self.skip_objects))}"
+        return f"tables/{backend}/bbox"
+    
+    def _locate(
+        self,
+        pdf_path: Path,
+        page_num: Optional[int],
+        bbox: Optional[Sequence[float]],
+        backend: str,
+        table: pl.DataFrame,
+    ) -> TableLocation:
+        """Record where a table was found and with which settings."""
+        settings = dict(_BACKEND_SETTINGS[backend])
+        if backend != "tabula":
+            settings["skip_objects"] = sorted(self.skip_objects)
+        return TableLocation(
+            document=str(pdf_path.resolve()),
+            page=page_num,
+            bbox=_as_bbox(bbox) if bbox is not None else None,
+            backend=backend,
+            settings=settings,
+            schema_hash=table_schema_hash(table),
+        )
+    
+    def _add_tables(
+        self,
+        polars_tables: List[pl.DataFrame],
+        locations: List[TableLocation],
+        pdf_path: Path,
+        page_num: int,
+        tables: List[Tuple[Bbox, List[List[Any]]]],
+        backend: str,
+    ) -> None:
+        """Convert one page's tables and record the location of each one kept."""
+        for bbox, rows in tables:
+            for table in self._to_polars([rows], backend):
+                polars_tables.append(table)
+                locations.append(self._locate(pdf_path, page_num, bbox, backend, table))
+    
+    def _to_polars(self, tables: List[List[List[Any]]], backend: str) -> List[pl.DataFrame]:
+        """Convert raw rows from a pdfplumber-page backend to Polars DataFrames."""
+        if backend == "pdfplumber":
+            return self._rows_to_polars(tables)
+        return self._grid_to_polars(tables)
+    
+    def _rows_to_polars(self, tables: List[List[List[Any]]]) -> List[pl.DataFrame]:
+        """Convert raw pdfplumber table rows to cleaned Polars DataFrames."""
+        polars_tables = []
+        
+        for table in tables:
+            if table and len(table) > 1:  # Must have header + at least one data row
+                # Convert table to pandas DataFrame first
+                df = pd.DataFrame(table[1:], columns=table[0])
+                
+                # Clean up the DataFrame
+                df = df.dropna(how='all')
+                df = df.dropna(axis=1, how='all')
+                
+                if not df.empty:
+                    # Convert to Polars
+                    polars_df = pl.from_pandas(df)
+                    polars_tables.append(polars_df)
+        
+        return polars_tables
+    
+    def _grid_to_polars(self, tables: List[List[List[Optional[str]]]]) -> List[pl.DataFrame]:
+        """
+        Build Polars DataFrames straight from cell grids, without pandas.
+        
+        Applies the same cleanup as ``_rows_to_polars``: the first row is the
+        header, and rows and columns that are entirely empty (None) are dropped.
+        """
+        polars_tables = []
+        
+        for table in tables:
+            if not table or len(table) < 2:  # Must have header + at least one data row
+                continue
+            
+            columns: Dict[str, List[Optional[str]]] = {}
+            for index, name in enumerate(table[0]):
+                name = name or f"column_{index}"
+                while name in columns:
+                    name = f"{name}_{index}"
+                columns[name] = [row[index] for row in table[1:]]
+            
+            df = pl.DataFrame(columns, schema={name: pl.Utf8 for name in columns})
+            df = df.filter(~pl.all_horizontal(pl.all().is_null()))
+            df = df.select(
+                [name for name in df.columns if df[name].null_count() < df.height]
+            )
+            
+            if df.height and df.width:
+                polars_tables.append(df)
         
-        return polars_tables
\ No newline at end of file
+        return polars_tables
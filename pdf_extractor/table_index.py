@@ -0,0 +1,165 @@
+"""Location index of extracted tables, for re-extracting one table at a time.
+
+Every ``TableExtractor`` run records where each table it returns came
+from in ``table_locations``. A ``TableLocation`` holds the document, the
+one-based page, the table's bbox on that page, the backend and its
+settings, and the hash of the table's schema. This is the same hash that
+``catalog`` groups table files by.
+
+``extract-tables``, ``extract-all``, ``batch`` and ``worker`` write the
+locations next to the tables as ``{name}_tables.index.parquet``. It has
+one row per ``{name}_table_{i}.parquet``, in table order.
+``TableExtractor.extract_table`` re-extracts a single indexed table from
+the recorded area of its page, and ``reextract-table`` does the same from
+the command line.
+
+tabula's DataFrames do not carry their pages or areas, so tabula tables
+are located by reading each page again as tabula-java JSON, the first
+time ``table_locations`` is read after a run. Only if that
+fails is a table indexed with an empty page and bbox, and such a table
+cannot be re-extracted on its own.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+import json
+
+import polars as pl
+
+from .catalog import schema_hash
+
+TABLE_INDEX_SUFFIX = "_tables.index.parquet"
+
+_INDEX_SCHEMA = {
+    "table": pl.Int32,
+    "file": pl.Utf8,
+    "document": pl.Utf8,
+    "page": pl.Int32,
+    "x0": pl.Float64,
+    "top": pl.Float64,
+    "x1": pl.Float64,
+    "bottom": pl.Float64,
+    "backend": pl.Utf8,
+    "settings": pl.Utf8,
+    "schema_hash": pl.Utf8,
+}
+
+Bbox = Tuple[float, float, float, float]
+
+
+@dataclass
+class TableLocation:
+    """Where one extracted table came from and how it was found."""
+
+    document: str
+    page: Optional[int]
+    bbox: Optional[Bbox]
+    backend: str
+    settings: Dict[str, Any] = field(default_factory=dict)
+    schema_hash: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the location as an index row, without the table number and file."""
+        x0, top, x1, bottom = self.bbox if self.bbox is not None else (None,) * 4
+        return {
+            "document": self.document,
+            "page": self.page,
+            "x0": x0,
+            "top": top,
+            "x1": x1,
+            "bottom": bottom,
+            "backend": self.backend,
+            "settings": json.dumps(self.settings, sort_keys=True),
+            "schema_hash": self.schema_hash,
+        }
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "TableLocation":
+        """Build a location from an index row."""
+        bbox = tuple(row[key] for key in ("x0", "top", "x1", "bottom"))
+        return cls(
+            document=row["document"],
+            page=row["page"],
+            bbox=None if None in bbox else bbox,
+            backend=row["backend"],
+            settings=json.loads(row["settings"] or "{}"),
+            schema_hash=row["schema_hash"],
+        )
+
+
+def table_schema_hash(table: pl.DataFrame) -> Optional[str]:
+    """Schema hash of a table, as ``catalog`` computes it from the written file."""
+    if not isinstance(table, pl.DataFrame):
+        return None
+    schema = table.head(0).to_arrow().schema
+    return schema_hash(schema.names, [str(dtype) for dtype in schema.types])
+
+
+def table_index_path(output_dir: Union[str, Path], pdf_name: str) -> Path:
+    """Location index path of a document's tables in an output directory."""
+    return Path(output_dir) / f"{pdf_name}{TABLE_INDEX_SUFFIX}"
+
+
+def write_table_index(
+    locations: Sequence[TableLocation], output_dir: Union[str, Path], pdf_name: str
+) -> Path:
+    """
+    Write the location index of a document's tables.
+
+    Args:
+        locations: Location of each table, in the order the tables were written
+        output_dir: Directory holding the ``{pdf_name}_table_{i}.parquet`` files
+        pdf_name: Document name the table files are named after
+
+    Returns:
+        Path of the index file
+    """
+    rows = [
+        {"table": i, "file": f"{pdf_name}_table_{i}.parquet", **location.to_dict()}
+        for i, location in enumerate(locations)
+    ]
+    path = table_index_path(output_dir, pdf_name)
+    pl.DataFrame(rows, schema=_INDEX_SCHEMA).write_parquet(path)
+    return path
+
+
+def read_table_index(index_path: Union[str, Path]) -> pl.DataFrame:
+    """Read a location index; one row per table."""
+    return pl.read_parquet(index_path)
+
+
+def load_location(index_path: Union[str, Path], table: int) -> Tuple[TableLocation, Path]:
+    """
+    Look up one table in a location index.
+
+    Args:
+        index_path: ``{name}_tables.index.parquet`` file
+        table: Table number, as in ``{name}_table_{table}.parquet``
+
+    Returns:
+        Tuple of (location, path of the table's Parquet file)
+    """
+    index_path = Path(index_path)
+    rows = read_table_index(index_path).filter(pl.col("table") == table).to_dicts()
+    if not rows:
+        raise KeyError(f"Table {table} is not in {index_path}")
+    return TableLocation.from_dict(rows[0]), index_path.parent / rows[0]["file"]
+
+
+def update_table_index(
+    index_path: Union[str, Path], table: int, location: TableLocation
+) -> None:
+    """Replace one table's row of a location index with a new location."""
+    rows = read_table_index(index_path).to_dicts()
+    for row in rows:
+        if row["table"] == table:
+            row.update(location.to_dict())
+    pl.DataFrame(rows, schema=_INDEX_SCHEMA).write_parquet(index_path)
+
+
+def overlap(a: Sequence[float], b: Sequence[float]) -> float:
+    """Area shared by two (x0, top, x1, bottom) boxes."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    return max(width, 0.0) * max(height, 0.0)
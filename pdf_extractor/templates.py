@@ -0,0 +1,475 @@
+"""Template-driven extraction of known regions from recurring layouts.
+
+A template names the regions of a recurring form or invoice layout:
+
+.. code-block:: json
+
+    {
+        "name": "acme_invoice",
+        "match": {
+            "page_count": [1, 3],
+            "page_size": [612, 792],
+            "fonts": ["Helvetica-Bold"],
+            "anchors": ["ACME Corp", "INVOICE"]
+        },
+        "fields": {
+            "invoice_no": {"page": 1, "bbox": [400, 90, 560, 110]},
+            "total": {"page": 1, "bbox": [450, 700, 560, 720], "type": "float"},
+            "issued": {"page": 1, "bbox": [400, 110, 560, 130],
+                       "type": "date", "format": "%B %d, %Y",
+                       "pattern": "Date: (.*)"}
+        },
+        "tables": {
+            "line_items": {"page": 1, "bbox": [50, 200, 560, 650], "method": "lattice"}
+        }
+    }
+
+Boxes are (x0, top, x1, bottom) in points from the top-left corner of the
+page, as pdfplumber reports them. Templates are read from JSON, or YAML when
+PyYAML is installed.
+
+Matching uses a cheap fingerprint read with PyPDF2: page count, first-page
+size, first-page font names and, only if a template has anchors, the
+PyPDF2 text of the first page. The content of a matched document is only
+parsed on the pages its template refers to, and only the template's regions
+are turned into text or searched for tables.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import json
+import logging
+import re
+
+import polars as pl
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    import pdfplumber
+    from pdfminer.layout import LTContainer
+except ImportError:
+    pdfplumber = None
+
+from . import font_cache
+from .table_extractor import TABLE_METHODS, TableExtractor
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Page sizes within this many points match
+PAGE_SIZE_TOLERANCE = 1.0
+
+_FIELD_TYPES: Dict[str, pl.DataType] = {
+    "str": pl.Utf8(),
+    "int": pl.Int64(),
+    "float": pl.Float64(),
+    "date": pl.Date(),
+}
+
+
+def _bbox(value: Any, where: str) -> Tuple[float, float, float, float]:
+    """Validate a (x0, top, x1, bottom) box."""
+    if not isinstance(value, (list, tuple)) or len(value) != 4:
+        raise ValueError(f"{where}: bbox must be [x0, top, x1, bottom]")
+    x0, top, x1, bottom = (float(v) for v in value)
+    if x0 >= x1 or top >= bottom:
+        raise ValueError(f"{where}: bbox is empty")
+    return x0, top, x1, bottom
+
+
+def _normalize(text: str) -> str:
+    """Collapse runs of whitespace so anchors match across line breaks."""
+    return " ".join(text.split())
+
+
+@dataclass
+class TemplateField:
+    """A named text region converted to a typed value."""
+
+    name: str
+    page: int
+    bbox: Tuple[float, float, float, float]
+    type: str = "str"
+    format: Optional[str] = None
+    pattern: Optional[str] = None
+
+    def convert(self, text: str) -> Any:
+        """
+        Turn the region text into the field's value.
+
+        With a ``pattern``, its first group (or whole match) is used instead
+        of the full text. Numbers may carry currency signs and ``,``
+        thousands separators; ``.`` is always the decimal point. An ``int``
+        field with a non-zero fractional part, such as "1,234.50", is
+        rejected rather than truncated. Text that does not convert gives None.
+        """
+        text = text.strip()
+        if self.pattern is not None:
+            match = re.search(self.pattern, text)
+            if match is None:
+                return None
+            text = (match.group(1) if match.groups() else match.group(0)).strip()
+        if not text:
+            return None
+
+        try:
+            if self.type == "int":
+                value = Decimal(re.sub(r"[^\d.\-]", "", text))
+                if value != value.to_integral_value():
+                    logger.warning(f"Field {self.name}: {text!r} is not a whole number")
+                    return None
+                return int(value)
+            if self.type == "float":
+                return float(re.sub(r"[^\d.\-]", "", text))
+            if self.type == "date":
+                return datetime.strptime(text, self.format or "%Y-%m-%d").date()
+        except (ValueError, InvalidOperation):
+            logger.warning(f"Field {self.name}: cannot read {text!r} as {self.type}")
+            return None
+        return text
+
+
+@dataclass
+class TemplateTable:
+    """A named area searched for one table."""
+
+    name: str
+    page: int
+    bbox: Tuple[float, float, float, float]
+    method: str = "pdfplumber"
+
+
+@dataclass
+class Template:
+    """A recurring layout: how to recognize it and which regions to extract."""
+
+    name: str
+    match: Dict[str, Any] = field(default_factory=dict)
+    fields: List[TemplateField] = field(default_factory=list)
+    tables: List[TemplateTable] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "Template":
+        """
+        Build a template from its JSON/YAML form.
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        if not isinstance(spec, dict) or not spec.get("name"):
+            raise ValueError("Template spec must be a mapping with a name")
+        name = spec["name"]
+
+        match = dict(spec.get("match") or {})
+        unknown = set(match) - {"page_count", "page_size", "fonts", "anchors"}
+        if unknown:
+            raise ValueError(f"{name}: unknown match keys {sorted(unknown)}")
+
+        fields = []
+        for field_name, field_spec in (spec.get("fields") or {}).items():
+            where = f"{name}.fields.{field_name}"
+            field_type = field_spec.get("type", "str")
+            if field_type not in _FIELD_TYPES:
+                raise ValueError(f"{where}: unknown type {field_type!r}")
+            fields.append(TemplateField(
+                name=field_name,
+                page=int(field_spec.get("page", 1)),
+                bbox=_bbox(field_spec.get("bbox"), where),
+                type=field_type,
+                format=field_spec.get("format"),
+                pattern=field_spec.get("pattern"),
+            ))
+
+        tables = []
+        for table_name, table_spec in (spec.get("tables") or {}).items():
+            where = f"{name}.tables.{table_name}"
+            method = table_spec.get("method", "pdfplumber")
+            if method not in TABLE_METHODS or method == "tabula":
+                raise ValueError(f"{where}: unsupported method {method!r}")
+            tables.append(TemplateTable(
+                name=table_name,
+                page=int(table_spec.get("page", 1)),
+                bbox=_bbox(table_spec.get("bbox"), where),
+                method=method,
+            ))
+
+        if not fields and not tables:
+            raise ValueError(f"{name}: template has no fields or tables")
+        return cls(name=name, match=match, fields=fields, tables=tables)
+
+    @property
+    def schema(self) -> Dict[str, pl.DataType]:
+        """Polars schema of the records this template produces."""
+        schema: Dict[str, pl.DataType] = {"document": pl.Utf8(), "template": pl.Utf8()}
+        schema.update({f.name: _FIELD_TYPES[f.type] for f in self.fields})
+        return schema
+
+    @property
+    def pages(self) -> List[int]:
+        """Pages the template reads regions from."""
+        regions: List[Union[TemplateField, TemplateTable]] = [*self.fields, *self.tables]
+        return sorted({region.page for region in regions})
+
+    def matches(self, fingerprint: "DocumentFingerprint") -> bool:
+        """Return True if the document fingerprint satisfies every match rule."""
+        page_count = self.match.get("page_count")
+        if page_count is not None:
+            low, high = page_count if isinstance(page_count, list) else (page_count, page_count)
+            if not low <= fingerprint.page_count <= high:
+                return False
+
+        if fingerprint.page_count < max(self.pages):
+            return False
+
+        page_size = self.match.get("page_size")
+        if page_size is not None and not all(
+            abs(a - b) <= PAGE_SIZE_TOLERANCE for a, b in zip(page_size, fingerprint.page_size)
+        ):
+            return False
+
+        fonts = self.match.get("fonts")
+        if fonts and not set(fonts) <= fingerprint.fonts:
+            return False
+
+        anchors = self.match.get("anchors")
+        if anchors:
+            text = fingerprint.first_page_text()
+            if not all(_normalize(anchor) in text for anchor in anchors):
+                return False
+        return True
+
+
+class DocumentFingerprint:
+    """Cheap layout facts about a PDF, read without parsing page content."""
+
+    def __init__(self, pdf_path: Union[str, Path]) -> None:
+        """
+        Read the fingerprint of a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+        """
+        if PyPDF2 is None:
+            raise ImportError("PyPDF2 is required for template matching")
+
+        self._reader = PyPDF2.PdfReader(str(pdf_path))
+        self.page_count = len(self._reader.pages)
+        self.page_size: Tuple[float, float] = (0.0, 0.0)
+        self.fonts: frozenset = frozenset()
+        self._text: Optional[str] = None
+
+        if self.page_count:
+            first = self._reader.pages[0]
+            self.page_size = (float(first.mediabox.width), float(first.mediabox.height))
+            resources = first.get("/Resources")
+            resources = resources.get_object() if resources is not None else {}
+            fonts = resources.get("/Font")
+            fonts = fonts.get_object() if fonts is not None else {}
+            self.fonts = frozenset(
+                str(font.get_object().get("/BaseFont", "")).lstrip("/")
+                for font in fonts.values()
+            )
+
+    def first_page_text(self) -> str:
+        """PyPDF2 text of the first page with whitespace collapsed (read once)."""
+        if self._text is None:
+            self._text = (
+                _normalize(self._reader.pages[0].extract_text() or "")
+                if self.page_count else ""
+            )
+        return self._text
+
+
+@dataclass
+class TemplateRecord:
+    """Typed values and tables extracted from one document with a template."""
+
+    document: Path
+    template: Template
+    fields: Dict[str, Any] = field(default_factory=dict)
+    tables: Dict[str, Optional[pl.DataFrame]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as JSON-ready values; dates become ISO strings."""
+        values = {
+            name: value.isoformat() if isinstance(value, date) else value
+            for name, value in self.fields.items()
+        }
+        return {
+            "document": str(self.document),
+            "template": self.template.name,
+            "fields": values,
+            "tables": {
+                name: table.to_dicts() if table is not None else None
+                for name, table in self.tables.items()
+            },
+        }
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return the fields as a one-row frame typed by the template schema."""
+        row = {"document": str(self.document), "template": self.template.name, **self.fields}
+        return pl.DataFrame([row], schema=self.template.schema)
+
+
+def load_templates(path: Union[str, Path]) -> List[Template]:
+    """
+    Load templates from a JSON/YAML file or a directory of them.
+
+    A file holds one template or a list of them. Directory entries are read
+    in name order, which is also the order templates are tried in.
+
+    Args:
+        path: Template file or directory
+
+    Returns:
+        List of templates
+    """
+    path = Path(path)
+    if path.is_dir():
+        files = sorted(p for p in path.iterdir() if p.suffix in TEMPLATE_SUFFIXES)
+    elif path.exists():
+        files = [path]
+    else:
+        raise FileNotFoundError(f"Template path not found: {path}")
+
+    templates: List[Template] = []
+    for file in files:
+        text = file.read_text(encoding="utf-8")
+        if file.suffix == ".json":
+            spec = json.loads(text)
+        elif yaml is None:
+            raise ImportError(f"PyYAML is required to read {file}")
+        else:
+            spec = yaml.safe_load(text)
+        specs = spec if isinstance(spec, list) else [spec]
+        templates.extend(Template.from_dict(item) for item in specs)
+    return templates
+
+
+def match_template(
+    pdf_path: Union[str, Path], templates: Sequence[Template]
+) -> Optional[Template]:
+    """
+    Find the first template whose match rules the document satisfies.
+
+    Args:
+        pdf_path: Path to the PDF file
+        templates: Templates in the order they should be tried
+
+    Returns:
+        The matching template, or None
+    """
+    try:
+        fingerprint = DocumentFingerprint(pdf_path)
+    except Exception as e:
+        logger.warning(f"Cannot fingerprint {pdf_path}: {e}")
+        return None
+
+    for template in templates:
+        if template.matches(fingerprint):
+            return template
+    return None
+
+
+def _load_region_objects(page: Any, boxes: Sequence[Tuple[float, float, float, float]]) -> bool:
+    """
+    Give a pdfplumber page only the objects that touch the given boxes.
+
+    pdfplumber turns every glyph, line and rect of a page into a dict before
+    anything can be cropped, which costs more than interpreting the page.
+    Here the pdfminer layout is walked once and only objects overlapping a
+    region are converted, then installed as the page's object cache, so
+    cropping and table finding see the same objects they would otherwise.
+
+    This relies on pdfplumber internals (``Page._objects``,
+    ``Page.process_object`` and the layout's ``_objs``). Where a pdfplumber
+    version lacks them the page is left alone and cropping it lays out
+    every object as usual.
+
+    Returns:
+        Whether the region objects were installed
+    """
+    if not (hasattr(page, "process_object") and hasattr(page.layout, "_objs")):
+        logger.debug("pdfplumber internals not found; cropping regions without preloading")
+        return False
+
+    mb_x0, mb_top = page.mediabox[:2]
+    height = page.height
+    objects: Dict[str, List[Dict[str, Any]]] = {}
+
+    def visit(items: Sequence[Any]) -> None:
+        for obj in items:
+            if isinstance(obj, LTContainer):
+                visit(obj._objs)
+                continue
+            if not hasattr(obj, "x0"):
+                continue
+            x0, x1 = obj.x0 + mb_x0, obj.x1 + mb_x0
+            top, bottom = height - obj.y1 + mb_top, height - obj.y0 + mb_top
+            if any(
+                x0 <= bx1 and x1 >= bx0 and top <= bbottom and bottom >= btop
+                for bx0, btop, bx1, bbottom in boxes
+            ):
+                attr = page.process_object(obj)
+                objects.setdefault(attr["object_type"], []).append(attr)
+
+    try:
+        visit(page.layout._objs)
+    except (AttributeError, KeyError) as e:
+        logger.debug(f"Could not preload region objects, cropping regions as usual: {e}")
+        return False
+    page._objects = objects
+    # A version that no longer reads the cache parses the page in full here
+    return page.objects is objects
+
+
+def extract_template(pdf_path: Union[str, Path], template: Template) -> TemplateRecord:
+    """
+    Extract a template's fields and tables from a document.
+
+    Args:
+        pdf_path: Path to the PDF file
+        template: Template to apply; its regions are trusted to fit the document
+
+    Returns:
+        TemplateRecord with one value per field and the first table (or None)
+        found in each table area
+    """
+    if pdfplumber is None:
+        raise ImportError("pdfplumber is required for template extraction")
+
+    record = TemplateRecord(document=Path(pdf_path), template=template)
+    with pdfplumber.open(pdf_path) as pdf:
+        font_cache.attach(pdf)
+        regions: List[Union[TemplateField, TemplateTable]] = [
+            *template.fields,
+            *template.tables,
+        ]
+        for page_number in template.pages:
+            boxes = [region.bbox for region in regions if region.page == page_number]
+            _load_region_objects(pdf.pages[page_number - 1], boxes)
+
+        for region in template.fields:
+            page = pdf.pages[region.page - 1]
+            text = page.within_bbox(region.bbox, strict=False).extract_text()
+            record.fields[region.name] = region.convert(text)
+
+        for area in template.tables:
+            page = pdf.pages[area.page - 1]
+            tables = TableExtractor(method=area.method).extract_page_region(page, area.bbox)
+            record.tables[area.name] = tables[0] if tables else None
+
+    return record
@@ -1,7 +1,8 @@
 """Text extraction from PDF files using multiple libraries."""
 
+from functools import partial
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 import logging
 
 try:
@@ -14,32 +15,121 @@ try:
 except ImportError:
     pdfplumber = None
 
+from . import font_cache
+from .layout_snapshot import LayoutSnapshots, save_snapshot, snapshot_kinds
+from .object_filter import normalize_skip
+from .page_cache import PageCache, lookup, run_uncached
+from .profiles import TEXT_FALLBACKS
+from .quality import QUALITY_THRESHOLD, score_text, shows_text
+from .tiles import TILE_GLYPHS, TILE_THRESHOLD, TilePool, page_text, tile_settings
+from .timeouts import PageTimeoutRunner
+from .utils import select_pages
+
 logger = logging.getLogger(__name__)
 
+TEXT_METHODS = ("auto", "pypdf2", "pdfplumber")
+
 
 class TextExtractor:
     """Extract text content from PDF files."""
     
-    def __init__(self, method: str = "auto") -> None:
+    def __init__(
+        self,
+        method: Union[str, Sequence[str]] = "auto",
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+        page_sinks: Optional[List[Any]] = None,
+        page_cache: Optional[PageCache] = None,
+        dedupe_pages: bool = False,
+        skip_objects: Optional[Sequence[str]] = None,
+        tile_threshold: Optional[int] = TILE_THRESHOLD,
+        tile_glyphs: int = TILE_GLYPHS,
+        tile_workers: int = 1,
+        fallback: str = "error",
+        quality_threshold: Optional[float] = QUALITY_THRESHOLD,
+        layout_snapshots: Optional[LayoutSnapshots] = None,
+    ) -> None:
         """
         Initialize text extractor.
         
         Args:
-            method: Extraction method ("pypdf2", "pdfplumber", or "auto")
+            method: Extraction method ("pypdf2", "pdfplumber", or "auto"), or
+                a sequence of methods to try in order; "auto" is
+                ("pdfplumber", "pypdf2")
+            page_timeout: Seconds allowed per page before it is skipped (optional)
+            doc_timeout: Seconds allowed per document before extraction stops (optional)
+            page_sinks: Objects receiving each page once its text is final, through
+                ``begin_document(pdf_path, pages)``,
+                ``write_page(pdf_path, page, text, backend, quality)`` and
+                ``end_document(pdf_path, success)`` (optional)
+            page_cache: Cache of per-page results keyed by page content hash;
+                pdfplumber only lays out pages it has not seen (optional)
+            dedupe_pages: Lay out each distinct page of a document once and
+                reuse its text for identical pages (optional)
+            skip_objects: Object types pdfplumber leaves out while laying out
+                pages ("image", "line", "rect", "curve"; see
+                ``object_filter.TEXT_ONLY``). The text is unchanged, and pages
+                full of graphics are laid out faster (optional)
+            tile_threshold: Estimated glyph count above which a page is split
+                into horizontal tiles that are laid out separately (see
+                ``tiles``); None lays out every page whole
+            tile_glyphs: Target characters per tile
+            tile_workers: Processes laying out the tiles of one page in
+                parallel; page timeouts always lay tiles out sequentially
+            fallback: When to try the next method of "auto" or a sequence:
+                "error" when one fails, "empty" also when one finds no text
+            quality_threshold: Pages whose text scores below this (see
+                ``quality.score_text``) are re-extracted with the next
+                methods of "auto" or a sequence, keeping the better-scoring
+                text; None disables the per-page fallback. Scores are kept
+                in ``page_scores`` and passed to the page sinks either way
+            layout_snapshots: Store of per-document layout snapshots; pdfplumber
+                reads the characters of pages held in a document's snapshot
+                instead of laying them out, and adds the pages it lays out
+                whole. Not used with timeouts (optional)
         """
+        if fallback not in TEXT_FALLBACKS:
+            raise ValueError(
+                f"Unknown fallback: {fallback}; choose from {', '.join(TEXT_FALLBACKS)}"
+            )
+        if not isinstance(method, str):
+            method = tuple(method)
+            unknown = set(method) - set(TEXT_METHODS[1:])
+            if unknown or not method:
+                raise ValueError(f"Unknown text method(s): {', '.join(sorted(unknown))}")
+        
         self.method = method
+        self.fallback = fallback
+        self.quality_threshold = quality_threshold
+        self.page_timeout = page_timeout
+        self.doc_timeout = doc_timeout
+        self.page_sinks: List[Any] = list(page_sinks or [])
+        self.page_cache = page_cache
+        self.dedupe_pages = dedupe_pages
+        self.skip_objects = normalize_skip(skip_objects)
+        self.layout_snapshots = layout_snapshots
+        self.tiling = tile_settings(tile_threshold, tile_glyphs, tile_workers)
+        self.timed_out_pages: List[int] = []
+        self.reused_pages: List[int] = []
+        self.duplicate_pages: List[int] = []
+        self.fallback_pages: List[int] = []
+        self.page_scores: Dict[int, Optional[float]] = {}
+        self.low_quality_pages: List[int] = []
         
         if method == "pypdf2" and PyPDF2 is None:
             raise ImportError("PyPDF2 is required for pypdf2 method")
         elif method == "pdfplumber" and pdfplumber is None:
             raise ImportError("pdfplumber is required for pdfplumber method")
     
-    def extract(self, pdf_path: Union[str, Path]) -> str:
+    def extract(
+        self, pdf_path: Union[str, Path], pages: Optional[Sequence[int]] = None
+    ) -> str:
         """
         Extract text from PDF file.
         
         Args:
             pdf_path: Path to the PDF file
+            pages: One-based page numbers to extract (optional, defaults to all)
             
         Returns:
             Extracted text content
@@ -49,56 +139,231 @@ class TextExtractor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        if self.method == "pypdf2":
-            return self._extract_with_pypdf2(pdf_path)
-        elif self.method == "pdfplumber":
-            return self._extract_with_pdfplumber(pdf_path)
-        else:  # auto method
-            # Try pdfplumber first (generally better text extraction)
-            if pdfplumber is not None:
-                try:
-                    return self._extract_with_pdfplumber(pdf_path)
-                except Exception as e:
-                    logger.warning(f"pdfplumber failed: {e}, trying PyPDF2")
-            
-            # Fallback to PyPDF2
-            if PyPDF2 is not None:
-                return self._extract_with_pypdf2(pdf_path)
-            
-            raise ImportError("No PDF processing library available")
+        self.timed_out_pages = []
+        self.reused_pages = []
+        self.duplicate_pages = []
+        self.fallback_pages = []
+        self.page_scores = {}
+        self.low_quality_pages = []
+        
+        for sink in self.page_sinks:
+            sink.begin_document(pdf_path, pages)
+        
+        success = False
+        try:
+            text = self._extract(pdf_path, pages)
+            success = True
+        finally:
+            for sink in self.page_sinks:
+                sink.end_document(pdf_path, success)
+        
+        return text
+    
+    def _extract(self, pdf_path: Path, pages: Optional[Sequence[int]] = None) -> str:
+        """Run the backends in order, then re-extract low-scoring pages with the next ones."""
+        if isinstance(self.method, str) and self.method != "auto":
+            methods: Sequence[str] = [self.method]
+        else:
+            # pdfplumber is generally better, PyPDF2 faster
+            methods = ("pdfplumber", "pypdf2") if self.method == "auto" else self.method
+            libraries = {"pdfplumber": pdfplumber, "pypdf2": PyPDF2}
+            methods = [method for method in methods if libraries[method] is not None]
+            if not methods:
+                raise ImportError("No PDF processing library available")
+        
+        for i, method in enumerate(methods):
+            last = i == len(methods) - 1
+            try:
+                texts = getattr(self, f"_extract_with_{method}")(pdf_path, pages)
+            except Exception as e:
+                if last:
+                    raise
+                logger.warning(f"{method} failed: {e}, trying {methods[i + 1]}")
+                continue
+            if last or self.fallback != "empty" or any(
+                text and text.strip() for text in texts.values()
+            ):
+                break
+            logger.info(f"{method} found no text in {pdf_path}, trying {methods[i + 1]}")
+        
+        backends = {page_num: method for page_num in texts}
+        self.page_scores = self._score_pages(pdf_path, texts)
+        if self.quality_threshold is not None:
+            self._replace_low_scoring(
+                pdf_path, texts, backends, methods[i + 1:], self.quality_threshold
+            )
+        threshold = QUALITY_THRESHOLD if self.quality_threshold is None else self.quality_threshold
+        self.low_quality_pages = [
+            page_num for page_num, score in sorted(self.page_scores.items())
+            if score is not None and score < threshold
+        ]
+        
+        text_content: List[str] = []
+        for page_num in sorted(texts):
+            text = texts[page_num]
+            if text and text.strip():
+                self._append_page(
+                    text_content, pdf_path, page_num, text, backends[page_num],
+                    self.page_scores[page_num],
+                )
+        return "".join(text_content)
+    
+    def _score_pages(
+        self, pdf_path: Path, texts: Dict[int, Optional[str]]
+    ) -> Dict[int, Optional[float]]:
+        """Score each page's text; blank pages, which show no text, get None."""
+        scores: Dict[int, Optional[float]] = {
+            page_num: score_text(text) for page_num, text in texts.items()
+        }
+        empty = [page_num for page_num, text in texts.items() if not (text and text.strip())]
+        for page_num in self._blank_pages(pdf_path, empty):
+            scores[page_num] = None
+        return scores
+    
+    def _blank_pages(self, pdf_path: Path, page_nums: Sequence[int]) -> List[int]:
+        """Pages among ``page_nums`` whose content streams show no text."""
+        if not page_nums or PyPDF2 is None:
+            return []
+        try:
+            reader = PyPDF2.PdfReader(str(pdf_path))
+            blank = []
+            for page_num in page_nums:
+                contents = reader.pages[page_num - 1].get_contents()
+                if contents is None or not shows_text(contents.get_data()):
+                    blank.append(page_num)
+            return blank
+        except Exception as e:
+            logger.warning(f"Could not read content streams of {pdf_path}: {e}")
+            return []
+    
+    def _replace_low_scoring(
+        self,
+        pdf_path: Path,
+        texts: Dict[int, Optional[str]],
+        backends: Dict[int, str],
+        fallbacks: Sequence[str],
+        threshold: float,
+    ) -> None:
+        """Re-extract pages scoring below the threshold and keep the better-scoring text."""
+        for method in fallbacks:
+            low = [
+                page_num for page_num, score in self.page_scores.items()
+                if score is not None and score < threshold
+            ]
+            if not low:
+                return
+            logger.info(f"Re-extracting {len(low)} low-scoring page(s) of {pdf_path} with {method}")
+            try:
+                retried = getattr(self, f"_extract_with_{method}")(pdf_path, low)
+            except Exception as e:
+                logger.warning(f"{method} failed: {e}")
+                continue
+            for page_num in low:
+                score = score_text(retried.get(page_num))
+                if score > (self.page_scores[page_num] or 0.0):
+                    texts[page_num] = retried[page_num]
+                    backends[page_num] = method
+                    self.page_scores[page_num] = score
+                    self.fallback_pages.append(page_num)
+        self.fallback_pages.sort()
     
-    def _extract_with_pypdf2(self, pdf_path: Path) -> str:
-        """Extract text using PyPDF2."""
-        text_content = []
+    def _extract_with_pypdf2(
+        self, pdf_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> Dict[int, Optional[str]]:
+        """Extract the text of each page using PyPDF2 (None where a page fails)."""
+        texts: Dict[int, Optional[str]] = {}
         
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
             
-            for page_num, page in enumerate(pdf_reader.pages):
+            for page_num in select_pages(len(pdf_reader.pages), pages):
+                page = pdf_reader.pages[page_num - 1]
                 try:
-                    text = page.extract_text()
-                    if text.strip():
-                        text_content.append(f"--- Page {page_num + 1} ---\n")
-                        text_content.append(text)
-                        text_content.append("\n\n")
+                    texts[page_num] = page.extract_text()
                 except Exception as e:
-                    logger.warning(f"Error extracting page {page_num + 1}: {e}")
+                    logger.warning(f"Error extracting page {page_num}: {e}")
+                    texts[page_num] = None
         
-        return "".join(text_content)
+        return texts
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> str:
-        """Extract text using pdfplumber."""
-        text_content = []
+    def _extract_with_pdfplumber(
+        self, pdf_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> Dict[int, Optional[str]]:
+        """Extract the text of each page using pdfplumber (None where a page fails)."""
+        if self.page_timeout is not None or self.doc_timeout is not None:
+            return self._extract_with_pdfplumber_timed(pdf_path, pages)
+        
+        texts: Dict[int, Optional[str]] = {}
+        cached = lookup(self.page_cache, pdf_path, "text/pdfplumber", self.dedupe_pages)
+        snapshot = None
+        if self.layout_snapshots is not None:
+            snapshot = self.layout_snapshots.open(
+                pdf_path, snapshot_kinds(self.skip_objects), needed=["char"]
+            )
         
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
+        # Tile workers start on the first giant page and serve the whole document
+        with pdfplumber.open(pdf_path) as pdf, TilePool(self.tiling["workers"]) as pool:
+            font_cache.attach(pdf)
+            for page_num in select_pages(len(pdf.pages), pages):
                 try:
-                    text = page.extract_text()
-                    if text and text.strip():
-                        text_content.append(f"--- Page {page_num + 1} ---\n")
-                        text_content.append(text)
-                        text_content.append("\n\n")
+                    if cached is not None and page_num in cached:
+                        texts[page_num] = cached[page_num]
+                    else:
+                        page = pdf.pages[page_num - 1]
+                        if snapshot is not None and snapshot.restore(page):
+                            texts[page_num] = page.extract_text()
+                        else:
+                            texts[page_num] = page_text(
+                                page, skip=self.skip_objects, pool=pool, **self.tiling
+                            )
+                            # Tiled pages were never laid out whole
+                            if snapshot is not None and hasattr(page, "_layout"):
+                                snapshot.record(page)
+                        if cached is not None:
+                            cached.put(page_num, texts[page_num])
                 except Exception as e:
-                    logger.warning(f"Error extracting page {page_num + 1}: {e}")
+                    logger.warning(f"Error extracting page {page_num}: {e}")
+                    texts[page_num] = None
+        
+        save_snapshot(snapshot)
+        if cached is not None:
+            self.reused_pages.extend(cached.reused_pages)
+            self.duplicate_pages.extend(cached.duplicate_pages)
+        return texts
+    
+    def _extract_with_pdfplumber_timed(
+        self, pdf_path: Path, pages: Optional[Sequence[int]] = None
+    ) -> Dict[int, Optional[str]]:
+        """Extract text using pdfplumber in a subprocess with page/document deadlines."""
+        cached = lookup(self.page_cache, pdf_path, "text/pdfplumber", self.dedupe_pages)
+        page_results, timed_out_pages = run_uncached(
+            PageTimeoutRunner(self.page_timeout, self.doc_timeout),
+            pdf_path,
+            # Pages already run in daemonic workers, which cannot start more
+            partial(page_text, **{**self.tiling, "workers": 1, "skip": self.skip_objects}),
+            pages,
+            cached,
+        )
+        self.timed_out_pages.extend(timed_out_pages)
+        
+        if cached is not None:
+            self.reused_pages.extend(cached.reused_pages)
+            self.duplicate_pages.extend(cached.duplicate_pages)
+        return dict(page_results)
+    
+    def _append_page(
+        self,
+        text_content: List[str],
+        pdf_path: Path,
+        page_num: int,
+        text: str,
+        backend: str,
+        quality: Optional[float] = None,
+    ) -> None:
+        """Add a page with its marker to the output and pass it to the page sinks."""
+        text_content.append(f"--- Page {page_num} ---\n")
+        text_content.append(text)
+        text_content.append("\n\n")
         
-        return "".join(text_content)
\ No newline at end of file
+        for sink in self.page_sinks:
+            sink.write_page(pdf_path, page_num, text, backend, quality)
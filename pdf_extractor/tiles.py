@@ -0,0 +1,287 @@
+"""Tiled text extraction for pages with hundreds of thousands of glyphs.
+
+Large engineering drawings and dense statistical appendices put so many
+glyphs on one page that ``page.extract_text()`` takes minutes and
+gigabytes. pdfplumber builds a dict of about twenty fields for every
+character, and its word and line grouping sorts and clusters the whole page
+at once. ``tiled_text`` instead:
+
+1. interprets the page once with graphics skipped (see ``object_filter``)
+   and keeps only the fields text extraction needs, in flat lists;
+2. cuts the page into horizontal tiles of about ``tile_glyphs`` characters,
+   only at vertical gaps wider than the line tolerance, so that no text line
+   spans two tiles;
+3. runs pdfplumber's own text layout on each tile, in worker processes when
+   ``workers`` > 1 (a ``TilePool`` starts them on the first tiled page and
+   keeps them for the rest of the document);
+4. joins the tiles' text top to bottom.
+
+Each tile is a run of whole lines in reading order, so the joined text
+equals ``page.extract_text()``. The work per tile is bounded, so the time
+grows linearly with the glyph count. Pages with rotated (non-upright) text
+are laid out as one tile, because pdfplumber groups upright and rotated
+characters in content-stream order.
+
+``estimate_glyphs`` decides whether a page needs tiling. It counts the bytes
+of the string operands in the page's content streams, which pdfminer decodes
+anyway.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import bisect
+import multiprocessing
+import re
+
+try:
+    from pdfminer.layout import LTChar, LTContainer
+    from pdfminer.pdftypes import stream_value
+    from pdfplumber.utils.text import DEFAULT_Y_TOLERANCE, chars_to_textmap
+except ImportError:
+    chars_to_textmap = None
+    DEFAULT_Y_TOLERANCE = 3
+
+from .object_filter import TEXT_ONLY, FilteringAggregator, FilteringInterpreter, load_layout
+
+# Estimated glyphs above which a page is extracted in tiles
+TILE_THRESHOLD = 100_000
+
+# Target number of characters per tile
+TILE_GLYPHS = 20_000
+
+_STRING_OPERAND = re.compile(rb"\((?:\\.|[^\\()]|\((?:\\.|[^\\()])*\))*\)|<[0-9A-Fa-f\s]*>")
+
+# x0, x1, top, bottom, text, upright
+Column = Tuple[List[float], List[float], List[float], List[float], List[str], List[bool]]
+
+
+def estimate_glyphs(page: Any) -> int:
+    """
+    Estimate the number of glyphs a pdfplumber page shows, without laying it out.
+
+    Literal strings count one glyph per byte and hex strings one per two
+    digits, so two-byte CID fonts are overestimated by up to two times.
+    Text inside form XObjects is not counted.
+    """
+    total = 0
+    for stream in page.page_obj.contents:
+        for match in _STRING_OPERAND.finditer(stream_value(stream).get_data()):
+            token = match.group()
+            total += len(token) - 2 if token[:1] == b"(" else (len(token) - 2) // 2
+    return total
+
+
+def page_columns(page: Any) -> Column:
+    """
+    Interpret a pdfplumber page and read the fields text layout needs into lists.
+
+    Coordinates follow pdfplumber: ``top`` and ``bottom`` are measured down
+    from the top of the page.
+    """
+    device = FilteringAggregator(
+        page.pdf.rsrcmgr,
+        pageno=page.page_number,
+        laparams=page.pdf.laparams,
+        skip=frozenset(TEXT_ONLY),
+    )
+    FilteringInterpreter(page.pdf.rsrcmgr, device).process_page(page.page_obj)
+    layout = device.get_result()
+
+    height = layout.y1
+    columns: Column = ([], [], [], [], [], [])
+    x0, x1, top, bottom, text, upright = columns
+    stack = [iter(layout)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, LTChar):
+                x0.append(item.x0)
+                x1.append(item.x1)
+                top.append(height - item.y1)
+                bottom.append(height - item.y0)
+                text.append(item.get_text())
+                upright.append(item.upright)
+            elif isinstance(item, LTContainer):
+                stack.append(iter(item))
+                break
+        else:
+            stack.pop()
+    return columns
+
+
+def tile_bounds(
+    tops: Sequence[float], tile_glyphs: int = TILE_GLYPHS, y_tolerance: float = DEFAULT_Y_TOLERANCE
+) -> List[float]:
+    """
+    Choose where to cut a page into tiles.
+
+    Args:
+        tops: Top of every character
+        tile_glyphs: Target characters per tile
+        y_tolerance: pdfplumber's line tolerance; cuts fall only in gaps wider than this
+
+    Returns:
+        Ascending cut positions; a character belongs to the tile of the
+        number of cuts at or above its top
+    """
+    ordered = sorted(tops)
+    cuts: List[float] = []
+    start = 0
+    for i in range(1, len(ordered)):
+        if i - start >= tile_glyphs and ordered[i] - ordered[i - 1] > y_tolerance:
+            cuts.append(ordered[i])
+            start = i
+    return cuts
+
+
+def _tile_text(tile: Column, y_tolerance: float) -> str:
+    """Lay out one tile's characters with pdfplumber and return its text."""
+    chars = [
+        {
+            "x0": x0,
+            "x1": x1,
+            "top": top,
+            "doctop": top,
+            "bottom": bottom,
+            "text": text,
+            "upright": upright,
+        }
+        for x0, x1, top, bottom, text, upright in zip(*tile)
+    ]
+    if not chars:
+        return ""
+    return chars_to_textmap(chars, y_tolerance=y_tolerance).as_string
+
+
+def _split(columns: Column, cuts: List[float]) -> List[Column]:
+    """Distribute characters over tiles, keeping content-stream order within each."""
+    tiles: List[Column] = [([], [], [], [], [], []) for _ in range(len(cuts) + 1)]
+    for values in zip(*columns):
+        tile: Sequence[List[Any]] = tiles[bisect.bisect_right(cuts, values[2])]
+        for column, value in zip(tile, values):
+            column.append(value)
+    return [tile for tile in tiles if tile[0]]
+
+
+class TilePool:
+    """Worker processes laying out tiles, started on first use and shared across pages."""
+
+    def __init__(self, workers: int) -> None:
+        """
+        Initialize the pool without starting any process.
+
+        Args:
+            workers: Number of worker processes
+        """
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def map(self, func: Callable[..., Any], *iterables: Iterable[Any]) -> Iterator[Any]:
+        """Run ``func`` over the iterables in the worker processes, starting them if needed."""
+        if self._executor is None:
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._executor.map(func, *iterables)
+
+    def close(self) -> None:
+        """Stop the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "TilePool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def tiled_text(
+    page: Any,
+    tile_glyphs: int = TILE_GLYPHS,
+    workers: int = 1,
+    y_tolerance: float = DEFAULT_Y_TOLERANCE,
+    pool: Optional[TilePool] = None,
+) -> str:
+    """
+    Extract the text of a giant page tile by tile.
+
+    Args:
+        page: pdfplumber page
+        tile_glyphs: Target characters per tile
+        workers: Processes laying out tiles in parallel (1 lays them out here)
+        y_tolerance: Line tolerance passed to pdfplumber
+        pool: Worker processes to lay tiles out in when ``workers`` > 1
+            (optional, a pool is started for this page alone otherwise)
+
+    Returns:
+        The page text, as ``page.extract_text()`` would return it
+    """
+    if chars_to_textmap is None:
+        raise ImportError("pdfplumber is required for tiled extraction")
+
+    tiles = _page_tiles(page, tile_glyphs, y_tolerance)
+    if workers > 1 and len(tiles) > 1:
+        if pool is not None:
+            return _join(pool.map(_tile_text, tiles, [y_tolerance] * len(tiles)))
+        with TilePool(workers) as page_pool:
+            return _join(page_pool.map(_tile_text, tiles, [y_tolerance] * len(tiles)))
+    return _join(_tile_text(tile, y_tolerance) for tile in tiles)
+
+
+def _page_tiles(page: Any, tile_glyphs: int, y_tolerance: float) -> List[Column]:
+    """Interpret a page and split its characters into tiles."""
+    columns = page_columns(page)
+    if not all(columns[5]):
+        return [columns]
+    return _split(columns, tile_bounds(columns[2], tile_glyphs, y_tolerance))
+
+
+def _join(texts: Any) -> str:
+    """Join tile texts top to bottom."""
+    return "\n".join(text for text in texts if text)
+
+
+def page_text(
+    page: Any,
+    threshold: Optional[int] = TILE_THRESHOLD,
+    tile_glyphs: int = TILE_GLYPHS,
+    workers: int = 1,
+    skip: Optional[Iterable[str]] = None,
+    pool: Optional[TilePool] = None,
+) -> Optional[str]:
+    """
+    Extract a page's text, in tiles when it has more than ``threshold`` glyphs.
+
+    Args:
+        page: pdfplumber page
+        threshold: Estimated glyph count above which the page is tiled
+            (None never tiles)
+        tile_glyphs: Target characters per tile
+        workers: Processes laying out tiles in parallel
+        skip: Object types to leave out when the page is laid out whole
+            (tiles always leave out every graphic)
+        pool: Worker processes shared by the pages of a document, see
+            ``tiled_text`` (optional)
+
+    Returns:
+        The page text
+    """
+    if threshold is not None and not hasattr(page, "_layout"):
+        if estimate_glyphs(page) > threshold:
+            return tiled_text(page, tile_glyphs, workers, pool=pool)
+    load_layout(page, skip)
+    text: str = page.extract_text()
+    return text
+
+
+def tile_settings(
+    threshold: Optional[int], tile_glyphs: int, workers: int
+) -> Dict[str, Any]:
+    """Keyword arguments for ``page_text``, validated."""
+    if threshold is not None and threshold < 1:
+        raise ValueError("tile_threshold must be positive")
+    if tile_glyphs < 1:
+        raise ValueError("tile_glyphs must be positive")
+    if workers < 1:
+        raise ValueError("tile_workers must be at least 1")
+    return {"threshold": threshold, "tile_glyphs": tile_glyphs, "workers": workers}
@@ -0,0 +1,245 @@
+"""Per-page and per-document deadlines for PDF extraction.
+
+Page work runs in a child process so that a pathological page (millions of
+glyphs, huge vector drawings) can be preempted by killing the process rather
+than waiting for pdfminer to finish.
+
+Opening the document is exempt from the per-page limit: until the worker
+reports its pages only the document deadline applies. A page timeout kills
+the worker, so the next worker opens the document again (and parses its
+fonts again) before it carries on with the following page. That open is
+exempt from the page limit too, but it does count against the document
+deadline, so a document with many stalled pages pays for many opens.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+import multiprocessing
+import time
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+from . import font_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _page_worker(
+    conn: Any,
+    pdf_path: str,
+    page_func: Callable[[Any], Any],
+    page_indices: Optional[List[int]],
+) -> None:
+    """Child process: run ``page_func`` on each page and stream results back."""
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            font_cache.attach(pdf)
+            page_count = len(pdf.pages)
+            if page_indices is None:
+                indices = list(range(page_count))
+            else:
+                indices = sorted({i for i in page_indices if 0 <= i < page_count})
+            conn.send(("pages", indices))
+            for page_index in indices:
+                page = pdf.pages[page_index]
+                try:
+                    conn.send(("page", page_index, page_func(page)))
+                except Exception as e:
+                    conn.send(("error", page_index, str(e)))
+                finally:
+                    page.close()
+        conn.send(("done",))
+    except Exception as e:
+        conn.send(("failed", str(e)))
+    finally:
+        conn.close()
+
+
+class PageTimeoutRunner:
+    """Run a per-page function over a PDF with hard time limits."""
+
+    def __init__(
+        self,
+        page_timeout: Optional[float] = None,
+        doc_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            page_timeout: Maximum seconds to spend on a single page (optional)
+            doc_timeout: Maximum seconds to spend on the whole document (optional)
+        """
+        if page_timeout is not None and page_timeout <= 0:
+            raise ValueError("page_timeout must be positive")
+        if doc_timeout is not None and doc_timeout <= 0:
+            raise ValueError("doc_timeout must be positive")
+
+        self.page_timeout = page_timeout
+        self.doc_timeout = doc_timeout
+
+    def run(
+        self,
+        pdf_path: Path,
+        page_func: Callable[[Any], Any],
+        pages: Optional[Sequence[int]] = None,
+    ) -> Tuple[Dict[int, Any], List[int]]:
+        """
+        Apply ``page_func`` to every page of a PDF in a killable subprocess.
+
+        ``page_func`` receives a pdfplumber page and must be a picklable,
+        module-level function returning a picklable result.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_func: Function applied to each pdfplumber page
+            pages: Zero-based page indices to process (optional, defaults to all)
+
+        Returns:
+            Tuple of (results keyed by zero-based page index, sorted list of
+            one-based page numbers that timed out). If the document deadline
+            passes while the PDF is still being opened, every requested page
+            is listed as timed out; with ``pages`` unset none are, because the
+            page count is not known yet.
+        """
+        if pdfplumber is None:
+            raise ImportError("pdfplumber is required for timed extraction")
+
+        doc_deadline = (
+            time.monotonic() + self.doc_timeout if self.doc_timeout is not None else None
+        )
+        results: Dict[int, Any] = {}
+        timed_out: List[int] = []
+        remaining: Optional[List[int]] = list(pages) if pages is not None else None
+
+        while remaining is None or remaining:
+            status, pending = self._run_worker(
+                pdf_path, page_func, remaining, doc_deadline, results
+            )
+
+            if status == "done":
+                break
+            if status == "failed":
+                raise RuntimeError(f"Timed extraction failed for {pdf_path}")
+            if status == "open_timeout":
+                # The worker never listed its pages, so every page asked for
+                # is reported; without a page list their number is unknown.
+                if remaining:
+                    timed_out.extend(sorted({index + 1 for index in remaining if index >= 0}))
+                logger.warning(
+                    f"Document deadline of {self.doc_timeout}s reached while opening {pdf_path}"
+                )
+                break
+
+            if status == "doc_timeout":
+                timed_out.extend(index + 1 for index in pending)
+                logger.warning(
+                    f"Document deadline of {self.doc_timeout}s reached for {pdf_path}; "
+                    f"{len(pending)} page(s) not extracted"
+                )
+                break
+
+            # Page timeout: skip the page that was being processed and restart
+            timed_out.append(pending[0] + 1)
+            logger.warning(
+                f"Page {pending[0] + 1} of {pdf_path} exceeded {self.page_timeout}s"
+            )
+            remaining = pending[1:]
+
+        return results, sorted(timed_out)
+
+    def _run_worker(
+        self,
+        pdf_path: Path,
+        page_func: Callable[[Any], Any],
+        page_indices: Optional[List[int]],
+        doc_deadline: Optional[float],
+        results: Dict[int, Any],
+    ) -> Tuple[str, List[int]]:
+        """
+        Start one worker and collect its results until it finishes or stalls.
+
+        Returns:
+            Tuple of (status, page indices not yet completed) where status is
+            one of "done", "failed", "open_timeout", "page_timeout" or
+            "doc_timeout"
+        """
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_page_worker,
+            args=(child_conn, str(pdf_path), page_func, page_indices),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        pending: List[int] = []
+        opened = False
+        status = "done"
+
+        try:
+            while True:
+                wait, limit = self._next_wait(doc_deadline, opened)
+                if wait is not None and wait <= 0:
+                    status = limit
+                    break
+                if not parent_conn.poll(wait):
+                    status = limit
+                    break
+
+                try:
+                    message = parent_conn.recv()
+                except EOFError:
+                    # Worker died without reporting, e.g. killed by the OS
+                    if not opened:
+                        status = "failed"
+                    else:
+                        status = "page_timeout" if pending else "done"
+                    break
+
+                kind = message[0]
+                if kind == "pages":
+                    pending = message[1]
+                    opened = True
+                elif kind == "page":
+                    results[message[1]] = message[2]
+                    pending.remove(message[1])
+                elif kind == "error":
+                    logger.warning(f"Error extracting page {message[1] + 1}: {message[2]}")
+                    pending.remove(message[1])
+                elif kind == "failed":
+                    logger.error(f"Error opening {pdf_path}: {message[1]}")
+                    status = "failed"
+                    break
+                else:  # done
+                    break
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            parent_conn.close()
+
+        if status.endswith("_timeout"):
+            if not opened:
+                status = "open_timeout"
+            elif not pending:
+                status = "done"
+
+        return status, pending
+
+    def _next_wait(
+        self, doc_deadline: Optional[float], opened: bool
+    ) -> Tuple[Optional[float], str]:
+        """Return the seconds to wait for the next message and the limit that applies."""
+        doc_wait = doc_deadline - time.monotonic() if doc_deadline is not None else None
+
+        # Opening the document is not page work, so only the document deadline applies
+        if self.page_timeout is None or not opened:
+            return doc_wait, "doc_timeout"
+        if doc_wait is None or self.page_timeout < doc_wait:
+            return self.page_timeout, "page_timeout"
+        return doc_wait, "doc_timeout"
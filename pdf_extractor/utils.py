@@ -0,0 +1,19 @@
+"""Small helpers shared by the text and table extractors."""
+
+from typing import List, Optional, Sequence
+
+
+def select_pages(page_count: int, pages: Optional[Sequence[int]]) -> List[int]:
+    """
+    Resolve the one-based page numbers to process.
+    
+    Args:
+        page_count: Number of pages in the document
+        pages: Requested one-based page numbers (optional, defaults to all)
+        
+    Returns:
+        Sorted, de-duplicated page numbers with out-of-range entries dropped
+    """
+    if pages is None:
+        return list(range(1, page_count + 1))
+    return sorted({page for page in pages if 1 <= page <= page_count})
@@ -0,0 +1,16 @@
+"""Shared fixtures for the PDF extractor tests."""
+
+from pathlib import Path
+
+import pytest
+
+from tests.pdf_builders import write_sample_pdf
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Fixture returning a factory for small multi-page PDFs."""
+    def factory(name: str = "sample.pdf", pages: int = 3) -> Path:
+        return write_sample_pdf(tmp_path / name, pages)
+    
+    return factory
@@ -0,0 +1,73 @@
+"""PDF builders shared by the PDF extractor tests."""
+
+from pathlib import Path
+
+# An unruled table for the whitespace stream backend
+BORDERLESS_ROWS = [
+    ["Case No.", "Client", "Status", "Amount"],
+    ["2024-001", "TechCorp Inc.", "Discovery", "$1,200.00"],
+    ["2024-002", "Green Energy LLC", "", "$950.00"],
+    ["2024-003", "Metro", "Closing", "$10.00"],
+]
+
+
+def write_sample_pdf(path: Path, pages: int = 3) -> Path:
+    """Write a small multi-page PDF with one line of text per page."""
+    from reportlab.pdfgen import canvas
+    
+    pdf = canvas.Canvas(str(path))
+    for page_num in range(pages):
+        pdf.drawString(72, 720, f"Sample page {page_num + 1}")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def write_ruled_pdf(path, rows, col_width=120, row_height=20, span_last_row=False):
+    """Write a one-page PDF with a fully ruled table; the last row may span all columns."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    left, top = 72, 720
+    cols = len(rows[0])
+    right = left + cols * col_width
+    bottom = top - len(rows) * row_height
+
+    for i in range(len(rows) + 1):
+        pdf.line(left, top - i * row_height, right, top - i * row_height)
+    for j in range(cols + 1):
+        x = left + j * col_width
+        # The spanning last row has no inner vertical rules
+        end = bottom + row_height if span_last_row and 0 < j < cols else bottom
+        pdf.line(x, top, x, end)
+
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row):
+            if text:
+                pdf.drawString(left + j * col_width + 4, top - (i + 1) * row_height + 6, text)
+
+    # A lone rule outside the table must not form cells
+    pdf.line(left, 100, right, 100)
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+def write_borderless_pdf(path, tables):
+    """Write a one-page PDF with unruled tables between lines of paragraph text."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    y = 760
+    for rows in tables:
+        pdf.drawString(72, y, "This paragraph line has single spaces between its words.")
+        pdf.drawString(72, y - 14, "It continues on a second line and is not a table.")
+        y -= 40
+        for row in rows:
+            for j, text in enumerate(row):
+                pdf.drawString(72 + j * 120, y, text)
+            y -= 16
+        y -= 24
+    pdf.showPage()
+    pdf.save()
+    return path
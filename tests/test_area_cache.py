@@ -0,0 +1,75 @@
+"""Tests for the learned table-area cache."""
+
+import pdfplumber
+import pytest
+
+from pdf_extractor.area_cache import TableAreaCache, layout_signature
+from pdf_extractor.table_extractor import TableExtractor
+from tests.pdf_builders import write_ruled_pdf
+
+INVOICE_A = [
+    ["Item", "Hours", "Amount"],
+    ["Review", "2.5", "$500.00"],
+    ["Filing", "1.0", "$200.00"],
+    ["Total: $700.00", None, None],
+]
+INVOICE_B = [
+    ["Item", "Hours", "Amount"],
+    ["Drafting", "4.0", "$800.00"],
+    ["Court time", "3.0", "$900.00"],
+    ["Total: $1,700.00", None, None],
+]
+
+
+class TestTableAreaCache:
+    """Test cases for TableAreaCache and its use in TableExtractor."""
+
+    @pytest.mark.parametrize("method", ["pdfplumber", "lattice"])
+    def test_same_layout_reuses_cells(self, tmp_path, method):
+        """Test that a second page with the same rulings hits and extracts identically."""
+        first = write_ruled_pdf(tmp_path / "a.pdf", INVOICE_A, span_last_row=True)
+        second = write_ruled_pdf(tmp_path / "b.pdf", INVOICE_B, span_last_row=True)
+        cache = TableAreaCache()
+        extractor = TableExtractor(method=method, area_cache=cache)
+
+        extractor.extract(first)
+        tables = extractor.extract(second)
+
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "evictions": 0,
+            "entries": 1,
+        }
+        expected = TableExtractor(method=method).extract(second)
+        assert [t.rows() for t in tables] == [t.rows() for t in expected]
+        assert tables[0]["Item"].to_list()[0] == "Drafting"
+
+    def test_signature_ignores_text_not_rulings(self, tmp_path):
+        """Test that text changes keep the signature and ruling changes alter it."""
+        paths = [
+            write_ruled_pdf(tmp_path / "a.pdf", INVOICE_A),
+            write_ruled_pdf(tmp_path / "b.pdf", INVOICE_B),
+            write_ruled_pdf(tmp_path / "c.pdf", INVOICE_A, col_width=100),
+        ]
+        signatures = []
+        for path in paths:
+            with pdfplumber.open(path) as pdf:
+                signatures.append(layout_signature(pdf.pages[0]))
+
+        assert signatures[0] == signatures[1]
+        assert signatures[0] != signatures[2]
+
+    def test_lru_eviction(self):
+        """Test that the least recently used layout is evicted first."""
+        cache = TableAreaCache(max_entries=2)
+        cache.put("lattice", "a", [])
+        cache.put("lattice", "b", [])
+        assert cache.get("lattice", "a") == []
+        cache.put("lattice", "c", [])
+
+        assert cache.get("lattice", "b") is None
+        assert cache.get("lattice", "a") == []
+        assert cache.evictions == 1
+        assert cache.hit_rate == pytest.approx(2 / 3)
@@ -0,0 +1,82 @@
+"""Tests for size-aware batch extraction."""
+
+import pytest
+
+from pdf_extractor import PDFExtractor, catalog
+from pdf_extractor.batch import BatchExtractor, estimate_cost, plan_tasks
+from pdf_extractor.page_store import PageReader
+from pdf_extractor.text_extractor import TextExtractor
+
+
+class TestPlanning:
+    """Test cases for cost estimation and task planning."""
+    
+    def test_estimate_cost(self, make_pdf):
+        """Test that page count comes from the page tree."""
+        estimate = estimate_cost(make_pdf(pages=4))
+        
+        assert estimate.page_count == 4
+        assert estimate.cost > 4
+    
+    def test_policy_ordering(self, make_pdf):
+        """Test longest-first and shortest-first ordering."""
+        small = make_pdf("small.pdf", pages=1)
+        large = make_pdf("large.pdf", pages=6)
+        
+        longest = plan_tasks([small, large], policy="longest-first", split_pages=None)
+        shortest = plan_tasks([small, large], policy="shortest-first", split_pages=None)
+        
+        assert [task.pdf_path for task in longest] == [large, small]
+        assert [task.pdf_path for task in shortest] == [small, large]
+    
+    def test_large_documents_are_split(self, make_pdf):
+        """Test that large documents become page-range tasks."""
+        small = make_pdf("small.pdf", pages=1)
+        large = make_pdf("large.pdf", pages=5)
+        
+        tasks = plan_tasks([small, large], policy="fifo", split_pages=2)
+        large_tasks = [task for task in tasks if task.pdf_path == large]
+        
+        assert [task.pages for task in large_tasks] == [[1, 2], [3, 4], [5]]
+        assert all(task.parts == 3 for task in large_tasks)
+    
+    def test_unknown_policy(self, make_pdf):
+        """Test that unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            plan_tasks([make_pdf()], policy="random")
+
+
+class TestBatchExtractor:
+    """Test cases for BatchExtractor."""
+    
+    def test_split_document_is_merged_in_order(self, make_pdf, tmp_path):
+        """Test that page-range parts are merged into the same text output."""
+        pdf_path = make_pdf(pages=5)
+        output_dir = tmp_path / "out"
+        
+        batch = BatchExtractor(workers=2, split_pages=2, extract_tables=False)
+        results = batch.run([pdf_path], output_dir)
+        
+        assert results[0].error is None
+        expected = TextExtractor().extract(pdf_path)
+        assert results[0].text_path.read_text(encoding='utf-8') == expected
+        
+        # The offset sidecar spans the parts, so any page can be read directly
+        PDFExtractor().extract_and_save_text(pdf_path, tmp_path / "whole.txt")
+        with PageReader(results[0].text_path) as reader:
+            with PageReader(tmp_path / "whole.txt") as whole:
+                assert reader.page_numbers == [1, 2, 3, 4, 5]
+                assert reader.index.equals(whole.index)
+                assert reader.page(4) == whole.page(4)
+                page_four = whole.page(4)
+        
+        # A page table is cut from the same merged text and offsets
+        batch = BatchExtractor(
+            workers=2, split_pages=2, extract_tables=False, text_format="parquet"
+        )
+        results = batch.run([pdf_path], tmp_path / "pages")
+        assert results[0].text_path.name == "sample.pages.parquet"
+        with PageReader(results[0].text_path) as reader:
+            assert reader.page_numbers == [1, 2, 3, 4, 5]
+            assert reader.page(4) == page_four
+        assert catalog.open(tmp_path / "pages").pages().collect().height == 5
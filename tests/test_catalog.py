@@ -0,0 +1,127 @@
+"""Tests for the lazy catalog over extracted outputs."""
+
+import polars as pl
+
+from pdf_extractor import catalog
+from pdf_extractor.page_store import write_page_table
+from pdf_extractor.table_index import TableLocation, write_table_index
+
+
+def _write_outputs(output_dir):
+    """Write tables with two schemas for two documents plus a page table."""
+    hours = pl.DataFrame({"Week": ["1", "2"], "Hours": ["40", "38"]})
+    cases = pl.DataFrame({"Case No.": ["2024-CV-0001"], "Status": ["Active"]})
+    hours.write_parquet(output_dir / "alpha_table_0.parquet")
+    cases.write_parquet(output_dir / "alpha_table_1.parquet")
+    hours.write_parquet(output_dir / "beta_table_0.parquet")
+    write_page_table(
+        pl.DataFrame(
+            {
+                "page": [1, 2, 3],
+                "text": ["one", "two", "three"],
+                "char_count": [3, 3, 5],
+                "backend": ["pdfplumber"] * 3,
+            },
+            schema={"page": pl.Int32, "text": pl.Utf8, "char_count": pl.Int64, "backend": pl.Utf8},
+        ),
+        output_dir / "alpha.pages.parquet",
+    )
+
+
+class TestCatalog:
+    """Test cases for catalog.open."""
+    
+    def test_tables_grouped_by_schema(self, tmp_path):
+        """Test schema grouping and document/schema/column selection."""
+        _write_outputs(tmp_path)
+        
+        cat = catalog.open(tmp_path)
+        
+        schemas = cat.schemas()
+        assert sorted(schemas["tables"].to_list()) == [1, 2]
+        assert cat.documents() == ["alpha", "beta"]
+        
+        hours = cat.tables(columns=["Hours"]).collect()
+        assert hours.columns == ["document", "table", "Hours"]
+        assert hours.sort("document")["document"].to_list() == ["alpha", "alpha", "beta", "beta"]
+        
+        alpha = cat.tables(document="alpha").collect()
+        assert alpha.height == 3
+        assert set(alpha.columns) >= {"Week", "Case No."}
+        
+        cases_schema = schemas.filter(pl.col("tables") == 1)["schema"][0]
+        assert cat.tables(schema=cases_schema).collect()["Status"].to_list() == ["Active"]
+        assert cat.tables(document="missing").collect().height == 0
+    
+    def test_pages(self, tmp_path):
+        """Test page-table scanning with page filters."""
+        _write_outputs(tmp_path)
+        
+        cat = catalog.open(tmp_path)
+        
+        page = cat.pages(page=2).collect()
+        assert page.select("document", "page", "text").rows() == [("alpha", 2, "two")]
+        lazy = cat.pages().filter(pl.col("page") >= 2).select("text").collect()
+        assert lazy["text"].to_list() == ["two", "three"]
+    
+    def test_pages_keep_quality(self, tmp_path):
+        """Test that quality is scanned, and null for page tables written without it."""
+        _write_outputs(tmp_path)
+        write_page_table(
+            pl.DataFrame(
+                {
+                    "page": [1],
+                    "text": ["scored"],
+                    "char_count": [6],
+                    "backend": ["pdfplumber"],
+                    "quality": [0.75],
+                },
+                schema_overrides={"page": pl.Int32},
+            ),
+            tmp_path / "beta.pages.parquet",
+        )
+        
+        pages = catalog.open(tmp_path).pages(page=1).sort("document").collect()
+        
+        assert pages.columns[-1] == "quality"
+        assert pages.select("document", "quality").rows() == [("alpha", None), ("beta", 0.75)]
+    
+    def test_index_is_cached_and_refreshed(self, tmp_path):
+        """Test that the footer index is persisted and tracks file changes."""
+        _write_outputs(tmp_path)
+        catalog.open(tmp_path)
+        assert (tmp_path / catalog.INDEX_FILE).exists()
+        
+        (tmp_path / "beta_table_0.parquet").unlink()
+        pl.DataFrame({"x": [1]}).write_parquet(tmp_path / "gamma_table_0.parquet")
+        
+        cat = catalog.open(tmp_path)
+        assert cat.documents() == ["alpha", "gamma"]
+        assert cat.table_index().collect().height == 3
+    
+    def test_tables_filtered_by_page(self, tmp_path):
+        """Test that pages from the location index select table files."""
+        _write_outputs(tmp_path)
+        write_table_index(
+            [
+                TableLocation("alpha.pdf", 1, (10.0, 20.0, 300.0, 120.0), "pdfplumber"),
+                TableLocation("alpha.pdf", 2, (10.0, 40.0, 300.0, 90.0), "pdfplumber"),
+            ],
+            tmp_path,
+            "alpha",
+        )
+        
+        cat = catalog.open(tmp_path)
+        
+        index = cat.table_index().sort("path").select("path", "page", "top").collect()
+        assert index.rows() == [
+            ("alpha_table_0.parquet", 1, 20.0),
+            ("alpha_table_1.parquet", 2, 40.0),
+            ("beta_table_0.parquet", None, None),
+        ]
+        second = cat.tables(page=2).collect()
+        assert second.select("document", "table", "Status").rows() == [("alpha", 1, "Active")]
+        assert cat.tables(page=[1, 2], columns=["Hours"]).collect()["Hours"].to_list() == [
+            "40",
+            "38",
+        ]
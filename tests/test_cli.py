@@ -5,6 +5,8 @@ import tempfile
 from pathlib import Path
 import pytest
 
+SAMPLE_PDF = Path(__file__).parent.parent / "examples" / "legal_document_sample.pdf"
+
 
 class TestCLI:
     """Test cases for the command-line interface."""
@@ -66,4 +68,21 @@ class TestCLI:
             text=True
         )
         assert result.returncode == 1
-        assert "not found" in result.stderr or "not found" in result.stdout
\ No newline at end of file
+        assert "not found" in result.stderr or "not found" in result.stdout
+    
+    def test_cli_extract_tables_arrow_stdout(self):
+        """Test streaming tables to stdout as Arrow IPC."""
+        import pyarrow as pa
+        
+        result = subprocess.run(
+            ["python", "-m", "pdf_extractor.cli", "extract-tables",
+             str(SAMPLE_PDF), "--arrow-stdout"],
+            capture_output=True
+        )
+        assert result.returncode == 0
+        
+        reader = pa.BufferReader(result.stdout)
+        tables = []
+        while reader.tell() < len(result.stdout):
+            tables.append(pa.ipc.open_stream(reader).read_all())
+        assert len(tables) == 3
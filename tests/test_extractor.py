@@ -3,11 +3,39 @@
 import pytest
 from pathlib import Path
 import tempfile
+import time
 from unittest.mock import Mock, patch
 
 from pdf_extractor import PDFExtractor
 from pdf_extractor.text_extractor import TextExtractor
 from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.timeouts import PageTimeoutRunner
+
+
+def _slow_second_page(page):
+    """Page function that stalls on page 2."""
+    if page.page_number == 2:
+        time.sleep(30)
+    return page.page_number
+
+
+def _page_number(page):
+    """Page function returning the page number."""
+    return page.page_number
+
+
+class _SlowOpen:
+    """Stand-in for the pdfplumber module whose ``open`` takes ``delay`` seconds."""
+
+    def __init__(self, delay):
+        import pdfplumber
+
+        self.delay = delay
+        self.pdfplumber = pdfplumber
+
+    def open(self, path):
+        time.sleep(self.delay)
+        return self.pdfplumber.open(path)
 
 
 class TestTextExtractor:
@@ -83,6 +111,63 @@ class TestTableExtractor:
             assert result[0] == mock_polars_df
 
 
+class TestPageTimeoutRunner:
+    """Test cases for PageTimeoutRunner."""
+    
+    def test_invalid_timeout(self):
+        """Test that non-positive timeouts are rejected."""
+        with pytest.raises(ValueError):
+            PageTimeoutRunner(page_timeout=0)
+    
+    def test_page_timeout_skips_slow_page(self, make_pdf):
+        """Test that a stalled page is killed and later pages still run."""
+        pdf_path = make_pdf()
+        
+        runner = PageTimeoutRunner(page_timeout=2)
+        results, timed_out = runner.run(pdf_path, _slow_second_page)
+        
+        assert timed_out == [2]
+        assert results == {0: 1, 2: 3}
+    
+    def test_doc_timeout_returns_partial_results(self, make_pdf):
+        """Test that the document deadline stops extraction with partial results."""
+        pdf_path = make_pdf()
+        
+        runner = PageTimeoutRunner(doc_timeout=2)
+        results, timed_out = runner.run(pdf_path, _slow_second_page)
+        
+        assert timed_out == [2, 3]
+        assert results == {0: 1}
+    
+    def test_open_is_exempt_from_page_timeout(self, make_pdf, monkeypatch):
+        """Test that a slow open is not a page timeout but does count against the document."""
+        from pdf_extractor import timeouts
+        
+        pdf_path = make_pdf()
+        monkeypatch.setattr(timeouts, "pdfplumber", _SlowOpen(1.5))
+        
+        results, timed_out = PageTimeoutRunner(page_timeout=0.5).run(pdf_path, _page_number)
+        assert results == {0: 1, 1: 2, 2: 3}
+        assert timed_out == []
+        
+        monkeypatch.setattr(timeouts, "pdfplumber", _SlowOpen(30))
+        runner = PageTimeoutRunner(page_timeout=0.5, doc_timeout=1)
+        results, timed_out = runner.run(pdf_path, _page_number, pages=[0, 2])
+        assert results == {}
+        assert timed_out == [1, 3]
+    
+    def test_text_extractor_with_timeouts(self, make_pdf):
+        """Test that timed text extraction matches in-process extraction."""
+        pdf_path = make_pdf()
+        
+        extractor = TextExtractor(method="pdfplumber", page_timeout=30)
+        result = extractor.extract(pdf_path)
+        
+        assert result == TextExtractor(method="pdfplumber").extract(pdf_path)
+        assert "--- Page 3 ---" in result
+        assert extractor.timed_out_pages == []
+
+
 class TestPDFExtractor:
     """Test cases for PDFExtractor."""
     
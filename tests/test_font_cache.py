@@ -0,0 +1,101 @@
+"""Tests for the process-level font cache."""
+
+from types import SimpleNamespace
+
+import pdfplumber
+import pytest
+from pdfminer.pdftypes import PDFObjRef
+
+from pdf_extractor import font_cache
+from pdf_extractor.font_cache import FontCache, estimate_size
+from pdf_extractor.text_extractor import TextExtractor
+
+
+def write_ttf_pdf(path, text, font="Vera"):
+    """Write a one-page PDF in an embedded TrueType font shipped with reportlab."""
+    import os
+
+    import reportlab
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+
+    font_dir = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+    pdfmetrics.registerFont(TTFont(font, os.path.join(font_dir, f"{font}.ttf")))
+    pdf = canvas.Canvas(str(path))
+    pdf.setFont(font, 12)
+    pdf.drawString(72, 720, text)
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+@pytest.fixture
+def enabled_cache():
+    """Enable the process-level font cache for one test."""
+    yield font_cache.enable()
+    font_cache.disable()
+
+
+def _page_fonts(pdf_path):
+    """Lay out the first page with the cache attached and return its fonts by name."""
+    with pdfplumber.open(pdf_path) as pdf:
+        font_cache.attach(pdf)
+        pdf.pages[0].chars
+        return {font.basefont: font for font in pdf.rsrcmgr._cached_fonts.values()}
+
+
+class TestFontCache:
+    """Test cases for FontCache and CachingResourceManager."""
+
+    def test_fonts_shared_across_documents(self, tmp_path, enabled_cache):
+        """Test that an identical embedded font is parsed once and detached from its document."""
+        first = write_ttf_pdf(tmp_path / "first.pdf", "Invoice 1001 total 250.00")
+        second = write_ttf_pdf(tmp_path / "second.pdf", "Invoice 1001 total 250.00")
+        bold = write_ttf_pdf(tmp_path / "bold.pdf", "Invoice 1001 total 250.00", "VeraBd")
+
+        # reportlab also lists Helvetica on every page
+        fonts = _page_fonts(first)
+        assert enabled_cache.hits == 0 and len(enabled_cache) == 2
+        assert _page_fonts(second) == fonts
+        assert enabled_cache.hits == 2
+        bold_fonts = _page_fonts(bold)
+        assert bold_fonts["Helvetica"] is fonts["Helvetica"]
+        assert len(enabled_cache) == 3
+
+        font = fonts["AAAAAA+BitstreamVeraSans-Roman"]
+        assert not hasattr(font, "fontfile")
+        assert not any(isinstance(value, PDFObjRef) for value in font.descriptor.values())
+
+    def test_cached_text_matches(self, tmp_path, enabled_cache):
+        """Test that text extracted through cached fonts is unchanged."""
+        paths = [
+            write_ttf_pdf(tmp_path / f"{i}.pdf", f"Résumé {i} – naïve façade") for i in range(3)
+        ]
+        cached = [TextExtractor(method="pdfplumber").extract(path) for path in paths]
+        font_cache.disable()
+        uncached = [TextExtractor(method="pdfplumber").extract(path) for path in paths]
+
+        assert cached == uncached
+        assert "Résumé 2 – naïve façade" in cached[2]
+        assert enabled_cache.hits == 4
+
+    def test_evicts_least_recently_used_over_cap(self):
+        """Test that the memory cap evicts the oldest fonts and skips oversize ones."""
+        def fake_font(widths):
+            return SimpleNamespace(widths=dict.fromkeys(range(widths), 500), descriptor={})
+
+        size = estimate_size(fake_font(100))
+        cache = FontCache(max_bytes=2 * size)
+        cache.put("a", fake_font(100))
+        cache.put("b", fake_font(100))
+        assert cache.get("a") is not None
+        cache.put("c", fake_font(100))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 2 * size
+
+        cache.put("huge", fake_font(10_000))
+        assert cache.get("huge") is None and len(cache) == 2
@@ -0,0 +1,118 @@
+"""Tests for AcroForm field extraction."""
+
+from pathlib import Path
+
+import polars as pl
+
+from pdf_extractor import PDFExtractor
+from pdf_extractor.forms import FIELD_SCHEMA
+
+
+def write_form_pdf(path: Path, client: str = "Jane Doe", signed: bool = True) -> Path:
+    """Write a two-page fillable intake form."""
+    from reportlab.pdfgen import canvas
+    
+    pdf = canvas.Canvas(str(path))
+    form = pdf.acroForm
+    pdf.drawString(72, 760, "Client intake")
+    form.textfield(name="client_name", value=client, x=72, y=700, width=200, height=20)
+    form.checkbox(name="retainer_signed", checked=signed, x=72, y=660)
+    form.choice(
+        name="matter_type",
+        value="Litigation",
+        options=["Litigation", "Contract"],
+        x=72,
+        y=620,
+        width=150,
+        height=20,
+    )
+    form.radio(name="priority", value="high", selected=True, x=72, y=580)
+    form.radio(name="priority", value="low", selected=False, x=100, y=580)
+    pdf.showPage()
+    form.textfield(name="notes", value="", x=72, y=700, width=200, height=20)
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+def write_indirect_form_pdf(path: Path) -> Path:
+    """Write a form whose /Fields and radio /Kids arrays are indirect objects."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R /AcroForm 4 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Annots [6 0 R 9 0 R] >>",
+        b"<< /Fields 5 0 R >>",
+        b"[6 0 R 7 0 R]",
+        b"<< /T (client_name) /FT /Tx /V (Jane Doe) /Subtype /Widget /P 3 0 R "
+        b"/Rect [72 700 272 720] >>",
+        b"<< /T (priority) /FT /Btn /Ff 49152 /V /high /Kids 8 0 R >>",
+        b"[9 0 R]",
+        b"<< /Parent 7 0 R /Subtype /Widget /P 3 0 R /AS /high /Rect [72 580 90 598] >>",
+    ]
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(data))
+    return path
+
+
+class TestForms:
+    """Test cases for PDFExtractor.extract_form_fields and extract_form_records."""
+    
+    def test_extract_form_fields(self, tmp_path):
+        """Test that names, types, values and widget pages are read."""
+        fields = PDFExtractor().extract_form_fields(write_form_pdf(tmp_path / "form.pdf"))
+        
+        assert dict(fields.schema) == FIELD_SCHEMA
+        assert fields.rows() == [
+            ("client_name", "text", "Jane Doe", 1),
+            ("retainer_signed", "checkbox", "Yes", 1),
+            ("matter_type", "combo", "Litigation", 1),
+            ("priority", "radio", "high", 1),
+            ("notes", "text", "", 2),
+        ]
+    
+    def test_indirect_field_arrays(self, tmp_path):
+        """Test that /Fields and /Kids given as indirect references are followed."""
+        path = write_indirect_form_pdf(tmp_path / "indirect.pdf")
+        
+        fields = PDFExtractor().extract_form_fields(path)
+        
+        assert fields.rows() == [
+            ("client_name", "text", "Jane Doe", 1),
+            ("priority", "radio", "high", 1),
+        ]
+    
+    def test_document_without_form(self, make_pdf):
+        """Test that a PDF without an AcroForm gives an empty frame."""
+        fields = PDFExtractor().extract_form_fields(make_pdf())
+        
+        assert fields.is_empty()
+        assert fields.columns == list(FIELD_SCHEMA)
+    
+    def test_extract_form_records(self, tmp_path, make_pdf):
+        """Test that batch mode gives one row per document with a column per field."""
+        paths = [
+            write_form_pdf(tmp_path / "a.pdf"),
+            write_form_pdf(tmp_path / "b.pdf", client="John Roe", signed=False),
+            make_pdf(),
+        ]
+        
+        records = PDFExtractor().extract_form_records(paths)
+        
+        assert records.columns == [
+            "document", "client_name", "retainer_signed", "matter_type", "priority", "notes"
+        ]
+        assert records["document"].to_list() == [str(path) for path in paths]
+        assert records["client_name"].to_list() == ["Jane Doe", "John Roe", None]
+        assert records["retainer_signed"].to_list() == ["Yes", "Off", None]
+        assert records.schema["priority"] == pl.Utf8
@@ -0,0 +1,78 @@
+"""Tests for columnar character and word export."""
+
+from pathlib import Path
+
+import pdfplumber
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from pdf_extractor import PDFExtractor
+from pdf_extractor.glyphs import CHAR_SCHEMA, WORD_SCHEMA
+
+SAMPLE_PDF = Path(__file__).parent.parent / "examples" / "legal_document_sample.pdf"
+
+
+class TestGlyphs:
+    """Test cases for extract_chars and extract_words."""
+
+    def test_chars_match_pdfplumber(self):
+        """Test that characters and their positions equal pdfplumber's page.chars."""
+        chars = PDFExtractor().extract_chars(SAMPLE_PDF)
+
+        with pdfplumber.open(SAMPLE_PDF) as pdf:
+            expected = [char for page in pdf.pages for char in page.chars]
+
+        assert chars.columns == list(CHAR_SCHEMA)
+        assert chars.schema["x0"] == pl.Float32
+        assert chars.schema["font"] == pl.Categorical
+        assert chars["text"].to_list() == [char["text"] for char in expected]
+        assert chars["font"].cast(pl.Utf8).to_list() == [char["fontname"] for char in expected]
+        for column in ("x0", "x1", "top", "bottom"):
+            assert chars[column].to_list() == pytest.approx(
+                [char[column] for char in expected], abs=1e-3
+            )
+        # Columnar storage: a few dozen bytes per glyph rather than a dict
+        assert chars.estimated_size() / chars.height < 40
+
+    def test_words_match_pdfplumber(self):
+        """Test that words equal pdfplumber's extract_words with default tolerances."""
+        words = PDFExtractor().extract_words(SAMPLE_PDF)
+
+        with pdfplumber.open(SAMPLE_PDF) as pdf:
+            expected = [
+                (page.page_number, word)
+                for page in pdf.pages
+                for word in page.extract_words()
+            ]
+
+        assert words.columns == list(WORD_SCHEMA)
+        assert words["page"].to_list() == [page for page, _ in expected]
+        assert words["text"].to_list() == [word["text"] for _, word in expected]
+        assert words["x0"].to_list() == pytest.approx(
+            [word["x0"] for _, word in expected], abs=1e-3
+        )
+
+    def test_streaming_parquet_output(self, make_pdf, tmp_path):
+        """Test that pages are streamed one at a time into one row group each."""
+        pdf_path = make_pdf(pages=3)
+        extractor = PDFExtractor()
+
+        pages = list(extractor.iter_words(pdf_path, pages=[1, 3]))
+        assert [frame["page"].unique().to_list() for frame in pages] == [[1], [3]]
+
+        output = tmp_path / "words.parquet"
+        count = extractor.extract_and_save_words(pdf_path, output)
+
+        assert count == 9  # "Sample page N" on each of 3 pages
+        assert pq.read_metadata(output).num_row_groups == 3
+        assert pl.read_parquet(output).filter(pl.col("page") == 2)["text"].to_list() == [
+            "Sample",
+            "page",
+            "2",
+        ]
+
+    def test_missing_file(self):
+        """Test that a missing PDF raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PDFExtractor().extract_words("nonexistent.pdf")
@@ -0,0 +1,103 @@
+"""Tests for keyword-targeted page search."""
+
+import re
+from unittest.mock import patch
+
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.grep import candidate_pages, compile_patterns
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+from tests.pdf_builders import write_ruled_pdf
+
+
+def write_docket_pdf(path):
+    """Write a five-page PDF that names the docket on pages 2 and 4 only."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    for page in range(1, 6):
+        pdf.drawString(72, 720, f"Filler page {page}")
+        if page == 2:
+            pdf.drawString(72, 700, "Docket No. 24-CV-1187")
+        if page == 4:
+            # Split across operators and separated only by positioning
+            pdf.drawString(72, 700, "Dock")
+            pdf.drawString(72 + pdf.stringWidth("Dock", "Helvetica", 12), 700, "et")
+            pdf.drawString(140, 700, "No. 24-CV-1187")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def write_case_tables_pdf(path):
+    """Write three pages, each with a ruled table; pages 1 and 3 name a case."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    for page in range(1, 4):
+        rows = [["Case", "Amount"], [f"24-CV-{page}" if page != 2 else "none", f"{page}00"]]
+        for i in range(len(rows) + 1):
+            pdf.line(72, 720 - i * 20, 312, 720 - i * 20)
+        for j in range(3):
+            pdf.line(72 + j * 120, 720, 72 + j * 120, 680)
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                pdf.drawString(76 + j * 120, 720 - (i + 1) * 20 + 6, text)
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+class TestGrep:
+    """Test cases for candidate_pages and PDFExtractor.find_pages."""
+
+    def test_candidate_pass(self, tmp_path):
+        """Test that the content-stream pass finds split and positioned text only where it is."""
+        pdf_path = write_docket_pdf(tmp_path / "docket.pdf")
+
+        # Page 4 splits "Docket" across operators and spaces "No." by positioning alone
+        assert candidate_pages(pdf_path, compile_patterns(["Docket"])) == [2, 4]
+        assert candidate_pages(pdf_path, compile_patterns([r"et No\. 24-CV"])) == [2, 4]
+        assert candidate_pages(pdf_path, compile_patterns(["docket"], ignore_case=True)) == [2, 4]
+        compiled = compile_patterns([re.compile("docket", re.MULTILINE)], ignore_case=True)
+        assert compiled[0].flags & re.IGNORECASE and compiled[0].flags & re.MULTILINE
+        assert candidate_pages(pdf_path, compiled) == [2, 4]
+        assert candidate_pages(pdf_path, compile_patterns(["Docket"]), pages=[3, 4]) == [4]
+        assert candidate_pages(pdf_path, compile_patterns(["absent"])) == []
+
+    def test_find_pages_lays_out_candidates_only(self, tmp_path):
+        """Test that only candidate pages are fully extracted and hits carry matching lines."""
+        pdf_path = write_docket_pdf(tmp_path / "docket.pdf")
+        extract = TextExtractor.extract
+
+        with patch.object(TextExtractor, "extract", autospec=True, side_effect=extract) as spy:
+            hits = PDFExtractor().find_pages(pdf_path, [r"24-CV-\d+"])
+
+        assert spy.call_args.args[2] == [2, 4]
+        assert [hit.page for hit in hits] == [2, 4]
+        assert hits[0].matches == ["24-CV-1187"]
+        assert hits[0].lines == ["Docket No. 24-CV-1187"]
+        assert hits[0].tables == []
+
+    def test_find_pages_with_tables(self, tmp_path):
+        """Test that tables are extracted from matching pages when requested."""
+        rows = [["Case", "Amount"], ["24-CV-1187", "1,250.00"]]
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", rows)
+
+        hits = PDFExtractor(table_method="lattice").find_pages(pdf_path, ["24-CV"], tables=True)
+
+        assert len(hits) == 1
+        assert len(hits[0].tables) == 1
+        assert hits[0].tables[0].columns == rows[0]
+
+        # Tables of all matching pages come from one run, split by page
+        pdf_path = write_case_tables_pdf(tmp_path / "cases.pdf")
+        extract = TableExtractor.extract
+        with patch.object(TableExtractor, "extract", autospec=True, side_effect=extract) as spy:
+            hits = PDFExtractor(table_method="lattice").find_pages(
+                pdf_path, [r"24-CV-\d"], tables=True
+            )
+
+        assert spy.call_count == 1 and spy.call_args.args[2] == [1, 3]
+        assert [hit.page for hit in hits] == [1, 3]
+        assert [hit.tables[0]["Case"].to_list() for hit in hits] == [["24-CV-1"], ["24-CV-3"]]
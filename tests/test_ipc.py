@@ -0,0 +1,35 @@
+"""Tests for memory-mapped Arrow result handoff."""
+
+import os
+import pickle
+
+import polars as pl
+import pyarrow as pa
+
+from pdf_extractor.ipc import export_result, import_result, table_streams
+
+
+class TestSharedResult:
+    """Test cases for export_result/import_result."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that text and tables survive the handoff."""
+        tables = [
+            pl.DataFrame({"Week": ["1", "2"], "Hours": [40, 38]}),
+            pl.DataFrame({"Total": [1.5]}),
+        ]
+        
+        handle = pickle.loads(pickle.dumps(export_result("Größe", tables, tmp_path)))
+        text, result = import_result(handle)
+        
+        assert text == "Größe"
+        assert [t.to_dicts() for t in result] == [t.to_dicts() for t in tables]
+        assert not os.path.exists(handle.path)
+    
+    def test_table_streams_are_valid_ipc(self, tmp_path):
+        """Test that raw table streams can be decoded on their own."""
+        table = pl.DataFrame({"a": [1, 2, 3]})
+        
+        streams = table_streams(export_result(None, [table], tmp_path))
+        
+        assert pa.ipc.open_stream(streams[0]).read_all().num_rows == 3
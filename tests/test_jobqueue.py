@@ -0,0 +1,128 @@
+"""Tests for the shared SQLite job queue."""
+
+import shutil
+import sqlite3
+import subprocess
+import sys
+import time
+
+from pdf_extractor.jobqueue import JobQueue, Worker
+
+
+class TestJobQueue:
+    """Test cases for JobQueue leasing."""
+    
+    def test_enqueue_is_idempotent(self, make_pdf, tmp_path):
+        """Test that re-enqueueing the same PDFs adds nothing."""
+        queue = JobQueue(tmp_path / "jobs.db")
+        pdfs = [make_pdf("a.pdf"), make_pdf("b.pdf")]
+        
+        assert queue.enqueue(pdfs, tmp_path / "out") == 2
+        assert queue.enqueue(pdfs, tmp_path / "out") == 0
+        assert queue.stats()["pending"] == 2
+    
+    def test_same_stem_rejected_per_output_dir(self, make_pdf, tmp_path):
+        """Test that a second PDF with a taken stem is not queued for the same outputs."""
+        queue = JobQueue(tmp_path / "jobs.db")
+        first, second = tmp_path / "a" / "doc.pdf", tmp_path / "b" / "doc.pdf"
+        for path in (first, second):
+            path.parent.mkdir()
+            shutil.copy(make_pdf(), path)
+        
+        assert queue.enqueue([first, second], tmp_path / "out") == 1
+        assert queue.enqueue([second], tmp_path / "out") == 0
+        assert queue.enqueue([second], tmp_path / "other") == 1
+        with sqlite3.connect(tmp_path / "jobs.db") as conn:
+            queued = conn.execute(
+                "SELECT pdf_path FROM jobs WHERE output_dir = ?",
+                (str((tmp_path / "out").resolve()),),
+            ).fetchall()
+        assert queued == [(str(first.resolve()),)]
+    
+    def test_largest_job_leased_first(self, make_pdf, tmp_path):
+        """Test that jobs are leased by estimated cost."""
+        queue = JobQueue(tmp_path / "jobs.db")
+        queue.enqueue([make_pdf("small.pdf", pages=1), make_pdf("large.pdf", pages=8)], tmp_path)
+        
+        assert queue.lease("w1").pdf_path.name == "large.pdf"
+    
+    def test_expired_lease_is_reclaimed(self, make_pdf, tmp_path):
+        """Test that another worker takes over an expired lease."""
+        queue = JobQueue(tmp_path / "jobs.db", lease_seconds=0.1)
+        queue.enqueue([make_pdf()], tmp_path / "out")
+        
+        first = queue.lease("w1")
+        assert queue.lease("w2") is None
+        time.sleep(0.2)
+        second = queue.lease("w2")
+        
+        assert second.job_id == first.job_id
+        assert second.attempts == 2
+        assert not queue.complete(first, "w1")
+        assert queue.complete(second, "w2")
+        assert queue.stats()["done"] == 1
+    
+    def test_failed_job_retries_until_max_attempts(self, make_pdf, tmp_path):
+        """Test retry accounting on failure."""
+        queue = JobQueue(tmp_path / "jobs.db")
+        queue.enqueue([make_pdf()], tmp_path / "out", max_attempts=2)
+        
+        queue.fail(queue.lease("w1"), "w1", "boom")
+        assert queue.stats()["pending"] == 1
+        queue.fail(queue.lease("w1"), "w1", "boom")
+        
+        assert queue.stats()["failed"] == 1
+        assert queue.failures()[0]["error"] == "boom"
+        assert queue.lease("w1") is None
+
+
+class TestWorker:
+    """Test cases for draining the queue with workers."""
+    
+    def test_worker_commits_outputs(self, make_pdf, tmp_path):
+        """Test that a worker writes outputs and marks the job done."""
+        queue = JobQueue(tmp_path / "jobs.db")
+        queue.enqueue([make_pdf()], tmp_path / "out")
+        
+        # Left by an earlier run that found more tables
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "sample_table_3.parquet").write_bytes(b"stale")
+        (tmp_path / "out" / "sample_extra_table_0.parquet").write_bytes(b"other")
+        
+        assert Worker(queue).run() == 1
+        assert (tmp_path / "out" / "sample.txt").exists()
+        assert not list((tmp_path / "out").glob(".staging-*"))
+        assert not (tmp_path / "out" / "sample_table_3.parquet").exists()
+        assert (tmp_path / "out" / "sample_extra_table_0.parquet").exists()
+        
+        queue = JobQueue(tmp_path / "pages.db")
+        queue.enqueue([make_pdf()], tmp_path / "pages")
+        assert Worker(queue, text_format="parquet").run() == 1
+        assert (tmp_path / "pages" / "sample.pages.parquet").exists()
+        assert not (tmp_path / "pages" / "sample.txt").exists()
+    
+    def test_several_worker_processes_drain_queue(self, make_pdf, tmp_path):
+        """Test that concurrent worker processes complete each job exactly once."""
+        db_path = tmp_path / "jobs.db"
+        output_dir = tmp_path / "out"
+        pdfs = [make_pdf(f"doc{i}.pdf", pages=2) for i in range(8)]
+        JobQueue(db_path).enqueue(pdfs, output_dir)
+        
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "pdf_extractor.cli", "worker", str(db_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for _ in range(3)
+        ]
+        for worker in workers:
+            assert worker.wait(timeout=120) == 0
+        
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT status, attempts FROM jobs").fetchall()
+        
+        assert rows == [("done", 1)] * len(pdfs)
+        assert sorted(p.name for p in output_dir.glob("*.txt")) == sorted(
+            f"doc{i}.txt" for i in range(8)
+        )
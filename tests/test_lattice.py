@@ -0,0 +1,69 @@
+"""Tests for the NumPy lattice table backend."""
+
+from pathlib import Path
+
+import pdfplumber
+import polars as pl
+import pytest
+
+from pdf_extractor import lattice
+from pdf_extractor.table_extractor import TableExtractor
+from tests.pdf_builders import write_ruled_pdf
+
+SAMPLE_PDF = Path(__file__).parent.parent / "examples" / "legal_document_sample.pdf"
+
+
+class TestLattice:
+    """Test cases for the lattice detector."""
+
+    def test_find_tables_with_spanning_row(self, tmp_path):
+        """Test that cells are filled and a spanning cell leaves None positions."""
+        rows = [
+            ["Item", "Hours", "Amount"],
+            ["Review", "2.5", "$500.00"],
+            ["Filing", "1.0", "$200.00"],
+            ["Total: $700.00", None, None],
+        ]
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", rows, span_last_row=True)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            tables = lattice.find_tables(pdf.pages[0])
+
+        assert len(tables) == 1
+        bbox, found = tables[0]
+        assert found == rows
+        assert bbox == pytest.approx((72, 842 - 720, 72 + 360, 842 - 640), abs=1)
+
+    def test_matches_pdfplumber_on_sample(self):
+        """Test that lattice finds pdfplumber's tables and cells on the ruled sample."""
+        with pdfplumber.open(SAMPLE_PDF) as pdf:
+            for page in pdf.pages:
+                expected = page.extract_tables()
+                found = [rows for _, rows in lattice.find_tables(page)]
+
+                # pdfplumber crops words at cell borders while lattice assigns
+                # whole words, so text that overflows a cell can differ; the
+                # grids and the amounts in the last column must agree
+                assert [[[c is None for c in row] for row in t] for t in found] == [
+                    [[c is None for c in row] for row in t] for t in expected
+                ]
+                assert [[row[-1] for row in t[1:]] for t in found] == [
+                    [row[-1] for row in t[1:]] for t in expected
+                ]
+
+    def test_table_extractor_lattice_method(self, tmp_path):
+        """Test that the lattice method returns Polars frames named by the header row."""
+        rows = [
+            ["Item", "Hours", "Amount"],
+            ["Review", "2.5", "$500.00"],
+            ["Total", None, None],
+        ]
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", rows, span_last_row=True)
+
+        tables = TableExtractor(method="lattice").extract(pdf_path)
+
+        assert len(tables) == 1
+        assert tables[0].schema == pl.Schema(
+            {"Item": pl.Utf8, "Hours": pl.Utf8, "Amount": pl.Utf8}
+        )
+        assert tables[0].rows() == [("Review", "2.5", "$500.00"), ("Total", None, None)]
@@ -0,0 +1,99 @@
+"""Tests for persisted layout snapshots."""
+
+import os
+from unittest.mock import patch
+
+import pdfplumber
+
+from pdf_extractor import table_extractor
+from pdf_extractor.layout_snapshot import SNAPSHOT_KINDS, LayoutSnapshots
+from pdf_extractor.object_filter import TEXT_ONLY, load_layout
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+from tests.pdf_builders import write_ruled_pdf
+
+ROWS = [["Item", "Qty", "Price"], ["Widget", "2", "3.50"], ["Gadget", "1", "12.00"]]
+
+
+class TestLayoutSnapshot:
+    """Test cases for LayoutSnapshots and the extractors reading them."""
+
+    def test_tables_read_snapshot(self, tmp_path):
+        """Test that a second run restores every page instead of laying it out."""
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", ROWS)
+        snapshots = LayoutSnapshots(tmp_path / "snapshots")
+        expected = TableExtractor(method="lattice").extract(pdf_path)
+
+        first = TableExtractor(method="lattice", layout_snapshots=snapshots).extract(pdf_path)
+        assert snapshots.path(pdf_path).exists()
+
+        with patch.object(table_extractor, "load_layout") as load_layout:
+            second = TableExtractor(method="stream", layout_snapshots=snapshots).extract(pdf_path)
+            third = TableExtractor(method="lattice", layout_snapshots=snapshots).extract(pdf_path)
+        load_layout.assert_not_called()
+
+        rows = [table.rows() for table in expected]
+        assert [table.rows() for table in first] == [table.rows() for table in third] == rows
+        assert second[0].columns == ROWS[0]
+
+    def test_restores_objects_and_words(self, tmp_path):
+        """Test that restored objects and stored words equal pdfplumber's own."""
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", ROWS)
+        snapshots = LayoutSnapshots(tmp_path)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            page = pdf.pages[0]
+            expected = {kind: page.objects[kind] for kind in SNAPSHOT_KINDS if kind in page.objects}
+            words = page.extract_words()
+            snapshot = snapshots.open(pdf_path, SNAPSHOT_KINDS)
+            snapshot.record(page)
+            snapshot.save()
+
+        snapshot = snapshots.open(pdf_path, SNAPSHOT_KINDS)
+        with pdfplumber.open(pdf_path) as pdf:
+            page = pdf.pages[0]
+            assert snapshot.restore(page)
+            assert page.objects == expected
+        assert snapshot.words(1) == words
+
+    def test_stale_and_text_only_snapshots_are_rebuilt(self, tmp_path):
+        """Test that a changed PDF or a chars-only snapshot is not used for tables."""
+        pdf_path = write_ruled_pdf(tmp_path / "ruled.pdf", ROWS)
+        snapshots = LayoutSnapshots(tmp_path / "snapshots")
+
+        text = TextExtractor(
+            method="pdfplumber", skip_objects=TEXT_ONLY, layout_snapshots=snapshots
+        )
+        assert "Widget" in text.extract(pdf_path)
+        assert len(snapshots.open(pdf_path, SNAPSHOT_KINDS)) == 0
+        assert 1 in snapshots.open(pdf_path, ["char"])
+
+        extractor = TableExtractor(method="lattice", layout_snapshots=snapshots)
+        assert len(extractor.extract(pdf_path)) == 1
+        assert 1 in snapshots.open(pdf_path, SNAPSHOT_KINDS)
+
+        write_ruled_pdf(pdf_path, [["Changed", "Header", "Row"], ["a", "b", "c"]])
+        stat = pdf_path.stat()
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert 1 not in snapshots.open(pdf_path, SNAPSHOT_KINDS)
+        assert extractor.extract(pdf_path)[0].columns == ["Changed", "Header", "Row"]
+
+    def test_concurrent_page_ranges_are_merged(self, tmp_path, make_pdf):
+        """Test that two snapshots opened before either saves keep both page ranges."""
+        pdf_path = make_pdf(pages=4)
+        snapshots = LayoutSnapshots(tmp_path / "snapshots")
+        # Like two batch tasks for pages 1-2 and 3-4 of one document
+        first = snapshots.open(pdf_path, SNAPSHOT_KINDS)
+        second = snapshots.open(pdf_path, SNAPSHOT_KINDS)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            for snapshot, pages in ((first, pdf.pages[:2]), (second, pdf.pages[2:])):
+                for page in pages:
+                    load_layout(page, frozenset())
+                    snapshot.record(page)
+        second.save()
+        first.save()
+
+        merged = snapshots.open(pdf_path, SNAPSHOT_KINDS)
+        assert all(page in merged for page in (1, 2, 3, 4))
+        assert merged.words(3)[-1]["text"] == "3"
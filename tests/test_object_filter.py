@@ -0,0 +1,86 @@
+"""Tests for object-type filtering during page layout."""
+
+import pdfplumber
+import pytest
+
+from pdf_extractor.object_filter import (
+    RULINGS_ONLY,
+    TEXT_ONLY,
+    load_layout,
+    strip_path_operators,
+)
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+from tests.pdf_builders import write_ruled_pdf
+
+
+def write_drawing_pdf(path):
+    """Write a page of text surrounded by curves and a filled rect."""
+    from reportlab.pdfgen import canvas
+    
+    pdf = canvas.Canvas(str(path))
+    for i in range(200):
+        pdf.bezier(50 + i, 100, 80 + i, 160, 120 + i, 40, 150 + i, 100)
+    pdf.rect(50, 300, 200, 50, fill=1)
+    pdf.drawString(72, 720, "Section A (see note 1 2 l) h")
+    pdf.drawString(72, 700, "Grid line 4 to 7")
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+class TestObjectFilter:
+    """Test cases for skip_objects on the text and table extractors."""
+    
+    def test_strip_path_operators(self):
+        """Test that paths are removed and strings, text operators and inline images kept."""
+        stream = (
+            b"q 0 0 m 100 0 l S 10 20 30 40 re f* 1 2 3 4 5 6 c h W n "
+            b"BT /F1 12 Tf (a 1 2 l (b) h) Tj [(x) -250 (y)] TJ ET Q"
+        )
+        
+        assert strip_path_operators(stream).split() == [
+            b"q", b"BT", b"/F1", b"12", b"Tf", b"(a", b"1", b"2", b"l", b"(b)", b"h)",
+            b"Tj", b"[(x)", b"-250", b"(y)]", b"TJ", b"ET", b"Q",
+        ]
+        inline = b"0 0 m 1 1 l S BI /W 1 /H 1 ID \x00 EI"
+        assert strip_path_operators(inline) == inline
+    
+    def test_text_only_layout(self, tmp_path):
+        """Test that skipping graphics leaves no paths but the same text."""
+        pdf_path = write_drawing_pdf(tmp_path / "drawing.pdf")
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            page = pdf.pages[0]
+            load_layout(page, TEXT_ONLY)
+            assert not page.curves and not page.rects and not page.lines
+            assert len(page.chars) > 0
+        
+        expected = TextExtractor(method="pdfplumber").extract(pdf_path)
+        text = TextExtractor(method="pdfplumber", skip_objects=TEXT_ONLY).extract(pdf_path)
+        assert text == expected
+        assert "see note 1 2 l" in text
+        
+        timed = TextExtractor(method="pdfplumber", page_timeout=60, skip_objects=TEXT_ONLY)
+        assert timed.extract(pdf_path) == expected
+    
+    def test_rulings_only_tables(self, tmp_path):
+        """Test that tables are found from lines and rects with curves skipped."""
+        pdf_path = write_ruled_pdf(
+            tmp_path / "ruled.pdf",
+            [["Item", "Amount"], ["Review", "$500.00"], ["Filing", "$200.00"]],
+        )
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            page = pdf.pages[0]
+            load_layout(page, RULINGS_ONLY)
+            assert not page.curves and not page.images
+            assert page.lines or page.rects
+        
+        for method in ("pdfplumber", "lattice"):
+            expected = TableExtractor(method=method).extract(pdf_path)
+            tables = TableExtractor(method=method, skip_objects=RULINGS_ONLY).extract(pdf_path)
+            assert [t.rows() for t in tables] == [t.rows() for t in expected]
+        
+        with pytest.raises(ValueError):
+            TextExtractor(skip_objects=["annotation"])
@@ -0,0 +1,143 @@
+"""Tests for the per-page result cache."""
+
+import io
+import re
+
+import PyPDF2
+from PyPDF2.generic import IndirectObject, NameObject
+
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.page_cache import PageCache, count_revisions, page_fingerprints
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+
+
+def write_repeated_pdf(path, lines):
+    """Write a PDF with one page per line; equal lines give identical pages."""
+    from reportlab.pdfgen import canvas
+    
+    pdf = canvas.Canvas(str(path))
+    for line in lines:
+        pdf.drawString(72, 720, line)
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def append_incremental_update(path, page_index, text):
+    """Append a revision that replaces one page's content stream."""
+    data = path.read_bytes()
+    prev = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    size = int(reader.trailer["/Size"])
+    root_id = reader.trailer.raw_get("/Root").idnum
+    page_id = reader.trailer["/Root"]["/Pages"]["/Kids"][page_index].idnum
+    
+    page = reader.pages[page_index].get_object()
+    page[NameObject("/Contents")] = IndirectObject(size, 0, reader)
+    content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    
+    update = io.BytesIO()
+    offsets = {}
+    offsets[size] = len(data) + update.tell()
+    update.write(b"%d 0 obj\n<< /Length %d >>\nstream\n" % (size, len(content)))
+    update.write(content + b"\nendstream\nendobj\n")
+    offsets[page_id] = len(data) + update.tell()
+    update.write(b"%d 0 obj\n" % page_id)
+    page.write_to_stream(update, None)
+    update.write(b"\nendobj\n")
+    
+    xref = len(data) + update.tell()
+    update.write(b"xref\n")
+    for obj_id in sorted(offsets):
+        update.write(b"%d 1\n%010d 00000 n \n" % (obj_id, offsets[obj_id]))
+    update.write(
+        b"trailer\n<< /Size %d /Root %d 0 R /Prev %d >>\nstartxref\n%d\n%%%%EOF\n"
+        % (size + 1, root_id, prev, xref)
+    )
+    path.write_bytes(data + update.getvalue())
+
+
+class TestPageCache:
+    """Test cases for incremental re-extraction."""
+    
+    def test_fingerprints_track_changed_pages(self, make_pdf):
+        """Test that an incremental update only changes the edited page's hash."""
+        pdf_path = make_pdf(pages=3)
+        before = page_fingerprints(pdf_path)
+        assert count_revisions(pdf_path) == 1
+        
+        append_incremental_update(pdf_path, 1, "Amended page 2")
+        after = page_fingerprints(pdf_path)
+        
+        assert count_revisions(pdf_path) == 2
+        assert [a == b for a, b in zip(before, after)] == [True, False, True]
+    
+    def test_reextraction_reuses_unchanged_pages(self, make_pdf, tmp_path):
+        """Test that only changed pages are extracted again."""
+        pdf_path = make_pdf(pages=3)
+        extractor = PDFExtractor(page_cache=tmp_path / "pages.db")
+        
+        first = extractor.extract_text(pdf_path)
+        assert extractor.text_extractor.reused_pages == []
+        assert extractor.extract_text(pdf_path) == first
+        assert extractor.text_extractor.reused_pages == [1, 2, 3]
+        
+        append_incremental_update(pdf_path, 1, "Amended page 2")
+        text = extractor.extract_text(pdf_path)
+        
+        assert extractor.text_extractor.reused_pages == [1, 3]
+        assert "Amended page 2" in text and "Sample page 3" in text
+    
+    def test_timed_and_table_paths_use_cache(self, make_pdf, tmp_path):
+        """Test the cache with page timeouts and with table extraction."""
+        pdf_path = make_pdf(pages=3)
+        cache = PageCache(tmp_path / "pages.db")
+        
+        text_extractor = TextExtractor(page_timeout=30, page_cache=cache)
+        first = text_extractor.extract(pdf_path)
+        assert text_extractor.extract(pdf_path, pages=[2, 3]).count("--- Page") == 2
+        assert text_extractor.reused_pages == [2, 3]
+        assert "Sample page 1" in first
+        
+        table_extractor = TableExtractor(method="pdfplumber", page_cache=cache)
+        table_extractor.extract(pdf_path)
+        table_extractor.extract(pdf_path)
+        assert table_extractor.reused_pages == [1, 2, 3]
+
+
+class TestDuplicatePages:
+    """Test cases for duplicate-page detection within a document."""
+    
+    def test_identical_pages_extracted_once(self, tmp_path):
+        """Test that repeats reuse the first copy's text and are counted."""
+        pdf_path = write_repeated_pdf(
+            tmp_path / "packet.pdf", ["Terms", "Signature", "Terms", "Terms"]
+        )
+        extractor = TextExtractor(dedupe_pages=True)
+        
+        text = extractor.extract(pdf_path)
+        
+        assert extractor.duplicate_pages == [3, 4]
+        assert extractor.reused_pages == []
+        assert text.count("Terms") == 3
+        assert "--- Page 4 ---" in text
+    
+    def test_duplicates_with_page_timeout(self, tmp_path):
+        """Test that only one copy of each page is sent to the page worker."""
+        pdf_path = write_repeated_pdf(tmp_path / "packet.pdf", ["Blank", "Blank", "Cover"])
+        extractor = TextExtractor(page_timeout=30, dedupe_pages=True)
+        
+        text = extractor.extract(pdf_path)
+        
+        assert extractor.duplicate_pages == [2]
+        assert text.count("Blank") == 2
+    
+    def test_disabled_by_default(self, tmp_path):
+        """Test that documents are not fingerprinted unless asked."""
+        pdf_path = write_repeated_pdf(tmp_path / "packet.pdf", ["Same", "Same"])
+        extractor = TableExtractor(method="pdfplumber")
+        
+        extractor.extract(pdf_path)
+        
+        assert extractor.duplicate_pages == []
@@ -0,0 +1,44 @@
+"""Tests for page-indexed text outputs."""
+
+import polars as pl
+import pytest
+
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.page_store import PageReader, offsets_path
+
+
+class TestPageStore:
+    """Test cases for the page table and the .txt offset sidecar."""
+    
+    def test_txt_offsets_sidecar(self, make_pdf, tmp_path):
+        """Test that a page can be read straight out of the .txt output."""
+        pdf_path = make_pdf(pages=3)
+        output_path = tmp_path / "sample.txt"
+        
+        PDFExtractor().extract_and_save_text(pdf_path, output_path)
+        
+        assert offsets_path(output_path).exists()
+        with PageReader(output_path) as reader:
+            assert reader.page_numbers == [1, 2, 3]
+            assert reader.page(2).strip() == "Sample page 2"
+            assert reader.page(9) is None
+    
+    def test_parquet_page_table(self, make_pdf, tmp_path):
+        """Test the Parquet page table layout and page lookups."""
+        pdf_path = make_pdf(pages=3)
+        output_path = tmp_path / "sample.pages.parquet"
+        
+        PDFExtractor().extract_and_save_text(pdf_path, output_path, format="parquet")
+        
+        table = pl.read_parquet(output_path)
+        assert table.columns == ["page", "text", "char_count", "backend", "quality"]
+        assert table["page"].to_list() == [1, 2, 3]
+        
+        reader = PageReader(output_path)
+        assert reader.page(3).strip() == "Sample page 3"
+        assert [p["page"] for p in reader.pages(2, 3)] == [2, 3]
+    
+    def test_unknown_format(self, make_pdf):
+        """Test that an unknown text format is rejected."""
+        with pytest.raises(ValueError):
+            PDFExtractor().extract_and_save_text(make_pdf(), format="docx")
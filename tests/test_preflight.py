@@ -0,0 +1,106 @@
+"""Tests for pre-flight inspection and routed batch extraction."""
+
+import io
+import re
+from pathlib import Path
+
+from pdf_extractor import PDFExtractor
+from pdf_extractor.batch import BatchExtractor, plan_tasks
+from pdf_extractor.preflight import inspect_document
+
+
+def write_mixed_pdf(path: Path) -> Path:
+    """Write a PDF with a ruled text page, a scanned (image-only) page and a blank page."""
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+    
+    scan = io.BytesIO()
+    Image.new("L", (100, 100), 200).save(scan, "PNG")
+    scan.seek(0)
+    
+    pdf = canvas.Canvas(str(path))
+    pdf.drawString(72, 720, "Digital page")
+    pdf.line(72, 700, 300, 700)
+    pdf.showPage()
+    pdf.drawImage(ImageReader(scan), 0, 0, 595, 842)
+    pdf.showPage()
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+def append_revision(path: Path) -> Path:
+    """Append an empty incremental update to a PDF."""
+    data = path.read_bytes()
+    previous = int(re.findall(rb"startxref\s+(\d+)", data)[-1])
+    trailer = re.findall(rb"trailer\s*<<(.*?)>>\s*startxref", data, re.DOTALL)[-1]
+    size = re.search(rb"/Size (\d+)", trailer).group(1)
+    root = re.search(rb"/Root (\d+ \d+ R)", trailer).group(1)
+    update = b"\nxref\n0 0\ntrailer\n<< /Size %s /Root %s /Prev %d >>\nstartxref\n%d\n%%%%EOF\n" % (
+        size, root, previous, len(data) + 1
+    )
+    path.write_bytes(data + update)
+    return path
+
+
+class TestInspect:
+    """Test cases for PDFExtractor.inspect."""
+    
+    def test_page_profiles(self, tmp_path):
+        """Test that text, scanned and blank pages are told apart."""
+        profile = PDFExtractor().inspect(write_mixed_pdf(tmp_path / "mixed.pdf"))
+        
+        assert profile.page_count == 3
+        assert [page.kind for page in profile.pages] == ["text", "image", "empty"]
+        assert profile.kind == "mixed"
+        assert profile.text_pages == [1]
+        assert profile.image_only_pages == [2]
+        assert profile.pages[0].has_rulings
+        assert profile.table_method == "lattice"
+        assert profile.fonts == 1
+        assert not profile.encrypted
+        assert profile.revisions == 1
+        assert 1.0 < profile.estimated_cost < 1.1
+        assert profile.to_dict()["pages"][1]["kind"] == "image"
+    
+    def test_encryption_and_revisions(self, tmp_path, make_pdf):
+        """Test that incremental updates are counted and locked files are reported."""
+        from reportlab.lib.pdfencrypt import StandardEncryption
+        from reportlab.pdfgen import canvas
+        
+        assert inspect_document(append_revision(make_pdf(pages=2))).revisions == 2
+        
+        for name, user_password in (("open.pdf", ""), ("locked.pdf", "secret")):
+            pdf = canvas.Canvas(
+                str(tmp_path / name), encrypt=StandardEncryption(user_password, "owner")
+            )
+            pdf.drawString(72, 720, "Confidential")
+            pdf.save()
+        
+        opened = inspect_document(tmp_path / "open.pdf")
+        locked = inspect_document(tmp_path / "locked.pdf")
+        assert opened.encrypted and opened.readable and opened.text_pages == [1]
+        assert locked.encrypted and not locked.readable and locked.kind == "encrypted"
+    
+    def test_routed_batch(self, tmp_path, make_pdf):
+        """Test that routing skips pages without text and documents without any."""
+        mixed = write_mixed_pdf(tmp_path / "mixed.pdf")
+        digital = make_pdf("digital.pdf", pages=2)
+        profiles = {path: inspect_document(path) for path in (mixed, digital)}
+        
+        tasks = plan_tasks([mixed, digital], policy="fifo", profiles=profiles)
+        assert [(task.pages, task.table_method) for task in tasks] == [
+            ([1], "lattice"),
+            (None, "stream"),
+        ]
+        
+        batch = BatchExtractor(workers=1, route=True)
+        results = batch.run([mixed, digital], tmp_path / "out")
+        
+        assert results[0].skipped_pages == [2, 3]
+        assert results[0].text_path.read_text(encoding="utf-8") == (
+            "--- Page 1 ---\nDigital page\n\n"
+        )
+        assert results[1].skipped_pages == []
+        assert results[1].error is None
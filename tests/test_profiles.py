@@ -0,0 +1,49 @@
+"""Tests for the speed/accuracy profiles."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.object_filter import RULINGS_ONLY, TEXT_ONLY
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.text_extractor import TextExtractor
+from tests.pdf_builders import BORDERLESS_ROWS as ROWS, write_borderless_pdf
+
+
+class TestProfiles:
+    """Test cases for profiles and the backend sequences they configure."""
+
+    def test_profile_wires_extractors(self):
+        """Test that a profile sets backends and skipping, and table_method overrides it."""
+        extractor = PDFExtractor(profile="balanced")
+        assert extractor.text_extractor.method == ("pdfplumber", "pypdf2")
+        assert extractor.text_extractor.skip_objects == frozenset(TEXT_ONLY)
+        assert extractor.table_extractor.method == ("lattice", "stream")
+        assert extractor.table_extractor.skip_objects == frozenset(RULINGS_ONLY)
+
+        extractor = PDFExtractor(profile="fast", table_method="stream")
+        assert extractor.text_extractor.fallback == "empty"
+        assert extractor.table_extractor.method == "stream"
+
+        with pytest.raises(ValueError, match="Unknown profile"):
+            PDFExtractor(profile="fastest")
+
+    def test_text_falls_back_on_empty(self, make_pdf):
+        """Test that "empty" moves on when PyPDF2 finds no text and "error" does not."""
+        pdf_path = make_pdf(pages=2)
+        methods = ("pypdf2", "pdfplumber")
+
+        with patch.object(TextExtractor, "_extract_with_pypdf2", return_value={}):
+            assert "Sample page 2" in TextExtractor(methods, fallback="empty").extract(pdf_path)
+            assert TextExtractor(methods, fallback="error").extract(pdf_path) == ""
+
+    def test_table_sequence_tries_next_method(self, tmp_path):
+        """Test that a borderless table missed by lattice is found by stream."""
+        pdf_path = write_borderless_pdf(tmp_path / "borderless.pdf", [ROWS])
+
+        assert TableExtractor(method="lattice").extract(pdf_path) == []
+        tables = TableExtractor(method=("lattice", "stream")).extract(pdf_path)
+
+        assert len(tables) == 1
+        assert tables[0].columns == ROWS[0]
@@ -0,0 +1,71 @@
+"""Tests for text quality scores and the per-page fallback they drive."""
+
+from unittest.mock import patch
+
+from pdf_extractor import text_extractor
+from pdf_extractor.page_store import PageCollector
+from pdf_extractor.quality import QUALITY_THRESHOLD, score_text
+from pdf_extractor.text_extractor import TextExtractor
+
+GARBAGE = "(cid:36)(cid:71)(cid:3)(cid:80)(cid:76)(cid:81) (cid:86)(cid:68)(cid:80)(cid:83)"
+
+
+def _garbage_on_page_2(page, **kwargs):
+    """Stand-in for ``tiles.page_text`` that returns cid markers for page 2."""
+    return GARBAGE if page.page_number == 2 else page.extract_text()
+
+
+def write_pdf_with_blank_page(path):
+    """Write a PDF whose second page draws nothing."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    pdf.drawString(72, 720, "Sample page 1")
+    pdf.showPage()
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+class TestQuality:
+    """Test cases for score_text and quality-driven fallback in TextExtractor."""
+
+    def test_score_text(self):
+        """Test that real text scores high and cid markers, mojibake and run-on text low."""
+        assert score_text("The Client agrees to pay $1,250.00 within 30 days.") == 1.0
+        assert score_text(GARBAGE) == 0.0
+        assert score_text("") == 0.0
+        assert score_text("Theclientagreestopaytheinvoicedamountwithinthirtydays") == 0.0
+        assert score_text("RÃ©sumÃ© of the dÃ©fendant's rÃ´le") < QUALITY_THRESHOLD
+
+    def test_low_scoring_page_falls_back(self, make_pdf):
+        """Test that only the low-scoring page is re-extracted and its score is recorded."""
+        pdf_path = make_pdf(pages=3)
+        collector = PageCollector()
+        extractor = TextExtractor(page_sinks=[collector])
+        pypdf2 = TextExtractor._extract_with_pypdf2
+
+        with patch.object(text_extractor, "page_text", _garbage_on_page_2), patch.object(
+            TextExtractor, "_extract_with_pypdf2", autospec=True, side_effect=pypdf2
+        ) as spy:
+            text = extractor.extract(pdf_path)
+
+        assert spy.call_args.args[2] == [2]
+        assert "(cid:" not in text and "Sample page 2" in text
+        assert extractor.fallback_pages == [2]
+        assert extractor.low_quality_pages == []
+        pages = collector.to_frame()
+        assert pages["backend"].to_list() == ["pdfplumber", "pypdf2", "pdfplumber"]
+        assert pages["quality"].to_list() == [1.0, 1.0, 1.0]
+
+    def test_scores_without_fallback(self, tmp_path):
+        """Test that garbage is flagged, not replaced, without a threshold; blank pages are not."""
+        pdf_path = write_pdf_with_blank_page(tmp_path / "blank.pdf")
+        extractor = TextExtractor(method="pdfplumber", quality_threshold=None)
+
+        with patch.object(text_extractor, "page_text", return_value=""):
+            extractor.extract(pdf_path)
+
+        assert extractor.page_scores == {1: 0.0, 2: None}
+        assert extractor.low_quality_pages == [1]
+        assert extractor.fallback_pages == []
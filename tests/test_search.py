@@ -0,0 +1,72 @@
+"""Tests for the full-text search index sink."""
+
+import os
+import sqlite3
+
+from pdf_extractor import PDFExtractor
+from pdf_extractor.batch import BatchExtractor
+from pdf_extractor.search import SearchIndex
+
+
+def _page_ids(index_path):
+    """Return the row ids of all indexed pages."""
+    conn = sqlite3.connect(index_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT id FROM pages ORDER BY id")]
+    finally:
+        conn.close()
+
+
+class TestSearchIndex:
+    """Test cases for SearchIndex."""
+    
+    def test_pages_indexed_during_extraction(self, make_pdf, tmp_path):
+        """Test that extraction writes one row per page with page-level hits."""
+        index_path = tmp_path / "index.db"
+        pdf_path = make_pdf(pages=3)
+        
+        PDFExtractor(search_index=index_path).extract_text(pdf_path)
+        hits = SearchIndex(index_path).search('"page 2"')
+        
+        assert hits["page"].to_list() == [2]
+        assert hits["document"][0] == str(pdf_path.resolve())
+    
+    def test_rerun_replaces_changed_document(self, make_pdf, tmp_path):
+        """Test that a changed document's pages are replaced, not duplicated."""
+        index_path = tmp_path / "index.db"
+        pdf_path = make_pdf(pages=3)
+        extractor = PDFExtractor(search_index=index_path)
+        extractor.extract_text(pdf_path)
+        
+        make_pdf(pages=1)
+        os.utime(pdf_path, ns=(1, 1))
+        extractor.extract_text(pdf_path)
+        
+        index = SearchIndex(index_path)
+        assert index.search("sample")["page"].to_list() == [1]
+        assert index.is_current(pdf_path)
+    
+    def test_unchanged_document_is_skipped(self, make_pdf, tmp_path):
+        """Test that reruns do not rewrite unchanged documents."""
+        index_path = tmp_path / "index.db"
+        pdf_path = make_pdf()
+        extractor = PDFExtractor(search_index=index_path)
+        
+        extractor.extract_text(pdf_path)
+        first_ids = _page_ids(index_path)
+        extractor.extract_text(pdf_path)
+        
+        assert _page_ids(index_path) == first_ids
+    
+    def test_split_batch_document(self, make_pdf, tmp_path):
+        """Test that page-range tasks together index the whole document."""
+        index_path = tmp_path / "index.db"
+        pdf_path = make_pdf(pages=5)
+        
+        BatchExtractor(
+            workers=2, split_pages=2, extract_tables=False, search_index=index_path
+        ).run([pdf_path], tmp_path / "out")
+        
+        index = SearchIndex(index_path)
+        assert sorted(index.search("sample", limit=10)["page"].to_list()) == [1, 2, 3, 4, 5]
+        assert index.is_current(pdf_path)
@@ -0,0 +1,151 @@
+"""Tests for the local HTTP extraction server."""
+
+import http.client
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from pdf_extractor.server import ARROW_STREAM, ExtractionServer
+
+SAMPLE_PDF = Path(__file__).parent.parent / "examples" / "legal_document_sample.pdf"
+
+
+@pytest.fixture
+def server():
+    """Fixture running a one-worker server on a free port."""
+    server = ExtractionServer(port=0, workers=1, max_queue=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+def _request(server, path, data=None, headers=None):
+    """Send a request and return (status, headers, body)."""
+    host, port = server.address
+    request = urllib.request.Request(
+        f"http://{host}:{port}{path}", data=data, headers=headers or {}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+class TestExtractionServer:
+    """Test cases for ExtractionServer."""
+    
+    def test_health(self, server):
+        """Test the health endpoint."""
+        status, _, body = _request(server, "/health")
+        
+        assert status == 200
+        assert json.loads(body) == {"status": "ok", "workers": 1}
+    
+    def test_extract_text_from_body(self, server, make_pdf):
+        """Test extracting text from a PDF sent as the request body."""
+        pdf_bytes = make_pdf().read_bytes()
+        
+        status, _, body = _request(
+            server, "/extract/text", pdf_bytes, {"Content-Type": "application/pdf"}
+        )
+        
+        assert status == 200
+        assert "Sample page 2" in json.loads(body)["text"]
+    
+    def test_extract_text_from_path(self, server, make_pdf):
+        """Test extracting text from a local path."""
+        payload = json.dumps({"path": str(make_pdf())}).encode()
+        
+        status, _, body = _request(
+            server, "/extract/all", payload, {"Content-Type": "application/json"}
+        )
+        
+        assert status == 200
+        assert json.loads(body)["tables"] == []
+    
+    def test_tables_as_arrow(self, server):
+        """Test streaming tables back as Arrow IPC."""
+        pdf_bytes = SAMPLE_PDF.read_bytes()
+        
+        status, headers, body = _request(
+            server, "/extract/tables", pdf_bytes,
+            {"Content-Type": "application/pdf", "Accept": ARROW_STREAM},
+        )
+        
+        assert status == 200
+        assert headers["Content-Type"] == ARROW_STREAM
+        first = pl.read_ipc_stream(io.BytesIO(body))
+        assert "Service Type" in first.columns
+    
+    def test_backpressure_returns_429(self, server, make_pdf):
+        """Test that requests beyond the queue limit are rejected."""
+        for _ in range(server.workers + server.max_queue):
+            server.slots.acquire()
+        try:
+            status, headers, _ = _request(
+                server, "/extract/text", make_pdf().read_bytes(),
+                {"Content-Type": "application/pdf"},
+            )
+        finally:
+            for _ in range(server.workers + server.max_queue):
+                server.slots.release()
+        
+        assert status == 429
+        assert headers["Retry-After"] == "1"
+        
+        _, _, body = _request(server, "/metrics")
+        assert json.loads(body)["rejected_total"] == 1
+    
+    def test_bad_requests_are_client_errors(self, server, make_pdf, tmp_path):
+        """Test that bad bodies and unreadable PDFs get 4xx and are not counted as errors."""
+        json_headers = {"Content-Type": "application/json"}
+        pdf_headers = {"Content-Type": "application/pdf"}
+        not_pdf = tmp_path / "notes.pdf"
+        not_pdf.write_text("plain text")
+        truncated = make_pdf().read_bytes()[:600]
+        
+        requests = [
+            (b'["/data/input.pdf"]', json_headers, 400),
+            (b"{not json", json_headers, 400),
+            (json.dumps({"path": str(not_pdf)}).encode(), json_headers, 400),
+            (b"garbage", pdf_headers, 400),
+            (truncated, pdf_headers, 422),
+        ]
+        for data, headers, expected in requests:
+            status, _, body = _request(server, "/extract/text", data, headers)
+            assert status == expected, body
+            assert "error" in json.loads(body)
+        
+        _, _, body = _request(server, "/metrics")
+        assert json.loads(body)["errors_total"] == 0
+    
+    def test_body_checked_before_it_is_read(self, server, make_pdf):
+        """Test that bad or oversized Content-Length gets 400/413 without reading the body."""
+        host, port = server.address
+        connection = http.client.HTTPConnection(host, port, timeout=60)
+        connection.putrequest("POST", "/extract/text")
+        connection.putheader("Content-Length", "many")
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "Content-Length" in json.loads(response.read())["error"]
+        connection.close()
+        
+        server.max_body_bytes = 100
+        status, headers, body = _request(
+            server, "/extract/text", make_pdf().read_bytes(), {"Content-Type": "application/pdf"}
+        )
+        assert status == 413
+        assert headers["Connection"] == "close"
+        
+        _, _, body = _request(server, "/metrics")
+        metrics = json.loads(body)
+        assert (metrics["requests_total"], metrics["errors_total"]) == (0, 0)
@@ -0,0 +1,45 @@
+"""Tests for the whitespace stream table backend."""
+
+import pdfplumber
+import polars as pl
+
+from pdf_extractor import stream
+from pdf_extractor.table_extractor import TableExtractor
+from tests.pdf_builders import BORDERLESS_ROWS as ROWS, write_borderless_pdf
+
+
+class TestStream:
+    """Test cases for the stream detector."""
+
+    def test_find_tables_skips_paragraphs(self, tmp_path):
+        """Test that columns come from whitespace and paragraph lines are ignored."""
+        pdf_path = write_borderless_pdf(tmp_path / "borderless.pdf", [ROWS])
+
+        with pdfplumber.open(pdf_path) as pdf:
+            tables = stream.find_tables(pdf.pages[0])
+
+        assert len(tables) == 1
+        bbox, rows = tables[0]
+        assert rows == ROWS
+        assert bbox[0] == 72
+
+    def test_tables_split_by_text(self, tmp_path):
+        """Test that text between two tables separates them."""
+        second = [["Week", "Hours"], ["1", "42.5"], ["2", "38.0"]]
+        pdf_path = write_borderless_pdf(tmp_path / "borderless.pdf", [ROWS, second])
+
+        with pdfplumber.open(pdf_path) as pdf:
+            tables = [rows for _, rows in stream.find_tables(pdf.pages[0])]
+
+        assert tables == [ROWS, second]
+
+    def test_table_extractor_stream_method(self, tmp_path):
+        """Test that the stream method returns Polars frames named by the header row."""
+        pdf_path = write_borderless_pdf(tmp_path / "borderless.pdf", [ROWS])
+
+        tables = TableExtractor(method="stream").extract(pdf_path)
+
+        assert len(tables) == 1
+        assert tables[0].columns == ROWS[0]
+        assert tables[0].schema["Amount"] == pl.Utf8
+        assert tables[0]["Client"].to_list() == [row[1] for row in ROWS[1:]]
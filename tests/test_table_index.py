@@ -0,0 +1,140 @@
+"""Tests for the table location index and single-table re-extraction."""
+
+import subprocess
+from unittest.mock import patch
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from pdf_extractor import catalog, table_extractor
+from pdf_extractor.extractor import PDFExtractor
+from pdf_extractor.page_cache import PageCache
+from pdf_extractor.table_extractor import TableExtractor
+from pdf_extractor.table_index import TableLocation, load_location, read_table_index
+
+FIRST = [["Item", "Qty"], ["Widget", "2"], ["Gadget", "1"]]
+SECOND = [["Code", "Rate"], ["A1", "0.5"], ["B2", "0.7"]]
+THIRD = [["Name", "City", "Zip"], ["Ann", "Oslo", "0150"]]
+
+
+def _draw_table(pdf, rows, left, top, col_width=100, row_height=20):
+    """Draw a fully ruled table with its top-left corner at (left, top)."""
+    right = left + len(rows[0]) * col_width
+    bottom = top - len(rows) * row_height
+    for i in range(len(rows) + 1):
+        pdf.line(left, top - i * row_height, right, top - i * row_height)
+    for j in range(len(rows[0]) + 1):
+        pdf.line(left + j * col_width, top, left + j * col_width, bottom)
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row):
+            pdf.drawString(left + j * col_width + 4, top - (i + 1) * row_height + 6, text)
+
+
+def write_tables_pdf(path):
+    """Write one ruled table on page 1 and two on page 2."""
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    _draw_table(pdf, FIRST, 72, 720)
+    pdf.showPage()
+    _draw_table(pdf, SECOND, 72, 720)
+    _draw_table(pdf, THIRD, 72, 400)
+    pdf.showPage()
+    pdf.save()
+    return path
+
+
+class TestTableIndex:
+    """Test cases for table locations, the index file and extract_table."""
+
+    def test_index_written_with_tables(self, tmp_path):
+        """Test that each saved table has an index row with its page, bbox and schema."""
+        pdf_path = write_tables_pdf(tmp_path / "rates.pdf")
+        output_dir = tmp_path / "out"
+
+        tables = PDFExtractor(table_method="lattice").extract_and_save_tables(pdf_path, output_dir)
+        index = read_table_index(output_dir / "rates_tables.index.parquet")
+
+        assert len(tables) == index.height == 3
+        assert index["file"].to_list() == [f"rates_table_{i}.parquet" for i in range(3)]
+        assert index["page"].to_list() == [1, 2, 2]
+        assert index["backend"].unique().to_list() == ["lattice"]
+        assert index["document"][0] == str(pdf_path.resolve())
+        # Page 2's second table sits below its first (top grows downwards)
+        assert index["top"][2] > index["bottom"][1]
+
+        schemas = catalog.open(output_dir).table_index().collect().sort("table")
+        assert index["schema_hash"].to_list() == schemas["schema"].to_list()
+
+    def test_reextract_replaces_one_table(self, tmp_path):
+        """Test that one table is re-extracted from its area and the others are left alone."""
+        pdf_path = write_tables_pdf(tmp_path / "rates.pdf")
+        output_dir = tmp_path / "out"
+        PDFExtractor(table_method="pdfplumber").extract_and_save_tables(pdf_path, output_dir)
+        index_path = output_dir / "rates_tables.index.parquet"
+        before = read_table_index(index_path)
+        untouched = (output_dir / "rates_table_1.parquet").read_bytes()
+
+        extractor = PDFExtractor(table_method="stream")
+        table = extractor.reextract_table(index_path, 2)
+
+        assert table.columns == THIRD[0] and table.rows() == [tuple(THIRD[1])]
+        assert pl.read_parquet(output_dir / "rates_table_2.parquet").equals(table)
+        assert (output_dir / "rates_table_1.parquet").read_bytes() == untouched
+        location, _ = load_location(index_path, 2)
+        assert location.backend == "stream" and location.page == 2
+        after = read_table_index(index_path)
+        assert after.filter(pl.col("table") != 2).equals(before.filter(pl.col("table") != 2))
+
+        result = subprocess.run(
+            ["python", "-m", "pdf_extractor.cli", "reextract-table", str(index_path), "2"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout
+        # "auto" reuses the backend recorded by the previous re-extraction
+        assert "Table 2 (page 2, stream): 1 rows, 3 columns" in result.stdout
+
+    def test_locations_survive_page_cache_and_tabula_tables_are_located(self, tmp_path):
+        """Test that cached pages keep their locations and tabula tables get page and bbox."""
+        pdf_path = write_tables_pdf(tmp_path / "rates.pdf")
+        cache = PageCache(tmp_path / "pages.db")
+
+        first = TableExtractor(method="pdfplumber", page_cache=cache)
+        first.extract(pdf_path)
+        second = TableExtractor(method="pdfplumber", page_cache=cache)
+        second.extract(pdf_path)
+
+        assert second.reused_pages == [1, 2]
+        assert second.table_locations == first.table_locations
+        assert [location.page for location in first.table_locations] == [1, 2, 2]
+
+        # tabula-java's JSON gives top/left/width/height; there is no JVM here
+        areas = {1: [], 2: [{"top": 400.0, "left": 72.0, "width": 300.0, "height": 40.0}]}
+
+        def read_pdf(path, pages=None, output_format=None, area=None, **kwargs):
+            if output_format == "json":
+                located.append(pages)
+                return [{**table, "data": [[{"text": "Name"}]]} for table in areas[pages]]
+            calls.append((pages, area))
+            return [pd.DataFrame({"Name": ["Ann"], "City": ["Oslo"]})]
+
+        calls, located = [], []
+        with patch.object(table_extractor, "tabula") as tabula:
+            tabula.read_pdf.side_effect = read_pdf
+            extractor = TableExtractor(method="auto")
+            extractor.extract(pdf_path)
+            # Pages are read again only once the locations are asked for
+            assert located == []
+            location = extractor.table_locations[0]
+            assert located == [1, 2]
+            assert (location.backend, location.page) == ("tabula", 2)
+            assert location.bbox == (72.0, 400.0, 372.0, 440.0)
+
+            assert extractor.extract_table(location).rows() == [("Ann", "Oslo")]
+            assert calls[-1] == (2, [398.0, 70.0, 442.0, 374.0])
+
+        unlocated = TableLocation(str(pdf_path), None, None, "tabula")
+        with pytest.raises(ValueError, match="no page or bbox"):
+            TableExtractor(method="lattice").extract_table(unlocated)
@@ -0,0 +1,93 @@
+"""Tests for template-driven region extraction."""
+
+import datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from pdf_extractor import PDFExtractor
+from pdf_extractor import templates as templates_module
+from pdf_extractor.templates import Template, TemplateField, load_templates
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+SAMPLE_PDF = EXAMPLES / "legal_document_sample.pdf"
+TEMPLATES = EXAMPLES / "templates"
+
+
+class TestTemplates:
+    """Test cases for templates and PDFExtractor.extract_record."""
+
+    def test_extract_record(self):
+        """Test that a matched template yields typed fields and its tables."""
+        record = PDFExtractor(templates=TEMPLATES).extract_record(SAMPLE_PDF)
+
+        assert record is not None
+        assert record.template.name == "legal_services_agreement"
+        assert record.fields == {
+            "firm": "SMITH & ASSOCIATES LAW FIRM",
+            "agreement_date": datetime.date(2024, 3, 15),
+            "march_revenue": 140000.0,
+        }
+        assert record.tables["active_cases"].shape == (6, 6)
+        assert record.tables["monthly_billing"]["Week"].to_list()[-1] == "TOTAL"
+
+        frame = record.to_frame()
+        assert frame.schema["agreement_date"] == pl.Date
+        assert frame.schema["march_revenue"] == pl.Float64
+
+    def test_no_matching_template(self, make_pdf):
+        """Test that documents matching no template return None."""
+        extractor = PDFExtractor(templates=TEMPLATES)
+
+        assert extractor.extract_record(make_pdf(pages=2)) is None
+
+    def test_yaml_templates_and_validation(self, tmp_path):
+        """Test YAML loading, template order and spec errors."""
+        pytest.importorskip("yaml")
+        (tmp_path / "a.yaml").write_text(
+            "name: firm_header\n"
+            "match:\n"
+            "  anchors: [SMITH & ASSOCIATES]\n"
+            "fields:\n"
+            "  firm: {page: 1, bbox: [150, 78, 460, 104]}\n"
+        )
+        (tmp_path / "b.json").write_text((TEMPLATES / "legal_services_agreement.json").read_text())
+
+        templates = load_templates(tmp_path)
+        assert [t.name for t in templates] == ["firm_header", "legal_services_agreement"]
+
+        record = PDFExtractor(templates=templates).extract_record(SAMPLE_PDF)
+        assert record.template.name == "firm_header"
+        assert record.fields == {"firm": "SMITH & ASSOCIATES LAW FIRM"}
+
+        with pytest.raises(ValueError):
+            Template.from_dict({"name": "bad", "fields": {"x": {"bbox": [10, 10, 5, 20]}}})
+        with pytest.raises(ValueError):
+            Template.from_dict({"name": "bad", "match": {"colour": "red"}, "fields": {}})
+
+    def test_int_fields_and_pdfplumber_without_object_cache(self, monkeypatch):
+        """Test integer parsing and region extraction when the object cache is not read."""
+        field = TemplateField(name="amount", page=1, bbox=(0, 0, 1, 1), type="int")
+        assert field.convert("$1,234") == 1234
+        assert field.convert("1,234.00") == 1234
+        assert field.convert("1,234.50") is None
+
+        expected = PDFExtractor(templates=TEMPLATES).extract_record(SAMPLE_PDF).fields
+        loaded = []
+        load = templates_module._load_region_objects
+        monkeypatch.setattr(
+            templates_module,
+            "_load_region_objects",
+            lambda page, boxes: loaded.append(load(page, boxes)),
+        )
+        # A pdfplumber that never reads Page._objects back
+        monkeypatch.setattr(
+            templates_module.pdfplumber.page.Page,
+            "objects",
+            property(lambda page: page.parse_objects()),
+        )
+
+        record = PDFExtractor(templates=TEMPLATES).extract_record(SAMPLE_PDF)
+        assert loaded and not any(loaded)
+        assert record.fields == expected
@@ -0,0 +1,92 @@
+"""Tests for tiled text extraction of giant pages."""
+
+from unittest.mock import patch
+
+import pdfplumber
+
+from pdf_extractor import tiles
+from pdf_extractor.text_extractor import TextExtractor
+from pdf_extractor.tiles import estimate_glyphs, page_columns, tile_bounds, tiled_text
+
+
+def write_dense_pdf(path, lines, rotated=False, pages=1):
+    """Write tall pages of two-column text with uneven line spacing."""
+    from reportlab.pdfgen import canvas
+
+    height = 40 + lines * 9
+    pdf = canvas.Canvas(str(path), pagesize=(600, height))
+    for _ in range(pages):
+        pdf.setFont("Helvetica", 6)
+        for i in range(lines):
+            y = height - 20 - i * 9 - (i % 7 == 0) * 2
+            pdf.drawString(20, y, f"Row {i} left column value {i * 37 % 1000} units")
+            pdf.drawString(320, y, f"right {i % 13} total {i * 11}")
+        if rotated:
+            pdf.saveState()
+            pdf.translate(580, 40)
+            pdf.rotate(90)
+            pdf.drawString(0, 0, "Sheet 1 of 1")
+            pdf.restoreState()
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+class TestTiles:
+    """Test cases for tiles and the tile options of TextExtractor."""
+
+    def test_tiled_text_matches_whole_page(self, tmp_path):
+        """Test that a page split into many tiles gives pdfplumber's text exactly."""
+        pdf_path = write_dense_pdf(tmp_path / "dense.pdf", 300)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            columns = page_columns(pdf.pages[0])
+            assert len(tile_bounds(columns[2], tile_glyphs=500)) > 10
+            expected = pdf.pages[0].extract_text()
+
+        tiled = TextExtractor(method="pdfplumber", tile_threshold=1000, tile_glyphs=500)
+        whole = TextExtractor(method="pdfplumber", tile_threshold=None)
+        assert tiled.extract(pdf_path) == whole.extract(pdf_path)
+        assert expected in tiled.extract(pdf_path)
+
+    def test_estimate_and_rotated_fallback(self, tmp_path):
+        """Test the glyph estimate and that rotated text is laid out as one tile."""
+        pdf_path = write_dense_pdf(tmp_path / "rotated.pdf", 40, rotated=True)
+
+        with pdfplumber.open(pdf_path) as pdf:
+            page = pdf.pages[0]
+            chars = len(page.chars)
+            assert abs(estimate_glyphs(page) - chars) <= chars * 0.05
+            assert tiled_text(page, tile_glyphs=50) == page.extract_text()
+
+    def test_work_per_tile_is_bounded_and_pool_is_shared(self, tmp_path):
+        """Test that four times the glyphs give four times the tiles and one pool per document."""
+        small = write_dense_pdf(tmp_path / "small.pdf", 100)
+        large = write_dense_pdf(tmp_path / "large.pdf", 400)
+        tile_text = tiles._tile_text
+
+        def tile_sizes(pdf_path):
+            """Characters laid out in each tile of the document's page."""
+            with patch.object(tiles, "_tile_text", side_effect=tile_text) as spy:
+                with pdfplumber.open(pdf_path) as pdf:
+                    tiled_text(pdf.pages[0], tile_glyphs=1000)
+                    chars = len(pdf.pages[0].chars)
+            sizes = [len(call.args[0][0]) for call in spy.call_args_list]
+            assert sum(sizes) == chars
+            return sizes
+
+        small_sizes, large_sizes = tile_sizes(small), tile_sizes(large)
+        assert 3.5 <= len(large_sizes) / len(small_sizes) <= 4.5
+        # A tile ends at the first line gap after tile_glyphs characters
+        assert max(small_sizes + large_sizes) < 1000 + 2 * 60
+
+        # Worker processes are started once for all the tiled pages of a document
+        pdf_path = write_dense_pdf(tmp_path / "pages.pdf", 100, pages=3)
+        executor = tiles.ProcessPoolExecutor
+        with patch.object(tiles, "ProcessPoolExecutor", side_effect=executor) as executors:
+            extractor = TextExtractor(
+                method="pdfplumber", tile_threshold=1000, tile_glyphs=1000, tile_workers=2
+            )
+            text = extractor.extract(pdf_path)
+        assert executors.call_count == 1
+        assert text == TextExtractor(method="pdfplumber", tile_threshold=None).extract(pdf_path)